@@ -1,9 +1,13 @@
+import os
 from flask import Flask
 from flask_restful import Api
 from src.services.auth_service import AuthService
 from src.controllers.auth_controller import  auth_bp,set_auth_service
 from src.controllers.users_controller import users_bp,set_users_service
 from src.services.users_service import UsersService
+from src.services.password_service import (
+    BCRYPT_ROUNDS, PASSWORD_HASH_MAX_PENDING, PASSWORD_HASH_WORKERS, PasswordService
+)
 from src.repositories.users_repository import UsersRepository
 from src.controllers.favorites_controller import favorites_bp, set_favorites_service
 from src.services.favorites_service import FavoritesService
@@ -13,6 +17,17 @@ from src.controllers.categories_controller import categories_bp, set_categories_
 from src.services.categories_service import CategoriesService
 from src.repositories.category_repository import CategoriesRepository
 from src.repositories.session import DatabaseConnection
+from src.repositories.bloom_filter import BLOOM_FILTER_FP_RATE
+from src.enums.durability import Durability
+from src.enums.storage_backend import StorageBackend
+from src.enums.snapshot_format import SnapshotFormat
+from src.repositories.sqlite_session import SQLITE_POOL_SIZE, SQLiteDatabaseConnection
+from src.repositories.sqlite_product_repository import SQLiteProductsRepository
+from src.repositories.sqlite_category_repository import SQLiteCategoriesRepository
+from src.repositories.sqlite_favorites_repository import SQLiteFavoritesRepository
+from src.repositories.sqlite_users_repository import SQLiteUsersRepository
+from src.repositories.sqlite_refresh_tokens_repository import SQLiteRefreshTokensRepository
+from src.repositories.refresh_tokens_repository import RefreshTokensRepository
 from src.controllers.products_controller import products_bp, set_products_service
 from src.services.products_service import ProductsService
 from src.repositories.product_repository import ProductsRepository
@@ -22,24 +37,60 @@ api = Api(app)
 
 def configure_dependencies():
     """Initialize and inject dependencies."""
-    db_connection = DatabaseConnection('db.json')
-    db_connection.connect()
-    
-    products_repository = ProductsRepository(db_connection)
-    category_repository = CategoriesRepository(db_connection)
-    favorites_repository = FavoritesRepository(db_connection)
-    user_repository = UsersRepository(db_connection)
+    # Forks the hashing workers first, while this process has no other threads
+    password_service = PasswordService(
+        workers=int(os.getenv("PASSWORD_HASH_WORKERS", PASSWORD_HASH_WORKERS)),
+        max_pending=int(os.getenv("PASSWORD_HASH_MAX_PENDING", PASSWORD_HASH_MAX_PENDING)),
+        rounds=int(os.getenv("BCRYPT_ROUNDS", BCRYPT_ROUNDS))
+    )
+    password_service.start()
+
+    backend = StorageBackend(os.getenv("DB_BACKEND", StorageBackend.JSON.value))
+    email_filter_fp_rate = float(os.getenv("USERS_EMAIL_FILTER_FP_RATE", BLOOM_FILTER_FP_RATE))
+
+    if backend == StorageBackend.SQLITE:
+        db_connection = SQLiteDatabaseConnection(
+            os.getenv("DB_SQLITE_PATH", 'db.sqlite3'),
+            seed_json_file_path='db.json',
+            pool_size=int(os.getenv("DB_SQLITE_POOL_SIZE", SQLITE_POOL_SIZE))
+        )
+        db_connection.connect()
+        # Each request gives its thread's connection back to the pool
+        app.teardown_appcontext(lambda exception: db_connection.release())
+
+        products_repository = SQLiteProductsRepository(db_connection)
+        category_repository = SQLiteCategoriesRepository(db_connection)
+        favorites_repository = SQLiteFavoritesRepository(db_connection)
+        user_repository = SQLiteUsersRepository(db_connection, email_filter_fp_rate=email_filter_fp_rate)
+        refresh_tokens_repository = SQLiteRefreshTokensRepository(db_connection)
+    else:
+        db_connection = DatabaseConnection(
+            'db.json',
+            durability=Durability(os.getenv("DB_DURABILITY", Durability.GROUP_COMMIT.value)),
+            commit_window_ms=float(os.getenv("DB_COMMIT_WINDOW_MS", 5)),
+            commit_max_records=int(os.getenv("DB_COMMIT_MAX_RECORDS", 100)),
+            snapshot_format=SnapshotFormat(os.getenv("DB_SNAPSHOT_FORMAT", SnapshotFormat.JSON.value)),
+            compress_snapshots=os.getenv("DB_COMPRESS_SNAPSHOTS", "false").lower() == "true",
+            multi_process=os.getenv("DB_MULTI_PROCESS", "false").lower() == "true"
+        )
+        db_connection.connect()
+
+        products_repository = ProductsRepository(db_connection)
+        category_repository = CategoriesRepository(db_connection)
+        favorites_repository = FavoritesRepository(db_connection)
+        user_repository = UsersRepository(db_connection, email_filter_fp_rate=email_filter_fp_rate)
+        refresh_tokens_repository = RefreshTokensRepository(db_connection)
     
-    products_service = ProductsService(products_repository)
+    products_service = ProductsService(products_repository, category_repository)
     category_service = CategoriesService(category_repository)
     favorites_service = FavoritesService(favorites_repository)
-    user_service = UsersService(user_repository)
-    auth_service = AuthService(user_repository)
+    user_service = UsersService(user_repository, password_service)
+    auth_service = AuthService(user_repository, password_service, refresh_tokens_repository)
     
     set_products_service(products_service)
     set_categories_service(category_service)
     set_favorites_service(favorites_service)
-    set_users_service(user_service)
+    set_users_service(user_service, auth_service)
     set_auth_service(auth_service)
 
 configure_dependencies()
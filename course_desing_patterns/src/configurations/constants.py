@@ -1,4 +1,7 @@
 CATEGORIES = "categories"
 PRODUCTS = "products"
 FAVORITES = "favorites"
-USERS = "users"
\ No newline at end of file
+USERS = "users"
+REFRESH_TOKENS = "refresh_tokens"
+
+COLLECTIONS = [CATEGORIES, PRODUCTS, FAVORITES, USERS, REFRESH_TOKENS]
\ No newline at end of file
@@ -3,6 +3,7 @@ from werkzeug.exceptions import HTTPException
 
 from src.dtos.request.register_request import RegisterRequestDTO
 from src.dtos.request.login_request import LoginRequestDTO
+from src.dtos.request.refresh_request import RefreshRequestDTO
 from src.interfaces.services.auth_service_interface import IAuthService
 
 
@@ -62,4 +63,50 @@ def login():
         return jsonify({"error": e.description}), e.code
     except Exception as e:
         print(f"Error: {e}")
-        return jsonify({"error": "Internal server error"}), 500
\ No newline at end of file
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@auth_bp.post("/refresh")
+def refresh():
+    """
+    Exchange a refresh token for a new access token and refresh token.
+
+    Request Body:
+        refresh_token: Refresh token issued at login or by the last refresh
+
+    Returns:
+        JSON response with tokens and user data and HTTP status code 200
+    """
+    try:
+        payload = request.get_json()
+        dto = RefreshRequestDTO(**payload)
+        result = auth_service.refresh(dto)
+        return jsonify(result), 200
+    except HTTPException as e:
+        return jsonify({"error": e.description}), e.code
+    except Exception as e:
+        print(f"Error: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@auth_bp.post("/logout")
+def logout():
+    """
+    Revoke a refresh token.
+
+    Request Body:
+        refresh_token: Refresh token to revoke
+
+    Returns:
+        204 No Content if revoked successfully
+    """
+    try:
+        payload = request.get_json()
+        dto = RefreshRequestDTO(**payload)
+        auth_service.logout(dto)
+        return '', 204
+    except HTTPException as e:
+        return jsonify({"error": e.description}), e.code
+    except Exception as e:
+        print(f"Error: {e}")
+        return jsonify({"error": "Internal server error"}), 500
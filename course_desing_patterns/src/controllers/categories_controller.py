@@ -1,13 +1,16 @@
 from flask import Blueprint, request, jsonify
 from werkzeug.exceptions import HTTPException
 
+from src.configurations.constants import CATEGORIES
 from src.dtos.request.category_request import categoryRequestDTO
 from src.interfaces.services.categories_service_interface import IcategoriesService
+from src.utils.http_cache import ResponseCache, collection_etag, not_modified, with_etag
 
 
 
 categories_bp = Blueprint("categorys", __name__)
 categories_service: IcategoriesService = None
+categories_response_cache = ResponseCache()
 
 
 def set_categories_service(service: IcategoriesService):
@@ -21,12 +24,20 @@ def get_categorys():
     """
     Retrieve all categories, optionally filtered by category.
 
+    Answers 304 Not Modified if If-None-Match holds the current ETag.
+
     Returns:
         JSON response with categories list and HTTP status code
     """
     try:
-        all_categories = categories_service.get_all()
-        return jsonify(all_categories), 200
+        version = categories_service.get_version()
+        etag = collection_etag(CATEGORIES, version)
+        cached_response = not_modified(etag)
+        if cached_response is not None:
+            return cached_response
+
+        response = categories_response_cache.json_response(None, version, categories_service.get_all)
+        return with_etag(response, etag), 200
     
     except HTTPException as e:
         return jsonify({"error": e.description}), e.code
@@ -39,6 +50,8 @@ def get_category_by_id(category_id):
     """
     Retrieve a single category by its ID.
 
+    Answers 304 Not Modified if If-None-Match holds the current ETag.
+
     Args:
         category_id: The category identifier
 
@@ -46,8 +59,13 @@ def get_category_by_id(category_id):
         JSON response with category data and HTTP status code
     """
     try:
+        etag = collection_etag(CATEGORIES, categories_service.get_version())
+        cached_response = not_modified(etag)
+        if cached_response is not None:
+            return cached_response
+
         category = categories_service.get_one_by_id(category_id=category_id)
-        return jsonify(category), 200
+        return with_etag(jsonify(category), etag), 200
     
     except HTTPException as e:
         return jsonify({"error": e.description}), e.code
@@ -1,11 +1,14 @@
 from flask import Blueprint, request, jsonify
 from werkzeug.exceptions import HTTPException
 
+from src.configurations.constants import FAVORITES
 from src.dtos.request.favorite_request import FavoriteRequestDTO
 from src.interfaces.services.favorites_service_interface import IFavoritesService
+from src.utils.http_cache import ResponseCache, collection_etag, not_modified, with_etag
 
 favorites_bp = Blueprint("favorites", __name__)
 favorites_service: IFavoritesService = None
+favorites_response_cache = ResponseCache()
 
 def set_favorites_service(service: IFavoritesService):
     global favorites_service
@@ -14,8 +17,30 @@ def set_favorites_service(service: IFavoritesService):
 @favorites_bp.get("/")
 def get_favorites():
     try:
-        favorites = favorites_service.get_all()
-        return jsonify(favorites), 200
+        version = favorites_service.get_version()
+        etag = collection_etag(FAVORITES, version)
+        cached_response = not_modified(etag)
+        if cached_response is not None:
+            return cached_response
+
+        response = favorites_response_cache.json_response(None, version, favorites_service.get_all)
+        return with_etag(response, etag), 200
+    except HTTPException as e:
+        return jsonify({"error": e.description}), e.code
+    except Exception as e:
+        print(e)
+        return jsonify({"error": "Internal server error"}), 500
+
+@favorites_bp.get("/users/<int:user_id>")
+def get_user_favorites(user_id: int):
+    try:
+        etag = collection_etag(FAVORITES, favorites_service.get_version())
+        cached_response = not_modified(etag)
+        if cached_response is not None:
+            return cached_response
+
+        favorites = favorites_service.get_by_user(user_id)
+        return with_etag(jsonify(favorites), etag), 200
     except HTTPException as e:
         return jsonify({"error": e.description}), e.code
     except Exception as e:
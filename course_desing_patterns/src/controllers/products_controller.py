@@ -1,12 +1,15 @@
 from flask import Blueprint, request, jsonify
-from werkzeug.exceptions import HTTPException
+from werkzeug.exceptions import BadRequest, HTTPException
 
+from src.configurations.constants import PRODUCTS
 from src.dtos.request.create_product_request import ProductCreateDTO
 from src.interfaces.services.products_service_interface import IProductsService
+from src.utils.http_cache import ResponseCache, collection_etag, not_modified, with_etag
 
 
 products_bp = Blueprint("products", __name__)
 products_service: IProductsService = None
+products_response_cache = ResponseCache()
 
 
 def set_products_service(service: IProductsService):
@@ -15,18 +18,98 @@ def set_products_service(service: IProductsService):
     products_service = service
 
 
+def _get_price_arg(name: str):
+    """Reads an optional price query parameter, rejecting values that are not numbers."""
+    value = request.args.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise BadRequest(f"'{name}' must be a number")
+
+
 @products_bp.get("/")
 def get_products():
     """
-    Retrieve all products, optionally filtered by category.
+    Retrieve all products, optionally filtered by category and price range
+    (min_price, max_price) and sorted (sort=price|-price|name).
+
+    Answers 304 Not Modified if If-None-Match holds the current ETag.
 
     Returns:
         JSON response with products list and HTTP status code
     """
     try:
         category = request.args.get("category") 
-        all_products = products_service.get_all(category_filter=category)
-        return jsonify(all_products), 200
+        min_price = _get_price_arg("min_price")
+        max_price = _get_price_arg("max_price")
+        sort = request.args.get("sort")
+        version = products_service.get_version()
+        etag = collection_etag(PRODUCTS, version)
+        cached_response = not_modified(etag)
+        if cached_response is not None:
+            return cached_response
+
+        response = products_response_cache.json_response(
+            (category, min_price, max_price, sort), version,
+            lambda: products_service.get_all(
+                category_filter=category, min_price=min_price, max_price=max_price, sort=sort
+            )
+        )
+        return with_etag(response, etag), 200
+    
+    except HTTPException as e:
+        return jsonify({"error": e.description}), e.code
+    except Exception as e:
+        print(f"Error: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@products_bp.get("/search")
+def search_products():
+    """
+    Search products by name and category (q), best match first, up to limit results.
+
+    Returns:
+        JSON response with matching products and HTTP status code
+    """
+    try:
+        query = request.args.get("q")
+        limit = request.args.get("limit")
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                raise BadRequest("'limit' must be an integer")
+        products = products_service.search(query, limit)
+        return jsonify(products), 200
+    
+    except HTTPException as e:
+        return jsonify({"error": e.description}), e.code
+    except Exception as e:
+        print(f"Error: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@products_bp.get("/suggest")
+def suggest_products():
+    """
+    Suggest category and product names starting with prefix, up to limit results.
+
+    Returns:
+        JSON response with suggestions and HTTP status code
+    """
+    try:
+        prefix = request.args.get("prefix")
+        limit = request.args.get("limit")
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                raise BadRequest("'limit' must be an integer")
+        suggestions = products_service.suggest(prefix, limit)
+        return jsonify(suggestions), 200
     
     except HTTPException as e:
         return jsonify({"error": e.description}), e.code
@@ -40,6 +123,8 @@ def get_product_by_id(product_id):
     """
     Retrieve a single product by its ID.
 
+    Answers 304 Not Modified if If-None-Match holds the current ETag.
+
     Args:
         product_id: The product identifier
 
@@ -47,8 +132,13 @@ def get_product_by_id(product_id):
         JSON response with product data and HTTP status code
     """
     try:
+        etag = collection_etag(PRODUCTS, products_service.get_version())
+        cached_response = not_modified(etag)
+        if cached_response is not None:
+            return cached_response
+
         product = products_service.get_one_by_id(product_id=product_id)
-        return jsonify(product), 200
+        return with_etag(jsonify(product), etag), 200
     
     except HTTPException as e:
         return jsonify({"error": e.description}), e.code
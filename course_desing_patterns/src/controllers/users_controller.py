@@ -1,18 +1,39 @@
 from flask import Blueprint, request, jsonify
-from werkzeug.exceptions import HTTPException
+from werkzeug.exceptions import Forbidden, HTTPException, Unauthorized
 
 from src.dtos.request.update_user_request import UpdateUserRequestDTO
+from src.enums.user_role import UserRole
+from src.interfaces.services.auth_service_interface import IAuthService
 from src.interfaces.services.users_service_interface import IUsersService
 
 
 users_bp = Blueprint("users", __name__)
 users_service: IUsersService = None
+auth_service: IAuthService = None
 
 
-def set_users_service(service: IUsersService):
-    """Dependency injection for UsersService."""
-    global users_service
+def set_users_service(service: IUsersService, auth: IAuthService):
+    """Dependency injection for UsersService and the AuthService validating its callers."""
+    global users_service, auth_service
     users_service = service
+    auth_service = auth
+
+
+def _require_admin() -> None:
+    """
+    Validate the bearer token of the request and check that its user is an admin.
+
+    Raises:
+        Unauthorized: If the token is missing or invalid
+        Forbidden: If the user is not an admin
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise Unauthorized("Bearer token is required")
+
+    user = auth_service.validate_token(token)
+    if user.get("role") != UserRole.ADMIN.value:
+        raise Forbidden("Admin role is required")
 
 
 @users_bp.get("/")
@@ -34,6 +55,28 @@ def get_users():
         return jsonify({"error": "Internal server error"}), 500
 
 
+@users_bp.get("/email-filter-stats")
+def get_email_filter_stats():
+    """
+    Retrieve the statistics of the registered emails filter (admin only).
+
+    Headers:
+        Authorization: Bearer token of an admin
+
+    Returns:
+        JSON response with the filter sizing and false-positive rates and HTTP status code 200
+    """
+    try:
+        _require_admin()
+        stats = users_service.get_email_filter_stats()
+        return jsonify(stats), 200
+    except HTTPException as e:
+        return jsonify({"error": e.description}), e.code
+    except Exception as e:
+        print(f"Error: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
 @users_bp.get("/<int:user_id>")
 def get_user_by_id(user_id):
     """
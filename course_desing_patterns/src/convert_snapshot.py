@@ -0,0 +1,75 @@
+"""
+Converts database snapshots between the JSON and the binary format.
+
+Usage:
+    python -m src.convert_snapshot to-binary db.json db.bin [--compress]
+    python -m src.convert_snapshot to-json db.bin db.json
+    python -m src.convert_snapshot to-binary db.products.json db.products.bin --collection products
+
+Without --collection the JSON side is a whole database ({collection: [records]});
+with it the JSON side is the records array of that single collection.
+"""
+import argparse
+import json
+
+from src.repositories import binary_snapshot
+
+
+def to_binary(source: str, destination: str, collection: str = None, compress: bool = False) -> None:
+    """
+    Converts a JSON snapshot to a binary snapshot.
+
+    Args:
+        source: JSON snapshot path
+        destination: Binary snapshot path
+        collection: Name of the collection when source holds a single collection
+        compress: Whether to compress the binary snapshot
+    """
+    with open(source, 'r') as json_file:
+        data = json.load(json_file)
+
+    collections = {collection: data} if collection else data
+    binary_snapshot.write_snapshot(destination, collections, compress)
+
+
+def to_json(source: str, destination: str, collection: str = None) -> None:
+    """
+    Converts a binary snapshot to a JSON snapshot.
+
+    Args:
+        source: Binary snapshot path
+        destination: JSON snapshot path
+        collection: Name of the single collection to export as an array
+
+    Raises:
+        ValueError: If collection is not in the snapshot
+    """
+    collections = binary_snapshot.read_snapshot(source)
+    if collection:
+        if collection not in collections:
+            raise ValueError(f"Collection '{collection}' not found in {source}")
+        data = collections[collection]
+    else:
+        data = collections
+
+    with open(destination, 'w') as json_file:
+        json.dump(data, json_file, indent=4)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert database snapshots between JSON and binary formats.")
+    parser.add_argument("direction", choices=["to-binary", "to-json"])
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    parser.add_argument("--collection", help="Convert a single-collection snapshot")
+    parser.add_argument("--compress", action="store_true", help="Compress the binary snapshot")
+    args = parser.parse_args()
+
+    if args.direction == "to-binary":
+        to_binary(args.source, args.destination, args.collection, args.compress)
+    else:
+        to_json(args.source, args.destination, args.collection)
+
+
+if __name__ == '__main__':
+    main()
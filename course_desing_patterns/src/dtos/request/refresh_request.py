@@ -0,0 +1,5 @@
+from pydantic import BaseModel, Field
+
+
+class RefreshRequestDTO(BaseModel):
+    refresh_token: str = Field(..., min_length=1, description="Refresh token issued at login or by the last refresh")
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Durability(Enum):
+    FSYNC = "fsync"
+    GROUP_COMMIT = "group_commit"
+    ASYNC = "async"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ProductSort(Enum):
+    PRICE = "price"
+    PRICE_DESC = "-price"
+    NAME = "name"
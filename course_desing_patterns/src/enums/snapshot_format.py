@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class SnapshotFormat(Enum):
+    JSON = "json"
+    BINARY = "binary"
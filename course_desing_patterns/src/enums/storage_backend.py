@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class StorageBackend(Enum):
+    JSON = "json"
+    SQLITE = "sqlite"
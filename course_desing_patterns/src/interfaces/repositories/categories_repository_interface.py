@@ -5,6 +5,10 @@ from src.models.category import Category
 
 
 class ICategoriesRepository(ABC):
+    @abstractmethod
+    def get_version(self) -> str:
+        """Retrieve a token that changes whenever the categories change."""
+
     @abstractmethod
     def get_all(self) -> List[Category]:
         """Retrieve all categories"""
@@ -13,6 +17,10 @@ class ICategoriesRepository(ABC):
     def get_one_by_id(self, cateogry_id: int) -> Optional[Category]:
         """Retrieve a single cateogry by its ID."""  
 
+    @abstractmethod
+    def suggest(self, prefix: str, limit: int) -> List[Category]:
+        """Retrieve the categories whose name starts with prefix."""
+
     @abstractmethod
     def add_one(self, category_data: Category) -> Category:
         """Add a new category with the provided data."""
@@ -4,10 +4,18 @@ from src.models.favorite import Favorite
 
 class IFavoritesRepository(ABC):
 
+    @abstractmethod
+    def get_version(self) -> str:
+        """Retrieve a token that changes whenever the favorites change."""
+
     @abstractmethod
     def get_all(self) -> List[Favorite]:
         """Retrieve all favorites"""
 
+    @abstractmethod
+    def get_by_user(self, user_id: int) -> List[Favorite]:
+        """Retrieve the favorites of a user."""
+
     @abstractmethod
     def add_one(self, favorite: Favorite) -> Favorite:
         """Add a new favorite with the provided data."""
@@ -1,13 +1,27 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
+from src.enums.product_sort import ProductSort
 from src.models.product import Product
 
 
 class IProductsRepository(ABC):
     @abstractmethod
-    def get_all(self, category_filter: Optional[str] = None) -> List[Product]:
-        """Retrieve all products, optionally filtered by category."""
+    def get_version(self) -> str:
+        """Retrieve a token that changes whenever the products change."""
+
+    @abstractmethod
+    def get_all(self, category_filter: Optional[str] = None, min_price: Optional[float] = None,
+                max_price: Optional[float] = None, sort: Optional[ProductSort] = None) -> List[Product]:
+        """Retrieve all products, optionally filtered by category and price range and sorted."""
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> List[Product]:
+        """Retrieve the products whose name or category best match the query terms."""
+
+    @abstractmethod
+    def suggest(self, prefix: str, limit: int) -> List[Product]:
+        """Retrieve the products whose name starts with prefix."""
 
     @abstractmethod
     def get_one_by_id(self, product_id: int) -> Optional[Product]:
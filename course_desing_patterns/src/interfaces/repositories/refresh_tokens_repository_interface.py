@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.models.refresh_token import RefreshToken
+
+
+class IRefreshTokensRepository(ABC):
+
+    @abstractmethod
+    def get_by_token_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        """Retrieve a single refresh token by the hash of its value."""
+
+    @abstractmethod
+    def add_one(self, refresh_token: RefreshToken) -> RefreshToken:
+        """Add a new refresh token."""
+
+    @abstractmethod
+    def delete_one(self, refresh_token: RefreshToken) -> bool:
+        """Revoke a refresh token, returning False if it was already revoked."""
+
+    @abstractmethod
+    def delete_by_user(self, user_id: int) -> int:
+        """Revoke every refresh token of a user, returning how many were revoked."""
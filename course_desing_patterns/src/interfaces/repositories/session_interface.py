@@ -6,4 +6,8 @@ class IDatabaseConnection(ABC):
     
     @abstractmethod
     def connect(self) -> None:
-        """ Method to connect to the database."""
\ No newline at end of file
+        """ Method to connect to the database."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """ Method to flush pending writes and release the database."""
\ No newline at end of file
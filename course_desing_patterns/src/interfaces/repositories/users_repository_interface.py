@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from src.models.user import User
 
 
@@ -17,6 +17,14 @@ class IUsersRepository(ABC):
     def get_by_email(self, email: str) -> Optional[User]:
         """Retrieve a single user by email."""
     
+    @abstractmethod
+    def is_email_registered(self, email: str) -> bool:
+        """Check whether an email is registered, skipping the lookup when it is definitely absent."""
+    
+    @abstractmethod
+    def email_filter_stats(self) -> Dict[str, Any]:
+        """Retrieve the sizing and false-positive rates of the registered emails filter."""
+    
     @abstractmethod
     def add_one(self, user: User) -> User:
         """Add a new user to the database."""
@@ -28,3 +36,7 @@ class IUsersRepository(ABC):
     @abstractmethod
     def delete_one(self, user_id: int) -> bool:
         """Delete (deactivate) a user from the database."""
+
+    @abstractmethod
+    def subscribe(self, listener: Callable[[int], None]) -> None:
+        """Register a function called with the ID of every user updated or deleted."""
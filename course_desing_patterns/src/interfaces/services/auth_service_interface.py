@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from src.dtos.request.register_request import RegisterRequestDTO
 from src.dtos.request.login_request import LoginRequestDTO
+from src.dtos.request.refresh_request import RefreshRequestDTO
 
 
 class IAuthService(ABC):
@@ -13,3 +14,14 @@ class IAuthService(ABC):
     def login(self, login_dto: LoginRequestDTO) -> dict:
         """Authenticate user and generate JWT token."""
 
+    @abstractmethod
+    def refresh(self, refresh_dto: RefreshRequestDTO) -> dict:
+        """Exchange a refresh token for a new access token."""
+
+    @abstractmethod
+    def logout(self, refresh_dto: RefreshRequestDTO) -> None:
+        """Revoke a refresh token."""
+
+    @abstractmethod
+    def validate_token(self, token: str) -> dict:
+        """Validate a JWT token and return the data of its user."""
@@ -3,6 +3,10 @@ from abc import ABC, abstractmethod
 
 class IcategoriesService(ABC):
     
+    @abstractmethod
+    def get_version(self)->str:
+        """Retrieve a token that changes whenever the categories change."""
+
     @abstractmethod
     def get_all(self)->list:
         """Retrieve all categorys"""
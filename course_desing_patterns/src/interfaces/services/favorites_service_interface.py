@@ -3,10 +3,18 @@ from src.dtos.request.favorite_request import FavoriteRequestDTO
 
 class IFavoritesService(ABC):
 
+    @abstractmethod
+    def get_version(self)->str:
+        """Retrieve a token that changes whenever the favorites change."""
+
     @abstractmethod
     def get_all(self) -> list:
         """Retrieve all favorites"""
 
+    @abstractmethod
+    def get_by_user(self, user_id: int) -> list:
+        """Retrieve the favorites of a user."""
+
     @abstractmethod
     def create_one(self, favorite_data: FavoriteRequestDTO) -> dict:
         """Create a new favorite with the provided data."""
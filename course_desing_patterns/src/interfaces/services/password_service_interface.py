@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class IPasswordService(ABC):
+
+    @abstractmethod
+    def hash_password(self, password: str) -> str:
+        """Hash a plain password."""
+
+    @abstractmethod
+    def verify_password(self, password: str, hashed_password: str) -> bool:
+        """Check a plain password against a hashed password."""
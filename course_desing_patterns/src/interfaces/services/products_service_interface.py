@@ -4,9 +4,21 @@ from abc import ABC, abstractmethod
 class IProductsService(ABC):
     
     @abstractmethod
-    def get_all(self, category_filter=None)->list:
-        """Retrieve all products, optionally filtered by category."""
+    def get_version(self)->str:
+        """Retrieve a token that changes whenever the products change."""
+
+    @abstractmethod
+    def get_all(self, category_filter=None, min_price=None, max_price=None, sort=None)->list:
+        """Retrieve all products, optionally filtered by category and price range and sorted."""
    
+    @abstractmethod
+    def search(self, query, limit=None)->list:
+        """Search products by name and category."""
+
+    @abstractmethod
+    def suggest(self, prefix, limit=None)->list:
+        """Suggest category and product names starting with a prefix."""
+
     @abstractmethod
     def get_one_by_id(self, product_id)->dict:
         """Retrieve a single product by its ID."""
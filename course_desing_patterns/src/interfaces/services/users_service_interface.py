@@ -19,3 +19,7 @@ class IUsersService(ABC):
     @abstractmethod
     def delete_one(self, user_id: int) -> bool:
         """Delete (deactivate) a user account."""
+
+    @abstractmethod
+    def get_email_filter_stats(self) -> dict:
+        """Retrieve the sizing and false-positive rates of the registered emails filter."""
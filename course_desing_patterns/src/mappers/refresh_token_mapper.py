@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Any, Dict
+from src.models.refresh_token import RefreshToken
+
+
+class RefreshTokenMapper:
+    @staticmethod
+    def map_raw_data_to_refresh_token(raw_token: Dict[str, Any]) -> RefreshToken:
+        """
+        Maps a raw dictionary to a RefreshToken object using the Builder pattern.
+
+        Args:
+            raw_token: Dictionary containing refresh token data from database
+
+        Returns:
+            RefreshToken object built and validated
+
+        Raises:
+            ValueError: If the data is incomplete or invalid
+        """
+        return (RefreshToken()
+            .set_id(raw_token.get('id'))
+            .set_token_hash(raw_token.get('token_hash'))
+            .set_user_id(raw_token.get('user_id'))
+            .set_expires_at(RefreshTokenMapper._to_datetime(raw_token.get('expires_at')))
+            .set_created_at(RefreshTokenMapper._to_datetime(raw_token.get('created_at')))
+            .build())
+
+    @staticmethod
+    def to_dict(refresh_token: RefreshToken) -> Dict[str, Any]:
+        """
+        Converts a RefreshToken model to a dictionary for storage.
+
+        Args:
+            refresh_token: RefreshToken object
+
+        Returns:
+            Dictionary with all refresh token fields
+        """
+        return {
+            'id': refresh_token.id,
+            'token_hash': refresh_token.token_hash,
+            'user_id': refresh_token.user_id,
+            'expires_at': refresh_token.expires_at.isoformat(),
+            'created_at': refresh_token.created_at.isoformat() if refresh_token.created_at else None
+        }
+
+    @staticmethod
+    def _to_datetime(value):
+        return datetime.fromisoformat(value) if isinstance(value, str) else value
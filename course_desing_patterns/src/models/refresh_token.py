@@ -0,0 +1,47 @@
+from datetime import datetime
+
+
+class RefreshToken:
+    def __init__(self):
+        self.id = None
+        self.token_hash = None
+        self.user_id = None
+        self.expires_at = None
+        self.created_at = None
+
+    def set_id(self, id: int):
+        self.id = id
+        return self
+
+    def set_token_hash(self, token_hash: str):
+        self.token_hash = token_hash
+        return self
+
+    def set_user_id(self, user_id: int):
+        self.user_id = user_id
+        return self
+
+    def set_expires_at(self, expires_at: datetime):
+        self.expires_at = expires_at
+        return self
+
+    def set_created_at(self, created_at: datetime):
+        self.created_at = created_at
+        return self
+
+    def is_expired(self) -> bool:
+        return self.expires_at <= datetime.utcnow()
+
+    def build(self):
+        if not self.token_hash:
+            raise ValueError("Refresh token must have a token hash.")
+        if self.user_id is None:
+            raise ValueError("Refresh token must have a user_id.")
+        if not self.expires_at:
+            raise ValueError("Refresh token must have an expiration.")
+        if not self.created_at:
+            self.created_at = datetime.utcnow()
+        return self
+
+    def __repr__(self):
+        return f"<RefreshToken id={self.id}, user_id={self.user_id}, expires_at={self.expires_at}>"
@@ -0,0 +1,114 @@
+import hashlib
+import math
+import threading
+from typing import Any, Dict, Iterable
+
+BLOOM_FILTER_FP_RATE = 0.01
+BLOOM_FILTER_MIN_CAPACITY = 1024
+
+
+class BloomFilter:
+    """
+    Probabilistic set of strings: a miss means the value was never added, a
+    hit only means it probably was.
+
+    The bit array is sized for capacity values at the target false-positive
+    rate, which degrades past it, so owners rebuild a larger filter once
+    count outgrows capacity. Values cannot be removed. Lookups take no lock;
+    adds are serialized because setting a bit rewrites its whole byte.
+
+    Owners that confirm hits with an exact lookup report the hits that were
+    wrong, so stats can compare the measured rate with the expected one.
+    """
+
+    def __init__(self, capacity: int, fp_rate: float = BLOOM_FILTER_FP_RATE):
+        """
+        Initializes the BloomFilter.
+
+        Args:
+            capacity: Number of values the filter is sized for
+            fp_rate: Target false-positive rate at capacity
+        """
+        self.capacity = max(capacity, 1)
+        self.fp_rate = fp_rate
+        self.size = max(8, math.ceil(-self.capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self.negatives = 0
+        self.false_positives = 0
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, values: Iterable[str], fp_rate: float = BLOOM_FILTER_FP_RATE,
+              min_capacity: int = BLOOM_FILTER_MIN_CAPACITY) -> "BloomFilter":
+        """
+        Builds a filter over values with room for as many again.
+
+        Args:
+            values: Values to add
+            fp_rate: Target false-positive rate at capacity
+            min_capacity: Smallest capacity of the filter
+        """
+        values = list(values)
+        bloom_filter = cls(max(2 * len(values), min_capacity), fp_rate)
+        for value in values:
+            bloom_filter.add(value)
+        return bloom_filter
+
+    def add(self, value: str) -> None:
+        with self._lock:
+            for position in self._positions(value):
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def might_contain(self, value: str) -> bool:
+        """
+        Returns False if value was never added, True if it probably was.
+
+        Misses are counted as true negatives for the measured rate.
+        """
+        if value in self:
+            return True
+        with self._lock:
+            self.negatives += 1
+        return False
+
+    def record_false_positive(self) -> None:
+        """Counts a hit that an exact lookup proved wrong."""
+        with self._lock:
+            self.false_positives += 1
+
+    def is_full(self) -> bool:
+        return self.count > self.capacity
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the sizing of the filter and its false-positive rates.
+
+        measured_fp_rate is false_positives / (false_positives + negatives),
+        the share of absent values the filter did not rule out.
+        """
+        with self._lock:
+            checked_absent = self.false_positives + self.negatives
+            return {
+                "capacity": self.capacity,
+                "count": self.count,
+                "bits": self.size,
+                "hash_count": self.hash_count,
+                "negatives": self.negatives,
+                "false_positives": self.false_positives,
+                "expected_fp_rate": (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count,
+                "measured_fp_rate": self.false_positives / checked_absent if checked_absent else None,
+            }
+
+    def _positions(self, value: str) -> Iterable[int]:
+        """Derives the bit positions of a value from two halves of one digest (double hashing)."""
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def __contains__(self, value: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
@@ -1,8 +1,9 @@
-import json
-from typing import List
+from typing import List, Optional
 from werkzeug.exceptions import BadRequest
 from src.configurations.constants import CATEGORIES
 from src.mappers.category_mapper import CategoriesMapper
+from src.repositories.model_cache import ModelCache
+from src.repositories.record_index import PREFIX_END
 from src.models.category import Category
 from src.interfaces.repositories.categories_repository_interface import ICategoriesRepository
 from src.interfaces.repositories.session_interface import IDatabaseConnection
@@ -19,7 +20,25 @@ class CategoriesRepository(ICategoriesRepository):
             database_connection: Database connection instance
         """
         self.db: IDatabaseConnection = database_connection
+        self.cache: ModelCache[Category] = ModelCache(CategoriesMapper.map_raw_data_to_category,
+                                                      lambda: self.db.epoch(CATEGORIES))
+        self.db.create_index(CATEGORIES, 'name', lambda raw_category: raw_category.get('name'))
+        self.db.create_index(CATEGORIES, 'name_prefix', self._name_key, ordered=True)
+
+    @staticmethod
+    def _name_key(raw_category: dict) -> Optional[str]:
+        name = raw_category.get('name')
+        return name.lower() if name else None
     
+    def get_version(self) -> str:
+        """
+        Returns the version of the categories collection.
+
+        Returns:
+            A token that changes whenever a category is added, changed or removed
+        """
+        return self.db.version(CATEGORIES)
+
     def get_all(self) -> List[Category]:
         """
         Retrieves all categorys and maps them to category objects.
@@ -32,7 +51,7 @@ class CategoriesRepository(ICategoriesRepository):
         """
         if self.db.data:
             raw_categories = self.db.data.get(CATEGORIES, [])
-            categories = list(map(CategoriesMapper.map_raw_data_to_category, raw_categories))
+            categories = self.cache.map_all(raw_categories, complete=True)
                
             return categories
         
@@ -49,13 +68,30 @@ class CategoriesRepository(ICategoriesRepository):
             category object if found, None otherwise
         """
         if self.db.data:
-            raw_categories = self.db.data.get(CATEGORIES, [])
-            for raw_category in raw_categories:
-                if raw_category.get('id') == category_id:
-                    return CategoriesMapper.map_raw_data_to_category(raw_category)
+            raw_category = self.db.find_one(CATEGORIES, 'id', category_id)
+            if raw_category is not None:
+                return self.cache.get(raw_category)
         
         return None
 
+    def suggest(self, prefix: str, limit: int) -> List[Category]:
+        """
+        Retrieves the categories whose name starts with prefix, ignoring case.
+        
+        Args:
+            prefix: Beginning of the category name
+            limit: Maximum number of categories returned
+        
+        Returns:
+            Matching categories in alphabetical order
+        """
+        if not self.db.data:
+            return []
+        
+        prefix = prefix.lower()
+        raw_categories = self.db.find_range(CATEGORIES, 'name_prefix', prefix, prefix + PREFIX_END, limit)
+        return self.cache.map_all(raw_categories)
+
     def add_one(self, category: Category) -> Category:
         """
         Adds a new Category to the database.
@@ -72,25 +108,19 @@ class CategoriesRepository(ICategoriesRepository):
         if not self.db.data:
             return None
         
-        categories = self.db.data.get('categories', [])
-
-        category_names = [cat.get('name') for cat in categories]
-        if category.name in category_names:
-            raise BadRequest(f"Category '{category.name}' exist")
-        
-        new_id = max([p.get('id', 0) for p in categories], default=0) + 1
-        category.id = new_id
-        
-        category_dict = {
-            'id': category.id,
-            'name': category.name,
-        }
-        
-        categories.append(category_dict)
-        self.db.data[CATEGORIES] = categories      
-
-        with open(self.db.json_file_path, 'w') as json_file:
-            json.dump(self.db.data, json_file, indent=4)  
+        with self.db.transaction(CATEGORIES):
+            if self.db.find_one(CATEGORIES, 'name', category.name) is not None:
+                raise BadRequest(f"Category '{category.name}' exist")
+            
+            new_id = self.db.next_id(CATEGORIES)
+            category.id = new_id
+            
+            category_dict = {
+                'id': category.id,
+                'name': category.name,
+            }
+            
+            self.db.insert(CATEGORIES, category_dict, key={'id': category.id})
         
         return category
     
@@ -107,16 +137,12 @@ class CategoriesRepository(ICategoriesRepository):
         if not self.db.data:
             return False
         
-        categories = self.db.data.get('categories', [])
-        
-        category_names = [cat.get('name') for cat in categories]
-        if category.name not in category_names:
-            raise BadRequest(f"Category '{category.name}' doesnt exist")
-
-        categories = list(filter(lambda cat: cat.get('name') != category.name, categories))
-        self.db.data['categories'] = categories
+        with self.db.transaction(CATEGORIES):
+            raw_category = self.db.find_one(CATEGORIES, 'name', category.name)
+            if raw_category is None:
+                raise BadRequest(f"Category '{category.name}' doesnt exist")
 
-        with open(self.db.json_file_path, 'w') as json_file:
-                json.dump(self.db.data, json_file, indent=4)
+            self.db.delete(CATEGORIES, key={'name': category.name})
+            self.cache.discard(raw_category)
         
         return True
\ No newline at end of file
@@ -0,0 +1,462 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.enums.durability import Durability
+from src.enums.snapshot_format import SnapshotFormat
+from src.repositories import binary_snapshot
+from src.repositories.file_lock import FileLock
+from src.repositories.json_stream import iter_json_array
+from src.repositories.record_index import RecordIndex, SortedRecordIndex
+from src.repositories.record_set import DELETE, INSERT, SEQUENCE, UPDATE, RecordSet, RecordsView
+from src.repositories.write_ahead_log import WriteAheadLog
+
+
+class CollectionStore:
+    """
+    Storage of a single collection: its own snapshot file, write-ahead log,
+    write lock and compaction, so a mutation only touches this collection.
+
+    The records and their indexes are held by a RecordSet, which reads
+    without locks and applies a mutation without scanning the records.
+    Writers are serialized by the write lock, which is released before
+    waiting for the log to reach the disk.
+
+    Records are found through hash indexes, starting with the primary key,
+    kept in sync by every mutation. Integer ids are allocated from a
+    sequence counter instead of a scan of the records. The counter follows the ids of the logged inserts, and each
+    compaction logs its value so that ids of deleted records are not reused.
+
+    The version of the collection is derived from its files: the signature
+    of the snapshot, the inode of the live log and the offset of the last
+    log entry applied in memory. Every mutation moves the offset and every
+    compaction replaces the files, so readers can tell whether the
+    collection changed without looking at the records, and processes that
+    applied the same entries of the same files report the same version.
+
+    With multi_process enabled, several processes can share the files:
+    mutations and compactions take an advisory file lock, catch up with
+    what other processes logged and write their log entry before releasing
+    it; readers detect changes with a stat of the snapshot and the log and
+    only read the log entries appended since their last refresh.
+
+    The epoch counts the times records were replaced by something other
+    than a mutation of this process: a reload, a reset or the entries
+    another process logged. Caches keyed by record identity drop their
+    entries when it changes, since they are never told which records went.
+    """
+
+    def __init__(self, name: str, json_file_path: str, durability: Durability = Durability.GROUP_COMMIT,
+                 commit_window_ms: float = 5, commit_max_records: int = 100,
+                 snapshot_format: SnapshotFormat = SnapshotFormat.JSON, compress: bool = False,
+                 multi_process: bool = False, primary_key: str = "id"):
+        """
+        Initializes the CollectionStore.
+
+        Args:
+            name: Collection name
+            json_file_path: Path of the collection snapshot in JSON format;
+                the binary snapshot uses the same path with a '.bin' extension
+            durability: When a mutation is acknowledged
+            commit_window_ms: How long the log flusher waits to coalesce mutations
+            commit_max_records: Batch size that triggers a flush before the window ends
+            snapshot_format: Format used to write snapshots
+            compress: Whether binary snapshots are compressed
+            multi_process: Whether other processes may use the same files
+            primary_key: Field indexed under its own name and used for the sequence
+        """
+        self.name = name
+        self.snapshot_format = snapshot_format
+        self.compress = compress
+        self.snapshot_file_paths = {
+            SnapshotFormat.JSON: json_file_path,
+            SnapshotFormat.BINARY: f"{os.path.splitext(json_file_path)[0]}.bin",
+        }
+        self.snapshot_file_path = self.snapshot_file_paths[snapshot_format]
+        self.primary_key = primary_key
+        self.sequence = 0
+        self.epoch = 0
+        self._record_set = RecordSet([], primary_key)
+        self._index_definitions: Dict[str, Tuple[Callable[[Dict[str, Any]], Any], bool, bool]] = {}
+        self.log = WriteAheadLog(f"{json_file_path}.wal", durability, commit_window_ms, commit_max_records)
+        self.multi_process = multi_process
+        self._write_lock = threading.Lock()
+        self._transactions = threading.local()
+        self._compaction_lock = threading.Lock()
+        self._file_lock = FileLock(f"{json_file_path}.lock")
+        self._compaction_file_lock = FileLock(f"{json_file_path}.compaction.lock")
+        self._snapshot_signature = None
+        self._log_signature = None
+        self._log_offset = 0
+
+    def load(self) -> None:
+        """
+        Opens the log for appending, then loads the snapshot and replays the log over it.
+
+        A snapshot written in the other format is used when the configured one
+        is missing, so switching formats only takes effect at the next compaction.
+        Both formats are decoded incrementally, record by record.
+        """
+        self.log.open()
+        with self._write_lock:
+            self._reload()
+
+    @property
+    def records(self) -> RecordsView:
+        """The records of the collection, to iterate without locks."""
+        return self._record_set.view()
+
+    @property
+    def indexes(self) -> Dict[str, RecordIndex]:
+        return self._record_set.indexes
+
+    def create_index(self, name: str, key_func: Callable[[Dict[str, Any]], Any], ordered: bool = False,
+                     multi_valued: bool = False) -> None:
+        """
+        Adds an index over the records, kept in sync by every later mutation.
+
+        Args:
+            name: Index name used for lookups
+            key_func: Function returning the indexed value of a record, or None to skip it
+            ordered: Whether to keep the records sorted by value for range lookups
+                instead of hashing them
+            multi_valued: Whether key_func returns several values to file the record under
+        """
+        with self._write_lock:
+            self._index_definitions[name] = (key_func, ordered, multi_valued)
+            self._record_set.add_index(name, self._new_index(key_func, ordered, multi_valued))
+
+    def find_one(self, index: str, value: Any) -> Optional[Dict[str, Any]]:
+        """Returns the first record indexed under value, or None."""
+        self.refresh()
+        return self.indexes[index].get(value)
+
+    def find(self, index: str, value: Any) -> List[Dict[str, Any]]:
+        """Returns the records indexed under value."""
+        self.refresh()
+        return self.indexes[index].find(value)
+
+    def find_range(self, index: str, low: Any = None, high: Any = None,
+                   limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Returns up to limit records of an ordered index within [low, high], in ascending order."""
+        self.refresh()
+        return self.indexes[index].range(low, high, limit)
+
+    def version(self) -> str:
+        """Returns a token that changes whenever the records change, the same in every process."""
+        self.refresh()
+        snapshot = "none"
+        if self._snapshot_signature is not None:
+            _, inode, mtime_ns, size = self._snapshot_signature
+            snapshot = f"{inode}-{mtime_ns}-{size}"
+        return f"{snapshot}.{self._log_signature}.{self._log_offset}"
+
+    def refresh(self) -> None:
+        """Catches up with the mutations other processes made since the last refresh."""
+        if not self.multi_process or self._in_transaction():
+            return
+        with self._write_lock:
+            if self._needs_reload():
+                # Reload under the file lock so a compaction cannot discard
+                # the archive between reading the old snapshot and the archive.
+                with self._file_lock:
+                    self._catch_up()
+            else:
+                self._catch_up()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Serializes a read-modify-write sequence with the other writers of the collection.
+
+        Mutations made inside the block are acknowledged once it exits: the
+        write lock is released first and the log is awaited afterwards, so
+        the critical section never includes a disk flush. Nested blocks join
+        the outermost one.
+        """
+        state = self._transactions
+        if self._in_transaction():
+            state.depth += 1
+            try:
+                yield
+            finally:
+                state.depth -= 1
+            return
+
+        with self._write_lock, self._locked_files():
+            state.depth, state.ticket = 1, None
+            try:
+                yield
+            finally:
+                state.depth = 0
+                ticket = state.ticket
+
+        if ticket is not None:
+            self.log.wait(ticket)
+
+    def next_id(self) -> int:
+        """
+        Allocates the next integer id of the collection.
+
+        With several processes, allocate the id and insert the record in the
+        same transaction; within a process ids are always unique.
+
+        Returns:
+            An id greater than any id allocated or inserted before
+        """
+        with self.transaction():
+            self.sequence += 1
+            return self.sequence
+
+    def close(self) -> None:
+        """Flushes pending mutations and closes the log."""
+        self.log.close()
+        self._file_lock.close()
+        self._compaction_file_lock.close()
+
+    def insert(self, record: Dict[str, Any], key: Dict[str, Any]) -> None:
+        """
+        Adds a record and logs the mutation.
+
+        Args:
+            record: Record to add
+            key: Fields that identify the record
+        """
+        self._commit({"op": INSERT, "key": key, "record": record})
+
+    def update(self, record: Dict[str, Any], key: Dict[str, Any]) -> None:
+        """
+        Replaces the record matching key and logs the mutation.
+
+        Args:
+            record: New version of the record
+            key: Fields that identify the record
+        """
+        self._commit({"op": UPDATE, "key": key, "record": record})
+
+    def delete(self, key: Dict[str, Any]) -> None:
+        """
+        Removes the records matching key and logs the mutation.
+
+        Args:
+            key: Fields that identify the records
+        """
+        self._commit({"op": DELETE, "key": key})
+
+    def needs_compaction(self, threshold_bytes: int) -> bool:
+        """Returns True if the log outgrew threshold_bytes or a compaction was left unfinished."""
+        return self.log.size() >= threshold_bytes or os.path.exists(self.log.archive_file_path)
+
+    def compact(self) -> None:
+        """
+        Folds the logged mutations into a fresh snapshot.
+
+        The pending log appends are flushed before taking the write lock, so
+        writers are only held while the records are copied, the live log is
+        renamed into the archive and the sequence is logged; the snapshot
+        itself is serialized without blocking them and atomically renamed
+        over the previous one.
+
+        If a compaction was left unfinished, its archive is folded instead:
+        the snapshot is written from the records, which already contain the
+        archive, without rotating the log, and the next compaction rotates it.
+        """
+        with self._compaction_lock:
+            if self.multi_process and not self._compaction_file_lock.acquire(blocking=False):
+                return
+            try:
+                rotate = not os.path.exists(self.log.archive_file_path)
+                if rotate:
+                    self.log.flush()
+                with self._write_lock, self._locked_files():
+                    records = list(self.records)
+                    if rotate:
+                        self.log.rotate()
+                        self._log_signature = self._stat_log()[0]
+                    ticket = self.log.append({"op": SEQUENCE, "key": {}, "value": self.sequence})
+                    self._log_offset = self.log.end_offset
+
+                self.log.wait(ticket)
+                self.write_snapshot(records)
+                with self._write_lock:
+                    self._snapshot_signature = self._stat_snapshot()
+                    with self._locked_files():
+                        self.log.discard_archive()
+            finally:
+                if self.multi_process:
+                    self._compaction_file_lock.release()
+
+    def write_snapshot(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Writes records to a temporary file and atomically renames it over the snapshot.
+
+        Args:
+            records: Records to persist
+        """
+        snapshot_dir = os.path.dirname(os.path.abspath(self.snapshot_file_path))
+        temp_file_path = f"{self.snapshot_file_path}.tmp"
+
+        if self.snapshot_format == SnapshotFormat.BINARY:
+            binary_snapshot.write_snapshot(temp_file_path, {self.name: records}, self.compress)
+        else:
+            with open(temp_file_path, 'w') as json_file:
+                json.dump(records, json_file, indent=4)
+                json_file.flush()
+                os.fsync(json_file.fileno())
+        os.replace(temp_file_path, self.snapshot_file_path)
+
+        for snapshot_format, file_path in self.snapshot_file_paths.items():
+            if snapshot_format != self.snapshot_format and os.path.exists(file_path):
+                os.remove(file_path)
+
+        if hasattr(os, 'O_DIRECTORY'):
+            dir_fd = os.open(snapshot_dir, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    @contextmanager
+    def _locked_files(self):
+        """
+        In multi-process mode, holds the inter-process lock, catches up with
+        the other processes first and writes the log entries made inside the
+        block to the file before releasing it.
+        """
+        if not self.multi_process:
+            yield
+            return
+
+        with self._file_lock:
+            self._catch_up()
+            self.log.reopen_if_rotated()
+            try:
+                yield
+            finally:
+                self.log.write()
+                self._snapshot_signature = self._stat_snapshot()
+                self._log_signature, self._log_offset = self._stat_log()
+
+    def _needs_reload(self) -> bool:
+        """Returns True if a compaction replaced the snapshot or rotated the log since the last refresh."""
+        log_signature, log_size = self._stat_log()
+        return self._stat_snapshot() != self._snapshot_signature or log_signature != self._log_signature \
+            or log_size < self._log_offset
+
+    def _catch_up(self) -> None:
+        """
+        Applies what other processes changed: the new tail of the log when
+        only the log grew, a full reload otherwise.
+        """
+        if self._needs_reload():
+            self._reload()
+        elif self._stat_log()[1] > self._log_offset:
+            entries, self._log_offset = self.log.read_from(self._log_offset)
+            for entry in entries:
+                self.apply(entry, replaying=True)
+            self.epoch += 1
+
+    def _reload(self) -> None:
+        """
+        Rebuilds the records from the snapshot, the archive segment and the live log.
+
+        The log is replayed into a new RecordSet, which finds the records of
+        each entry through its key indexes, and the declared indexes are only
+        built once it is complete. Readers keep the current records until the
+        new ones are swapped in.
+        """
+        self._snapshot_signature = self._stat_snapshot()
+        self._log_signature = self._stat_log()[0]
+
+        record_set = RecordSet(self._iter_snapshot_records(), self.primary_key)
+        sequence = max((record[self.primary_key] for record in record_set
+                        if isinstance(record.get(self.primary_key), int)), default=0)
+        for entry in self.log.replay_archive():
+            record_set.apply(entry, replaying=True)
+            sequence = self._sequence_after(sequence, entry)
+        entries, self._log_offset = self.log.read_from(0)
+        for entry in entries:
+            record_set.apply(entry, replaying=True)
+            sequence = self._sequence_after(sequence, entry)
+        self._install(record_set)
+        self.sequence = max(self.sequence, sequence)
+
+    def reset(self, records: List[Dict[str, Any]]) -> None:
+        """Replaces the in-memory records and builds the indexes over them."""
+        self._install(RecordSet(records, self.primary_key))
+
+    def _install(self, record_set: RecordSet) -> None:
+        """Builds the declared indexes over record_set and swaps it in for the current records."""
+        for name, (key_func, ordered, multi_valued) in self._index_definitions.items():
+            record_set.add_index(name, self._new_index(key_func, ordered, multi_valued))
+        self._record_set = record_set
+        self.epoch += 1
+
+    @staticmethod
+    def _new_index(key_func: Callable[[Dict[str, Any]], Any], ordered: bool, multi_valued: bool):
+        return SortedRecordIndex(key_func) if ordered else RecordIndex(key_func, multi_valued)
+
+    def _stat_snapshot(self):
+        """Returns what identifies the snapshot on disk, which changes whenever a compaction replaces it."""
+        snapshot_format = self._find_snapshot_format()
+        if snapshot_format is None:
+            return None
+        stat = os.stat(self.snapshot_file_paths[snapshot_format])
+        return snapshot_format, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _stat_log(self):
+        """Returns the inode and size of the live log, or (None, 0) if it does not exist."""
+        try:
+            stat = os.stat(self.log.log_file_path)
+        except FileNotFoundError:
+            return None, 0
+        return stat.st_ino, stat.st_size
+
+    def _iter_snapshot_records(self) -> Iterator[Dict[str, Any]]:
+        """Yields the records of the snapshot on disk without materializing the whole file."""
+        snapshot_format = self._find_snapshot_format()
+        if snapshot_format == SnapshotFormat.BINARY:
+            for _, records in binary_snapshot.iter_sections(self.snapshot_file_paths[snapshot_format]):
+                yield from records
+                return
+        elif snapshot_format == SnapshotFormat.JSON:
+            yield from iter_json_array(self.snapshot_file_paths[snapshot_format])
+
+    def _find_snapshot_format(self):
+        """Returns the format of the snapshot on disk, preferring the configured one, or None."""
+        for snapshot_format in (self.snapshot_format, *self.snapshot_file_paths):
+            if os.path.exists(self.snapshot_file_paths[snapshot_format]):
+                return snapshot_format
+        return None
+
+    def apply(self, entry: Dict[str, Any], replaying: bool = False) -> None:
+        """
+        Applies a logged mutation to the in-memory records.
+
+        While replaying, inserts replace any record with the same key so a log
+        can be replayed over a snapshot that already contains part of it.
+        """
+        self._record_set.apply(entry, replaying)
+        self.sequence = self._sequence_after(self.sequence, entry)
+
+    def _sequence_after(self, sequence: int, entry: Dict[str, Any]) -> int:
+        """Returns the sequence counter after a logged mutation."""
+        if entry["op"] == SEQUENCE:
+            return max(sequence, entry["value"])
+        if entry["op"] == INSERT and isinstance(entry["record"].get(self.primary_key), int):
+            return max(sequence, entry["record"][self.primary_key])
+        return sequence
+
+    def _in_transaction(self) -> bool:
+        return getattr(self._transactions, "depth", 0) > 0
+
+    def _commit(self, entry: Dict[str, Any]) -> None:
+        with self.transaction():
+            # Logged first, so a mutation the log refuses never shows up in memory.
+            self._transactions.ticket = self.log.append(entry)
+            self.apply(entry)
+            if not self.multi_process:
+                # With several processes the offset is read from the log once it is written.
+                self._log_offset = self.log.end_offset
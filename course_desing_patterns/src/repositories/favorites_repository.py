@@ -1,4 +1,3 @@
-import json
 from typing import List
 from werkzeug.exceptions import BadRequest
 from src.configurations.constants import FAVORITES, PRODUCTS
@@ -6,46 +5,52 @@ from src.mappers.favorite_mapper import FavoriteMapper
 from src.models.favorite import Favorite
 from src.interfaces.repositories.favorites_repository_interface import IFavoritesRepository
 from src.interfaces.repositories.session_interface import IDatabaseConnection
+from src.repositories.model_cache import ModelCache
 
 
 class FavoritesRepository(IFavoritesRepository):
 
     def __init__(self, database_connection: IDatabaseConnection):
         self.db: IDatabaseConnection = database_connection
+        self.cache: ModelCache[Favorite] = ModelCache(FavoriteMapper.map_raw_data_to_favorite,
+                                                      lambda: self.db.epoch(FAVORITES))
+        self.db.create_index(FAVORITES, 'user_product', lambda fav: (fav.get("user_id"), fav.get("product_id")))
+        self.db.create_index(FAVORITES, 'user_id', lambda fav: fav.get("user_id"))
+
+    def get_version(self) -> str:
+        return self.db.version(FAVORITES)
 
     def get_all(self) -> List[Favorite]:
         if not self.db.data:
             return []
         
         raw_favorites = self.db.data.get(FAVORITES, [])
-        return list(map(FavoriteMapper.map_raw_data_to_favorite, raw_favorites))
+        return self.cache.map_all(raw_favorites, complete=True)
+
+    def get_by_user(self, user_id: int) -> List[Favorite]:
+        if not self.db.data:
+            return []
+
+        raw_favorites = self.db.find(FAVORITES, "user_id", user_id)
+        return self.cache.map_all(raw_favorites)
 
     def add_one(self, favorite: Favorite) -> Favorite:
         if not self.db.data:
             return None
         
-        favorites = self.db.data.get(FAVORITES, [])
-        products = self.db.data.get(PRODUCTS, [])
-
-        product_exists = any(p.get("id") == favorite.product_id for p in products)
-        if not product_exists:
-            raise BadRequest(f"Product with id {favorite.product_id} does not exist")
+        with self.db.transaction(FAVORITES):
+            if self.db.find_one(PRODUCTS, "id", favorite.product_id) is None:
+                raise BadRequest(f"Product with id {favorite.product_id} does not exist")
 
-
-        for fav in favorites:
-            if fav.get("user_id") == favorite.user_id and fav.get("product_id") == favorite.product_id:
+            if self.db.find_one(FAVORITES, "user_product", (favorite.user_id, favorite.product_id)) is not None:
                 raise BadRequest("Favorite already exists for this user and product")
 
-        favorite_dict = {
-            "user_id": favorite.user_id,
-            "product_id": favorite.product_id
-        }
-
-        favorites.append(favorite_dict)
-        self.db.data[FAVORITES] = favorites
+            favorite_dict = {
+                "user_id": favorite.user_id,
+                "product_id": favorite.product_id
+            }
 
-        with open(self.db.json_file_path, 'w') as json_file:
-            json.dump(self.db.data, json_file, indent=4)
+            self.db.insert(FAVORITES, favorite_dict, key=favorite_dict)
 
         return favorite
 
@@ -53,24 +58,12 @@ class FavoritesRepository(IFavoritesRepository):
         if not self.db.data:
             return False
 
-        favorites = self.db.data.get(FAVORITES, [])
-
-        found = False
-        for fav in favorites:
-            if fav.get("user_id") == favorite.user_id and fav.get("product_id") == favorite.product_id:
-                found = True
-
-        if not found:
-            raise BadRequest("Favorite does not exist")
-
-        favorites = list(filter(
-            lambda f: not (f.get("user_id") == favorite.user_id and f.get("product_id") == favorite.product_id),
-            favorites
-        ))
-
-        self.db.data[FAVORITES] = favorites
+        with self.db.transaction(FAVORITES):
+            raw_favorite = self.db.find_one(FAVORITES, "user_product", (favorite.user_id, favorite.product_id))
+            if raw_favorite is None:
+                raise BadRequest("Favorite does not exist")
 
-        with open(self.db.json_file_path, 'w') as json_file:
-            json.dump(self.db.data, json_file, indent=4)
+            self.db.delete(FAVORITES, key={"user_id": favorite.user_id, "product_id": favorite.product_id})
+            self.cache.discard(raw_favorite)
 
         return True
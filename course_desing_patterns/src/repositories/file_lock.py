@@ -0,0 +1,64 @@
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class FileLock:
+    """
+    Advisory lock shared between processes through a lock file.
+
+    Uses flock, so the lock is released by the kernel if the holding process
+    dies. On platforms without fcntl it degrades to a no-op, which is only
+    safe with a single process.
+    """
+
+    def __init__(self, lock_file_path: str):
+        """
+        Initializes the FileLock.
+
+        Args:
+            lock_file_path: Path of the lock file, created if missing
+        """
+        self.lock_file_path = lock_file_path
+        self._lock_file = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Acquires the lock exclusively.
+
+        Args:
+            blocking: Whether to wait for the lock
+
+        Returns:
+            True if the lock was acquired
+        """
+        if fcntl is None:
+            return True
+
+        if self._lock_file is None:
+            self._lock_file = open(self.lock_file_path, 'a')
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(self._lock_file.fileno(), flags)
+        except BlockingIOError:
+            return False
+        return True
+
+    def release(self) -> None:
+        """Releases the lock."""
+        if fcntl is not None and self._lock_file is not None:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Closes the lock file, releasing the lock if held."""
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
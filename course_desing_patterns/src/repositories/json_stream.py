@@ -0,0 +1,216 @@
+"""
+Incremental JSON parsing for database snapshots.
+
+The file is read in fixed-size chunks, so peak memory is one chunk plus the
+objects built so far instead of the whole raw text plus the whole object
+graph.
+
+Array elements are decoded in batches: the buffered text is cut after the
+last element that looks complete and the whole batch is decoded as one
+array, which keeps decoding in C at about the speed of json.load. A cut
+that falls inside a nested value or a string leaves the batch unbalanced
+and fails to decode, so the reader tries an earlier cut and, if none
+decodes, decodes one element on its own.
+"""
+import json
+import re
+from typing import Any, Iterator, List, TextIO, Tuple
+
+READ_CHUNK_SIZE = 256 * 1024
+BATCH_ATTEMPTS = 3
+WHITESPACE_CHARS = " \t\n\r"
+WHITESPACE = re.compile(f"[{WHITESPACE_CHARS}]*")
+VALUE_TERMINATORS = " \t\n\r,]}:"
+CONTAINER_ENDS = "}]"
+
+
+class JsonStreamReader:
+    """Reads JSON values one at a time from a text stream."""
+
+    def __init__(self, stream: TextIO, chunk_size: int = READ_CHUNK_SIZE):
+        """
+        Initializes the JsonStreamReader.
+
+        Args:
+            stream: Text stream positioned at the start of a JSON document
+            chunk_size: Number of characters read from the stream at a time
+        """
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._scan_once = self._decoder.scan_once
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def iter_array(self) -> Iterator[Any]:
+        """
+        Yields the elements of the JSON array at the current position.
+
+        Raises:
+            ValueError: If the document is not a well-formed array
+        """
+        self._expect('[')
+        if self._peek() == ']':
+            self._position += 1
+            return
+
+        while True:
+            elements = self._decode_elements()
+            if elements:
+                yield from elements
+            else:
+                yield self._decode_value()
+            separator = self._next_char()
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or ']' in JSON array, found {separator!r}")
+
+    def iter_object_arrays(self) -> Iterator[Tuple[str, Iterator[Any]]]:
+        """
+        Yields (key, element iterator) for a JSON object whose values are arrays.
+
+        Each element iterator must be consumed before moving to the next key.
+
+        Raises:
+            ValueError: If the document is not an object of arrays
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._position += 1
+            return
+
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise ValueError("Expected a string key in JSON object")
+            self._expect(':')
+            elements = self.iter_array()
+            yield key, elements
+            for _ in elements:
+                pass
+
+            separator = self._next_char()
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or '}}' in JSON object, found {separator!r}")
+
+    def _decode_elements(self) -> List[Any]:
+        """
+        Decodes the whole array elements held by the buffer in one call.
+
+        Elements are cut after a closing brace or bracket followed by ',' or
+        ']', starting from the end of the buffer; the elements are left to
+        _decode_value if no cut decodes within BATCH_ATTEMPTS tries. A cut
+        past the end of the array decodes up to its closing bracket, which
+        is left in the buffer.
+
+        Returns:
+            The decoded elements, or an empty list
+        """
+        self._peek()
+        if not self._eof and len(self._buffer) - self._position < self._chunk_size:
+            self._read_chunk()
+
+        buffer, start = self._buffer, self._position
+        end = len(buffer)
+        for _ in range(BATCH_ATTEMPTS):
+            last = self._find_element_end(buffer, start, end)
+            if last < 0:
+                return []
+            batch = f"[{buffer[start:last + 1]}]"
+            try:
+                elements, batch_end = self._decoder.raw_decode(batch)
+            except json.JSONDecodeError:
+                end = last
+                continue
+            # The batch starts with the added '[' and its closing bracket is
+            # either the added ']' or the one ending the array in the buffer.
+            self._position = last + 1 if batch_end == len(batch) else start + batch_end - 2
+            return elements
+        return []
+
+    @staticmethod
+    def _find_element_end(buffer: str, start: int, end: int) -> int:
+        """Returns the position of the last '}' or ']' before end followed by ',' or ']', or -1."""
+        while True:
+            end = max(buffer.rfind(',', start, end), buffer.rfind(']', start, end))
+            if end < 0:
+                return -1
+            last = end - 1
+            while last >= start and buffer[last] in WHITESPACE_CHARS:
+                last -= 1
+            if last >= start and buffer[last] in CONTAINER_ENDS:
+                return last
+
+    def _decode_value(self) -> Any:
+        """Decodes the next value, reading more of the stream while it is incomplete."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._scan_once(self._buffer, self._position)
+            except (StopIteration, json.JSONDecodeError):
+                if self._eof:
+                    raise ValueError("Invalid JSON value in document")
+                self._read_chunk()
+                continue
+
+            if not self._eof and (end == len(self._buffer) or self._buffer[end] not in VALUE_TERMINATORS):
+                # A number cut by the chunk boundary decodes as a shorter, valid number.
+                self._read_chunk()
+                continue
+
+            self._position = end
+            return value
+
+    def _expect(self, char: str) -> None:
+        found = self._next_char()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON document, found {found!r}")
+
+    def _next_char(self) -> str:
+        char = self._peek()
+        self._position += 1
+        return char
+
+    def _peek(self) -> str:
+        """Returns the next non-whitespace character without consuming it."""
+        while True:
+            self._position = WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if self._eof:
+                raise ValueError("Unexpected end of JSON document")
+            self._read_chunk()
+
+    def _read_chunk(self) -> None:
+        """Appends the next chunk to the buffer, dropping what was already consumed."""
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+
+
+def iter_json_array(file_path: str) -> Iterator[Any]:
+    """
+    Yields the elements of the JSON array stored in a file.
+
+    Args:
+        file_path: Path of a file holding a JSON array
+    """
+    with open(file_path, 'r') as json_file:
+        yield from JsonStreamReader(json_file).iter_array()
+
+
+def iter_json_object_arrays(file_path: str) -> Iterator[Tuple[str, Iterator[Any]]]:
+    """
+    Yields (key, element iterator) for the JSON object of arrays stored in a file.
+
+    Args:
+        file_path: Path of a file holding a JSON object of arrays
+    """
+    with open(file_path, 'r') as json_file:
+        yield from JsonStreamReader(json_file).iter_object_arrays()
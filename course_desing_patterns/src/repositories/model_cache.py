@@ -0,0 +1,87 @@
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class ModelCache(Generic[T]):
+    """
+    Cache of the models built from the raw records of a collection.
+
+    Entries are keyed by the identity of the raw record they were built from
+    and keep a reference to it, so the key cannot be reused by another record
+    while the entry exists. Mutations never modify a raw record in place,
+    they replace it, so a cached model is always up to date with the record
+    it is found for. Cached models are shared between callers and must be
+    treated as read-only.
+
+    Records replaced by a reload or by another process are never discarded
+    one by one, so every entry is dropped when the epoch of the collection
+    changes; otherwise each reload would leave a full set of dead entries.
+    """
+
+    def __init__(self, mapper: Callable[[Dict[str, Any]], T], epoch: Optional[Callable[[], int]] = None):
+        """
+        Initializes the ModelCache.
+
+        Args:
+            mapper: Function building a model from a raw record
+            epoch: Function returning the epoch of the collection, read
+                after its records
+        """
+        self._mapper = mapper
+        self._epoch = epoch
+        self._entries_epoch = None
+        self._entries: Dict[int, Tuple[Dict[str, Any], T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, raw_record: Dict[str, Any]) -> T:
+        """Returns the model of a raw record, building it on a miss."""
+        entries = self._current_entries()
+        entry = entries.get(id(raw_record))
+        if entry is not None and entry[0] is raw_record:
+            return entry[1]
+
+        model = self._mapper(raw_record)
+        entries[id(raw_record)] = (raw_record, model)
+        return model
+
+    def map_all(self, raw_records: Iterable[Dict[str, Any]], complete: bool = False) -> List[T]:
+        """
+        Returns the models of raw records, building only the missing ones.
+
+        Args:
+            raw_records: Raw records to map
+            complete: Whether raw_records is the whole collection, in which
+                case the entries of records no longer in it are dropped
+        """
+        if not complete:
+            return [self.get(raw_record) for raw_record in raw_records]
+
+        entries = self._current_entries()
+        fresh = {}
+        models = []
+        for raw_record in raw_records:
+            entry = entries.get(id(raw_record))
+            if entry is None or entry[0] is not raw_record:
+                entry = (raw_record, self._mapper(raw_record))
+            fresh[id(raw_record)] = entry
+            models.append(entry[1])
+        self._entries = fresh
+        return models
+
+    def discard(self, raw_record: Dict[str, Any]) -> None:
+        """Drops the model of a raw record that was replaced or removed."""
+        entry = self._entries.get(id(raw_record))
+        if entry is not None and entry[0] is raw_record:
+            self._entries.pop(id(raw_record), None)
+
+    def _current_entries(self) -> Dict[int, Tuple[Dict[str, Any], T]]:
+        """Returns the entries, dropping them first if the epoch changed since they were built."""
+        if self._epoch is not None:
+            epoch = self._epoch()
+            if epoch != self._entries_epoch:
+                self._entries = {}
+                self._entries_epoch = epoch
+        return self._entries
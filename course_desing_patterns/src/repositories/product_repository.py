@@ -1,11 +1,18 @@
-import json
-from typing import List
+import heapq
+from typing import List, Optional
 from werkzeug.exceptions import BadRequest
 from src.configurations.constants import CATEGORIES, PRODUCTS
+from src.enums.product_sort import ProductSort
 from src.interfaces.repositories.products_repository_interface import IProductsRepository
 from src.interfaces.repositories.session_interface import IDatabaseConnection
 from src.models.product import Product
 from src.mappers.products_mapper import ProductsMapper
+from src.repositories.model_cache import ModelCache
+from src.repositories.record_index import PREFIX_END
+from src.utils.common import Common
+
+NAME_TERM_WEIGHT = 2
+CATEGORY_TERM_WEIGHT = 1
 
 
 class ProductsRepository(IProductsRepository):
@@ -18,28 +25,129 @@ class ProductsRepository(IProductsRepository):
             database_connection: Database connection instance
         """
         self.db: IDatabaseConnection = database_connection
+        self.cache: ModelCache[Product] = ModelCache(ProductsMapper.map_raw_data_to_product,
+                                                     lambda: self.db.epoch(PRODUCTS))
+        self.db.create_index(PRODUCTS, 'category', lambda raw_product: raw_product.get('category'))
+        self.db.create_index(PRODUCTS, 'price', lambda raw_product: raw_product.get('price'), ordered=True)
+        self.db.create_index(PRODUCTS, 'name', self._name_key, ordered=True)
+        self.db.create_index(PRODUCTS, 'name_terms', lambda raw_product: Common.tokenize(raw_product.get('name')),
+                             multi_valued=True)
+        self.db.create_index(PRODUCTS, 'category_terms',
+                             lambda raw_product: Common.tokenize(raw_product.get('category')), multi_valued=True)
+        self.db.create_index(CATEGORIES, 'name', lambda raw_category: raw_category.get('name'))
     
-    def get_all(self, category_filter: str = None) -> List[Product]:
+    @staticmethod
+    def _name_key(raw_product: dict) -> Optional[str]:
+        name = raw_product.get('name')
+        return name.lower() if name else None
+
+    def get_version(self) -> str:
+        """
+        Returns the version of the products collection.
+
+        Returns:
+            A token that changes whenever a product is added, changed or removed
+        """
+        return self.db.version(PRODUCTS)
+
+    def get_all(self, category_filter: str = None, min_price: float = None, max_price: float = None,
+                sort: ProductSort = None) -> List[Product]:
         """
         Retrieves all products and maps them to Product objects.
         
+        A category filter is served by the category index and the remaining
+        filters are applied to its products; otherwise price ranges and
+        orderings are read from the sorted price and name indexes.
+        
         Args:
             category_filter: Optional category to filter products
+            min_price: Optional lowest price included
+            max_price: Optional highest price included
+            sort: Optional ordering of the products
         
         Returns:
             List of mapped products, or empty list if no data exists
         """
         if self.db.data:
-            raw_products = self.db.data.get(PRODUCTS, [])
-            products = list(map(ProductsMapper.map_raw_data_to_product, raw_products))
+            price_filtered = min_price is not None or max_price is not None
             
             if category_filter:
-                return [p for p in products if p.category == category_filter]
+                raw_products = self.db.find(PRODUCTS, 'category', category_filter)
+                if price_filtered:
+                    raw_products = [
+                        p for p in raw_products
+                        if (min_price is None or p.get('price') >= min_price)
+                        and (max_price is None or p.get('price') <= max_price)
+                    ]
+                if sort == ProductSort.NAME:
+                    raw_products = sorted(raw_products, key=self._name_key)
+                elif sort is not None:
+                    raw_products = sorted(raw_products, key=lambda p: p.get('price'),
+                                          reverse=sort == ProductSort.PRICE_DESC)
+            elif price_filtered or sort in (ProductSort.PRICE, ProductSort.PRICE_DESC):
+                raw_products = self.db.find_range(PRODUCTS, 'price', min_price, max_price)
+                if sort == ProductSort.PRICE_DESC:
+                    raw_products.reverse()
+                elif sort == ProductSort.NAME:
+                    raw_products = sorted(raw_products, key=self._name_key)
+            elif sort == ProductSort.NAME:
+                raw_products = self.db.find_range(PRODUCTS, 'name')
+            else:
+                return self.cache.map_all(self.db.data.get(PRODUCTS, []), complete=True)
             
-            return products
+            return self.cache.map_all(raw_products)
         
         return []
 
+    def search(self, query: str, limit: int) -> List[Product]:
+        """
+        Searches products through the inverted indexes of name and category terms.
+        
+        Each query term found in the name of a product scores NAME_TERM_WEIGHT
+        and each one found in its category CATEGORY_TERM_WEIGHT; only the
+        products holding some term are scored.
+        
+        Args:
+            query: Search text
+            limit: Maximum number of products returned
+        
+        Returns:
+            Matching products, best score first and then by ID
+        """
+        terms = set(Common.tokenize(query))
+        if not self.db.data or not terms:
+            return []
+        
+        scores = {}
+        matches = {}
+        for term in terms:
+            for index, weight in (('name_terms', NAME_TERM_WEIGHT), ('category_terms', CATEGORY_TERM_WEIGHT)):
+                for raw_product in self.db.find(PRODUCTS, index, term):
+                    key = id(raw_product)
+                    scores[key] = scores.get(key, 0) + weight
+                    matches[key] = raw_product
+        
+        best = heapq.nsmallest(limit, scores, key=lambda key: (-scores[key], matches[key].get('id', 0)))
+        return self.cache.map_all(matches[key] for key in best)
+
+    def suggest(self, prefix: str, limit: int) -> List[Product]:
+        """
+        Retrieves the products whose name starts with prefix, ignoring case.
+        
+        Args:
+            prefix: Beginning of the product name
+            limit: Maximum number of products returned
+        
+        Returns:
+            Matching products in alphabetical order
+        """
+        if not self.db.data:
+            return []
+        
+        prefix = prefix.lower()
+        raw_products = self.db.find_range(PRODUCTS, 'name', prefix, prefix + PREFIX_END, limit)
+        return self.cache.map_all(raw_products)
+
     def get_one_by_id(self, product_id: int) -> Product:
         """
         Retrieves a single product by its ID.
@@ -51,10 +159,9 @@ class ProductsRepository(IProductsRepository):
             Product object if found, None otherwise
         """
         if self.db.data:
-            raw_products = self.db.data.get(PRODUCTS, [])
-            for raw_product in raw_products:
-                if raw_product.get('id') == product_id:
-                    return ProductsMapper.map_raw_data_to_product(raw_product)
+            raw_product = self.db.find_one(PRODUCTS, 'id', product_id)
+            if raw_product is not None:
+                return self.cache.get(raw_product)
         
         return None
 
@@ -74,26 +181,20 @@ class ProductsRepository(IProductsRepository):
         if not self.db.data:
             return None
         
-        products = self.db.data.get(PRODUCTS, [])
-        categories = self.db.data.get(CATEGORIES, [])
-        
-        category_names = [cat.get('name') for cat in categories]
-        if product.category not in category_names:
-            raise BadRequest(f"Category '{product.category}' does not exist")
-        
-        new_id = max([p.get('id', 0) for p in products], default=0) + 1
-        product.id = new_id
-        
-        product_dict = {
-            'id': product.id,
-            'name': product.name,
-            'category': product.category,
-            'price': product.price
-        }
+        with self.db.transaction(PRODUCTS):
+            if self.db.find_one(CATEGORIES, 'name', product.category) is None:
+                raise BadRequest(f"Category '{product.category}' does not exist")
+            
+            new_id = self.db.next_id(PRODUCTS)
+            product.id = new_id
+            
+            product_dict = {
+                'id': product.id,
+                'name': product.name,
+                'category': product.category,
+                'price': product.price
+            }
+            
+            self.db.insert(PRODUCTS, product_dict, key={'id': product.id})
         
-        products.append(product_dict)
-        self.db.data[PRODUCTS] = products      
-
-        with open(self.db.json_file_path, 'w') as json_file:
-            json.dump(self.db.data, json_file, indent=4)  
         return product
\ No newline at end of file
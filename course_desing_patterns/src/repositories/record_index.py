@@ -0,0 +1,214 @@
+import bisect
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Appended to a prefix, gives an upper bound for every string starting with it.
+PREFIX_END = "\U0010ffff"
+SORTED_INDEX_BLOCK_SIZE = 512
+
+
+class RecordIndex:
+    """
+    Hash index from a value computed from each record to the records holding it.
+
+    Records whose key is None are not indexed. A multi-valued index files a
+    record under each of the values its key function returns, as an inverted
+    index does with the terms of a text. Readers look values up without
+    locks: entries are only appended to in place, and removals replace the
+    list of records of a value instead of shrinking it.
+    """
+
+    def __init__(self, key_func: Callable[[Dict[str, Any]], Any], multi_valued: bool = False):
+        """
+        Initializes the RecordIndex.
+
+        Args:
+            key_func: Function returning the indexed value of a record
+            multi_valued: Whether key_func returns an iterable of values
+        """
+        self.key_func = key_func
+        self.multi_valued = multi_valued
+        self._entries: Dict[Any, List[Dict[str, Any]]] = {}
+
+    def rebuild(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Replaces the whole index with one built from records."""
+        entries = {}
+        for record in records:
+            for value in self._values(record):
+                entries.setdefault(value, []).append(record)
+        self._entries = entries
+
+    def add(self, record: Dict[str, Any]) -> None:
+        for value in self._values(record):
+            records = self._entries.get(value)
+            if records is None:
+                self._entries[value] = [record]
+            else:
+                records.append(record)
+
+    def remove(self, record: Dict[str, Any]) -> None:
+        for value in self._values(record):
+            records = self._entries.get(value)
+            if records is None:
+                continue
+            remaining = [indexed for indexed in records if indexed is not record]
+            if remaining:
+                self._entries[value] = remaining
+            else:
+                del self._entries[value]
+
+    def _values(self, record: Dict[str, Any]) -> Iterable[Any]:
+        value = self.key_func(record)
+        if value is None:
+            return ()
+        return set(value) if self.multi_valued else (value,)
+
+    def get(self, value: Any) -> Optional[Dict[str, Any]]:
+        """Returns the first record indexed under value, or None."""
+        records = self._entries.get(value)
+        return records[0] if records else None
+
+    def find(self, value: Any) -> List[Dict[str, Any]]:
+        """Returns the records indexed under value."""
+        return list(self._entries.get(value, ()))
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SortedRecordIndex:
+    """
+    Index keeping the records ordered by a value computed from each record.
+
+    Entries are held in sorted blocks of at most twice block_size entries,
+    next to the last value of each block. Range lookups bisect the block
+    values and then a block, costing O(log n + k). Records whose key is
+    None are not indexed.
+
+    Writers copy the block they change and the list of blocks, about
+    block_size + n / block_size references instead of the n of a single
+    sorted list, and swap both lists in at once, so lookups never see a
+    half-applied change.
+    """
+
+    def __init__(self, key_func: Callable[[Dict[str, Any]], Any], block_size: int = SORTED_INDEX_BLOCK_SIZE):
+        """
+        Initializes the SortedRecordIndex.
+
+        Args:
+            key_func: Function returning the value records are ordered by
+            block_size: Number of entries per block after a rebuild; a block
+                is split in two when it grows past twice this size
+        """
+        self.key_func = key_func
+        self.block_size = block_size
+        self._blocks: Tuple[List[List[Tuple[Any, Dict[str, Any]]]], List[Any]] = ([], [])
+        self._length = 0
+
+    def rebuild(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Replaces the whole index with one built from records."""
+        entries = [(self.key_func(record), record) for record in records]
+        entries = sorted((entry for entry in entries if entry[0] is not None), key=_entry_key)
+        blocks = [entries[start:start + self.block_size] for start in range(0, len(entries), self.block_size)]
+        self._blocks = (blocks, [block[-1][0] for block in blocks])
+        self._length = len(entries)
+
+    def add(self, record: Dict[str, Any]) -> None:
+        value = self.key_func(record)
+        if value is None:
+            return
+        blocks, last_values = list(self._blocks[0]), list(self._blocks[1])
+        if not blocks:
+            self._blocks = ([[(value, record)]], [value])
+            self._length += 1
+            return
+
+        # Equal values stay in insertion order: the record goes after them.
+        position = min(bisect.bisect_right(last_values, value), len(blocks) - 1)
+        block = list(blocks[position])
+        bisect.insort_right(block, (value, record), key=_entry_key)
+        if len(block) > 2 * self.block_size:
+            half = len(block) // 2
+            blocks[position:position + 1] = [block[:half], block[half:]]
+            last_values[position:position + 1] = [block[half - 1][0], block[-1][0]]
+        else:
+            blocks[position] = block
+            last_values[position] = block[-1][0]
+        self._blocks = (blocks, last_values)
+        self._length += 1
+
+    def remove(self, record: Dict[str, Any]) -> None:
+        value = self.key_func(record)
+        if value is None:
+            return
+        blocks, last_values = self._blocks
+        position = bisect.bisect_left(last_values, value)
+        while position < len(blocks) and blocks[position][0][0] <= value:
+            block = blocks[position]
+            start = bisect.bisect_left(block, value, key=_entry_key)
+            end = bisect.bisect_right(block, value, key=_entry_key)
+            for entry_position in range(start, end):
+                if block[entry_position][1] is record:
+                    self._remove_entry(position, entry_position)
+                    return
+            position += 1
+
+    def _remove_entry(self, position: int, entry_position: int) -> None:
+        blocks, last_values = list(self._blocks[0]), list(self._blocks[1])
+        block = blocks[position][:entry_position] + blocks[position][entry_position + 1:]
+        if block:
+            blocks[position] = block
+            last_values[position] = block[-1][0]
+        else:
+            del blocks[position]
+            del last_values[position]
+        self._blocks = (blocks, last_values)
+        self._length -= 1
+
+    def get(self, value: Any) -> Optional[Dict[str, Any]]:
+        """Returns the first record indexed under value, or None."""
+        records = self.range(value, value, 1)
+        return records[0] if records else None
+
+    def find(self, value: Any) -> List[Dict[str, Any]]:
+        """Returns the records indexed under value."""
+        return self.range(value, value)
+
+    def range(self, low: Any = None, high: Any = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Returns the records whose value is within [low, high], in ascending order.
+
+        Args:
+            low: Lowest value included, or None for no lower bound
+            high: Highest value included, or None for no upper bound
+            limit: Maximum number of records returned, or None for all of them
+        """
+        blocks, last_values = self._blocks
+        position = 0 if low is None else bisect.bisect_left(last_values, low)
+        start = 0
+        if low is not None and position < len(blocks):
+            start = bisect.bisect_left(blocks[position], low, key=_entry_key)
+        records = []
+        while position < len(blocks):
+            block = blocks[position]
+            end = len(block) if high is None else bisect.bisect_right(block, high, key=_entry_key)
+            records.extend(record for _, record in block[start:end])
+            if limit is not None and len(records) >= limit:
+                return records[:limit]
+            if end < len(block):
+                break
+            position += 1
+            start = 0
+        return records
+
+    def __contains__(self, value: Any) -> bool:
+        return self.get(value) is not None
+
+    def __len__(self) -> int:
+        return self._length
+
+
+def _entry_key(entry: Tuple[Any, Dict[str, Any]]) -> Any:
+    return entry[0]
@@ -0,0 +1,148 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.repositories.record_index import RecordIndex
+
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+SEQUENCE = "sequence"
+
+# Deleted slots are only squeezed out of lists that have at least this many.
+SQUEEZE_MIN_EMPTY_SLOTS = 1024
+
+
+class RecordSet:
+    """
+    In-memory records of a collection and the indexes kept in sync with them.
+
+    Records stay in insertion order. Deleting a record empties its slot
+    (None) instead of shifting the records after it, and the position of
+    every record is tracked, so a mutation never scans or rebuilds the
+    list. Once empty slots outnumber the records a compacted list is
+    swapped in, which keeps deletes O(1) amortized.
+
+    Mutations find their records through a hash index on the fields of
+    their key: the primary key index, or for other keys, such as the
+    (user_id, product_id) key of favorites, an index built the first time
+    a key with those fields is used.
+
+    Readers take no lock: inserts append, updates and deletes replace a
+    single slot and compaction swaps in a new list, so a reader iterating
+    the list it got sees every remaining record exactly once. Writers must
+    be serialized by the owner.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]], primary_key: str = "id"):
+        """
+        Initializes the RecordSet.
+
+        Args:
+            records: Initial records, in insertion order
+            primary_key: Field indexed under its own name
+        """
+        self.records: List[Optional[Dict[str, Any]]] = list(records)
+        self.primary_key = primary_key
+        self.indexes: Dict[str, RecordIndex] = {primary_key: RecordIndex(lambda record: record.get(primary_key))}
+        self.indexes[primary_key].rebuild(self.records)
+        self._key_indexes: Dict[Tuple[str, ...], RecordIndex] = {}
+        self._empty_slots = 0
+        self._positions: Dict[int, int] = {id(record): position for position, record in enumerate(self.records)}
+
+    def add_index(self, name: str, index) -> None:
+        """Builds index over the records and keeps it in sync from then on."""
+        index.rebuild(self)
+        self.indexes[name] = index
+
+    def view(self) -> "RecordsView":
+        """Returns the records for lock-free iteration."""
+        return RecordsView(self.records, len(self))
+
+    def apply(self, entry: Dict[str, Any], replaying: bool = False) -> None:
+        """
+        Applies a logged mutation to the records.
+
+        While replaying, inserts replace any record with the same key so a log
+        can be replayed over a snapshot that already contains part of it.
+        """
+        if entry["op"] == INSERT:
+            if replaying:
+                for record in self.find(entry["key"]):
+                    self._remove(record)
+            self._append(entry["record"])
+        elif entry["op"] == UPDATE:
+            for i, record in enumerate(self.find(entry["key"])):
+                self._replace(record, entry["record"] if i == 0 else dict(entry["record"]))
+        elif entry["op"] == DELETE:
+            for record in self.find(entry["key"]):
+                self._remove(record)
+
+    def find(self, key: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Returns the records matching every field of key."""
+        if len(key) == 1 and self.primary_key in key:
+            return self.indexes[self.primary_key].find(key[self.primary_key])
+
+        fields = tuple(sorted(key))
+        index = self._key_indexes.get(fields)
+        if index is None:
+            index = RecordIndex(lambda record: tuple(record.get(field) for field in fields))
+            index.rebuild(self)
+            self._key_indexes[fields] = index
+        return index.find(tuple(key[field] for field in fields))
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if id(record) in self._positions:
+            record = dict(record)
+        self._positions[id(record)] = len(self.records)
+        self.records.append(record)
+        for index in self._synced_indexes():
+            index.add(record)
+
+    def _replace(self, record: Dict[str, Any], new_record: Dict[str, Any]) -> None:
+        if new_record is not record and id(new_record) in self._positions:
+            new_record = dict(new_record)
+        position = self._positions.pop(id(record))
+        self.records[position] = new_record
+        self._positions[id(new_record)] = position
+        for index in self._synced_indexes():
+            index.remove(record)
+            index.add(new_record)
+
+    def _remove(self, record: Dict[str, Any]) -> None:
+        position = self._positions.pop(id(record))
+        self.records[position] = None
+        self._empty_slots += 1
+        for index in self._synced_indexes():
+            index.remove(record)
+        if self._empty_slots >= SQUEEZE_MIN_EMPTY_SLOTS and self._empty_slots > len(self):
+            self._squeeze()
+
+    def _synced_indexes(self) -> Iterator[RecordIndex]:
+        yield from self.indexes.values()
+        yield from self._key_indexes.values()
+
+    def _squeeze(self) -> None:
+        """Swaps in a list without the empty slots of deleted records."""
+        records = [record for record in self.records if record is not None]
+        self._positions = {id(record): position for position, record in enumerate(records)}
+        self._empty_slots = 0
+        self.records = records
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (record for record in self.records if record is not None)
+
+    def __len__(self) -> int:
+        return len(self.records) - self._empty_slots
+
+
+class RecordsView:
+    """Read-only view of a list of records that skips the slots of deleted ones."""
+
+    def __init__(self, records: List[Optional[Dict[str, Any]]], count: int):
+        self._records = records
+        self._count = count
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (record for record in self._records if record is not None)
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,115 @@
+from datetime import datetime
+from typing import Optional
+from src.configurations.constants import REFRESH_TOKENS
+from src.interfaces.repositories.refresh_tokens_repository_interface import IRefreshTokensRepository
+from src.interfaces.repositories.session_interface import IDatabaseConnection
+from src.mappers.refresh_token_mapper import RefreshTokenMapper
+from src.models.refresh_token import RefreshToken
+
+# Expired tokens deleted per token added, more than one so the backlog shrinks.
+EXPIRED_TOKENS_PURGE_BATCH = 100
+
+
+class RefreshTokensRepository(IRefreshTokensRepository):
+
+    def __init__(self, database_connection: IDatabaseConnection):
+        """
+        Initializes the RefreshTokensRepository.
+
+        Args:
+            database_connection: Database connection instance
+        """
+        self.db: IDatabaseConnection = database_connection
+        self.db.create_index(REFRESH_TOKENS, 'token_hash', lambda raw_token: raw_token.get('token_hash'))
+        self.db.create_index(REFRESH_TOKENS, 'user_id', lambda raw_token: raw_token.get('user_id'))
+        self.db.create_index(REFRESH_TOKENS, 'expires_at', lambda raw_token: raw_token.get('expires_at'), ordered=True)
+
+    def get_by_token_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        """
+        Retrieves a single refresh token by the hash of its value.
+
+        Args:
+            token_hash: Hash of the refresh token
+
+        Returns:
+            RefreshToken object if found, None otherwise
+        """
+        if self.db.data:
+            raw_token = self.db.find_one(REFRESH_TOKENS, 'token_hash', token_hash)
+            if raw_token is not None:
+                return RefreshTokenMapper.map_raw_data_to_refresh_token(raw_token)
+
+        return None
+
+    def add_one(self, refresh_token: RefreshToken) -> RefreshToken:
+        """
+        Adds a new refresh token to the database.
+
+        Up to EXPIRED_TOKENS_PURGE_BATCH expired tokens are deleted in the same
+        transaction, so tokens that are never presented again do not pile up.
+
+        Args:
+            refresh_token: RefreshToken object to add
+
+        Returns:
+            The added refresh token with ID
+        """
+        if not self.db.data:
+            return None
+
+        with self.db.transaction(REFRESH_TOKENS):
+            self._delete_expired(EXPIRED_TOKENS_PURGE_BATCH)
+            refresh_token.id = self.db.next_id(REFRESH_TOKENS)
+            self.db.insert(REFRESH_TOKENS, RefreshTokenMapper.to_dict(refresh_token), key={'id': refresh_token.id})
+
+        return refresh_token
+
+    def delete_one(self, refresh_token: RefreshToken) -> bool:
+        """
+        Revokes a refresh token by deleting it.
+
+        Args:
+            refresh_token: RefreshToken object to revoke
+
+        Returns:
+            True if the token was revoked, False if it no longer existed
+        """
+        if not self.db.data:
+            return False
+
+        with self.db.transaction(REFRESH_TOKENS):
+            raw_token = self.db.find_one(REFRESH_TOKENS, 'token_hash', refresh_token.token_hash)
+            if raw_token is None:
+                return False
+
+            self.db.delete(REFRESH_TOKENS, key={'id': raw_token['id']})
+
+        return True
+
+    def delete_by_user(self, user_id: int) -> int:
+        """
+        Revokes every refresh token of a user.
+
+        Args:
+            user_id: The user identifier
+
+        Returns:
+            Number of refresh tokens revoked
+        """
+        if not self.db.data:
+            return 0
+
+        with self.db.transaction(REFRESH_TOKENS):
+            raw_tokens = self.db.find(REFRESH_TOKENS, 'user_id', user_id)
+            for raw_token in raw_tokens:
+                self.db.delete(REFRESH_TOKENS, key={'id': raw_token['id']})
+
+        return len(raw_tokens)
+
+    def _delete_expired(self, limit: int) -> int:
+        """Deletes up to limit tokens that expired, oldest first. Must run inside a transaction."""
+        raw_tokens = self.db.find_range(REFRESH_TOKENS, 'expires_at', None, datetime.utcnow().isoformat(), limit)
+        for raw_token in raw_tokens:
+            self.db.delete(REFRESH_TOKENS, key={'id': raw_token['id']})
+
+        return len(raw_tokens)
@@ -1,13 +1,74 @@
-import json
+import atexit
+import glob
+import os
 import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from src.configurations.constants import COLLECTIONS
+from src.enums.durability import Durability
+from src.enums.snapshot_format import SnapshotFormat
 from src.interfaces.repositories.session_interface import IDatabaseConnection
+from src.repositories import binary_snapshot
+from src.repositories.collection_store import CollectionStore
+from src.repositories.file_lock import FileLock
+from src.repositories.json_stream import iter_json_object_arrays
+from src.repositories.record_set import RecordsView
+from src.repositories.write_ahead_log import WriteAheadLog
+
+
+class LazyCollections(Mapping):
+    """
+    Read-only mapping of collection name to records that loads a collection
+    from disk the first time it is accessed.
+    """
+
+    def __init__(self, connection: "DatabaseConnection", names: Iterable[str]):
+        self._connection = connection
+        self._names = set(names)
+
+    def add(self, name: str) -> None:
+        """Registers a collection created after connecting."""
+        self._names.add(name)
+
+    def is_loaded(self, name: str) -> bool:
+        """Returns True if the collection is already in memory."""
+        return name in self._connection.stores
+
+    def __getitem__(self, name: str) -> RecordsView:
+        if name not in self._names:
+            raise KeyError(name)
+        store = self._connection._get_store(name)
+        store.refresh()
+        return store.records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self._names))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
 
 class DatabaseConnection(IDatabaseConnection):
+    """
+    JSON database stored as one file per collection.
+
+    For a json_file_path of 'db.json' the products collection lives in
+    'db.products.json' (or 'db.products.bin' with binary snapshots) plus its
+    write-ahead log 'db.products.json.wal'. A single-file 'db.json' (or
+    'db.bin') is split into per-collection files on first boot.
+
+    Collections are loaded on first access through data, so a process only
+    pays for the collections it touches.
+
+    With multi_process enabled, worker processes of a prefork server can
+    share the same files: every access through data first applies the
+    mutations the other workers logged since the previous access.
+    """
     _instance = None
     _lock = threading.Lock()
 
-    def __new__(cls, json_file_path):
+    def __new__(cls, json_file_path, *args, **kwargs):
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
@@ -15,17 +76,294 @@ class DatabaseConnection(IDatabaseConnection):
                     cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self, json_file_path):
+    def __init__(self, json_file_path, durability: Durability = Durability.GROUP_COMMIT,
+                 commit_window_ms: float = 5, commit_max_records: int = 100,
+                 compaction_threshold_bytes: int = 16 * 1024 * 1024, compaction_interval_s: float = 30,
+                 snapshot_format: SnapshotFormat = SnapshotFormat.JSON, compress_snapshots: bool = False,
+                 multi_process: bool = False):
         if getattr(self, "_initialized", False):
             return
         self.json_file_path = json_file_path
+        self.binary_file_path = f"{os.path.splitext(json_file_path)[0]}.bin"
+        self.snapshot_format = snapshot_format
+        self.compress_snapshots = compress_snapshots
+        self.multi_process = multi_process
         self.data = None
+        self.durability = durability
+        self.commit_window_ms = commit_window_ms
+        self.commit_max_records = commit_max_records
+        self.compaction_threshold_bytes = compaction_threshold_bytes
+        self.compaction_interval_s = compaction_interval_s
+        self.stores: Dict[str, CollectionStore] = {}
+        self._index_definitions: Dict[str, Dict[str, Tuple[Callable[[Dict[str, Any]], Any], bool, bool]]] = {}
+        self._stores_lock = threading.Lock()
+        self._stop_compactor = threading.Event()
+        self._compactor = None
         self._initialized = True
 
     def connect(self):
-        try:
-            with open(self.json_file_path, 'r') as json_file:
-                self.data = json.load(json_file)
-        except FileNotFoundError:
-            self.data = None
-            print("Error: json file not found.")
+        with FileLock(f"{self.json_file_path}.lock"):
+            collection_names = self._find_collection_names()
+            if not collection_names:
+                if not os.path.exists(self.json_file_path) and not os.path.exists(self.binary_file_path):
+                    self.data = None
+                    print("Error: json file not found.")
+                    return
+                self._split_legacy_snapshot()
+                collection_names = self._find_collection_names()
+
+        self.data = LazyCollections(self, set(collection_names) | set(COLLECTIONS))
+
+        self._start_compactor()
+        atexit.register(self.close)
+        if self.multi_process and hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def close(self):
+        self._stop_compactor.set()
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+        for store in list(self.stores.values()):
+            store.close()
+
+    def insert(self, collection: str, record: Dict[str, Any], key: Dict[str, Any]) -> None:
+        """
+        Adds a record to a collection and logs the mutation.
+
+        Args:
+            collection: Collection name
+            record: Record to add
+            key: Fields that identify the record
+        """
+        self._get_store(collection).insert(record, key)
+
+    def update(self, collection: str, record: Dict[str, Any], key: Dict[str, Any]) -> None:
+        """
+        Replaces the record matching key and logs the mutation.
+
+        Args:
+            collection: Collection name
+            record: New version of the record
+            key: Fields that identify the record
+        """
+        self._get_store(collection).update(record, key)
+
+    def delete(self, collection: str, key: Dict[str, Any]) -> None:
+        """
+        Removes the records matching key and logs the mutation.
+
+        Args:
+            collection: Collection name
+            key: Fields that identify the records
+        """
+        self._get_store(collection).delete(key)
+
+    def next_id(self, collection: str) -> int:
+        """
+        Allocates the next integer id of a collection without scanning it.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            An id greater than any id allocated or inserted before
+        """
+        return self._get_store(collection).next_id()
+
+    def version(self, collection: str) -> str:
+        """
+        Returns the version of a collection, for caches and conditional requests.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            A token that changes whenever the records of the collection change
+        """
+        return self._get_store(collection).version()
+
+    def epoch(self, collection: str) -> int:
+        """
+        Returns the epoch of a collection, for caches keyed by record identity.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            A counter that changes whenever the records were reloaded or
+            changed by another process
+        """
+        return self._get_store(collection).epoch
+
+    def create_index(self, collection: str, name: str, key_func: Callable[[Dict[str, Any]], Any],
+                     ordered: bool = False, multi_valued: bool = False) -> None:
+        """
+        Declares an index on a collection, built when the collection is loaded.
+
+        Args:
+            collection: Collection name
+            name: Index name used for lookups
+            key_func: Function returning the indexed value of a record, or None to skip it
+            ordered: Whether the index keeps records sorted for find_range
+            multi_valued: Whether key_func returns several values, such as the terms of a text
+        """
+        with self._stores_lock:
+            self._index_definitions.setdefault(collection, {})[name] = (key_func, ordered, multi_valued)
+            store = self.stores.get(collection)
+        if store is not None:
+            store.create_index(name, key_func, ordered, multi_valued)
+
+    def find_one(self, collection: str, index: str, value: Any) -> Optional[Dict[str, Any]]:
+        """
+        Looks a record up through an index of a collection.
+
+        Args:
+            collection: Collection name
+            index: Index name, such as the primary key 'id'
+            value: Indexed value
+
+        Returns:
+            The first record indexed under value, or None
+        """
+        return self._get_store(collection).find_one(index, value)
+
+    def find(self, collection: str, index: str, value: Any) -> List[Dict[str, Any]]:
+        """
+        Looks records up through an index of a collection.
+
+        Args:
+            collection: Collection name
+            index: Index name
+            value: Indexed value
+
+        Returns:
+            The records indexed under value
+        """
+        return self._get_store(collection).find(index, value)
+
+    def find_range(self, collection: str, index: str, low: Any = None, high: Any = None,
+                   limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Looks records up through an ordered index of a collection.
+
+        Args:
+            collection: Collection name
+            index: Name of an index created with ordered=True
+            low: Lowest value included, or None for no lower bound
+            high: Highest value included, or None for no upper bound
+            limit: Maximum number of records returned, or None for all of them
+
+        Returns:
+            The records within the range, in ascending order
+        """
+        return self._get_store(collection).find_range(index, low, high, limit)
+
+    def transaction(self, collection: str):
+        """
+        Returns a context manager that serializes a read-modify-write sequence
+        on a collection with its other writers; readers are never blocked.
+
+        Args:
+            collection: Collection name
+        """
+        return self._get_store(collection).transaction()
+
+    def compact(self) -> None:
+        """Folds the logged mutations of every collection into fresh snapshots."""
+        for store in list(self.stores.values()):
+            store.compact()
+
+    def _collection_file_path(self, collection: str) -> str:
+        root, extension = os.path.splitext(self.json_file_path)
+        return f"{root}.{collection}{extension}"
+
+    def _find_collection_names(self) -> list:
+        """Returns the names of the collections that have a snapshot or a log on disk."""
+        root, extension = os.path.splitext(self.json_file_path)
+        names = set()
+        for suffix in (extension, ".bin", f"{extension}.wal"):
+            for path in glob.glob(f"{glob.escape(root)}.*{suffix}"):
+                name = path[len(root) + 1:-len(suffix)]
+                if name and '.' not in name:
+                    names.add(name)
+        return sorted(names)
+
+    def _get_store(self, collection: str) -> CollectionStore:
+        """Returns the store of a collection, loading it the first time it is used."""
+        store = self.stores.get(collection)
+        if store is not None:
+            return store
+
+        with self._stores_lock:
+            store = self.stores.get(collection)
+            if store is None:
+                store = CollectionStore(collection, self._collection_file_path(collection), self.durability,
+                                        self.commit_window_ms, self.commit_max_records,
+                                        self.snapshot_format, self.compress_snapshots, self.multi_process)
+                for name, (key_func, ordered, multi_valued) in self._index_definitions.get(collection, {}).items():
+                    store.create_index(name, key_func, ordered, multi_valued)
+                store.load()
+                self.stores[collection] = store
+                if self.data is not None:
+                    self.data.add(collection)
+        return store
+
+    def _split_legacy_snapshot(self) -> None:
+        """Writes each collection of the single-file database, with its log replayed, to its own file."""
+        if os.path.exists(self.json_file_path):
+            legacy_sections = iter_json_object_arrays(self.json_file_path)
+        else:
+            legacy_sections = binary_snapshot.iter_sections(self.binary_file_path)
+
+        stores = {}
+
+        def get_store(name: str) -> CollectionStore:
+            if name not in stores:
+                stores[name] = CollectionStore(name, self._collection_file_path(name),
+                                               snapshot_format=self.snapshot_format,
+                                               compress=self.compress_snapshots)
+            return stores[name]
+
+        for name, records in legacy_sections:
+            get_store(name).reset(list(records))
+
+        legacy_log = WriteAheadLog(f"{self.json_file_path}.wal")
+        for entry in legacy_log.replay():
+            get_store(entry["collection"]).apply(entry, replaying=True)
+
+        for store in stores.values():
+            store.write_snapshot(list(store.records))
+
+        legacy_log.discard_archive()
+        if os.path.exists(legacy_log.log_file_path):
+            os.remove(legacy_log.log_file_path)
+
+    def _reset_after_fork(self) -> None:
+        """
+        Drops the state inherited from the parent of a forked worker: its
+        stores, whose log flushers did not survive the fork, and its compactor.
+        """
+        self.stores = {}
+        self._stores_lock = threading.Lock()
+        self._compactor = None
+        self._start_compactor()
+
+    def _start_compactor(self) -> None:
+        if self._compactor is not None:
+            return
+        self._stop_compactor.clear()
+        self._compactor = threading.Thread(target=self._run_compactor, name="db-compactor", daemon=True)
+        self._compactor.start()
+
+    def _run_compactor(self) -> None:
+        """Compacts each collection whose log outgrows the compaction threshold."""
+        while True:
+            for store in list(self.stores.values()):
+                if store.needs_compaction(self.compaction_threshold_bytes):
+                    try:
+                        store.compact()
+                    except OSError as e:
+                        print(f"Error: compaction of {store.name} failed: {e}")
+            if self._stop_compactor.wait(self.compaction_interval_s):
+                return
@@ -0,0 +1,115 @@
+from typing import List
+from werkzeug.exceptions import BadRequest
+from src.configurations.constants import CATEGORIES
+from src.mappers.category_mapper import CategoriesMapper
+from src.models.category import Category
+from src.interfaces.repositories.categories_repository_interface import ICategoriesRepository
+from src.repositories.record_index import PREFIX_END
+from src.repositories.sqlite_session import SQLiteDatabaseConnection
+
+
+class SQLiteCategoriesRepository(ICategoriesRepository):
+
+    def __init__(self, database_connection: SQLiteDatabaseConnection):
+        """
+        Initializes the SQLiteCategoriesRepository.
+
+        Args:
+            database_connection: SQLite database connection instance
+        """
+        self.db: SQLiteDatabaseConnection = database_connection
+
+    def get_version(self) -> str:
+        """
+        Returns the version of the categories collection.
+
+        Returns:
+            A token that changes whenever a category is added, changed or removed
+        """
+        return self.db.version(CATEGORIES)
+
+    def get_all(self) -> List[Category]:
+        """
+        Retrieves all categories and maps them to Category objects.
+
+        Returns:
+            List of mapped categories
+        """
+        rows = self.db.connection.execute(f"SELECT id, name FROM {CATEGORIES} ORDER BY id")
+        return [CategoriesMapper.map_raw_data_to_category(dict(row)) for row in rows]
+
+    def suggest(self, prefix: str, limit: int) -> List[Category]:
+        """
+        Retrieves the categories whose name starts with prefix, ignoring case.
+
+        Args:
+            prefix: Beginning of the category name
+            limit: Maximum number of categories returned
+
+        Returns:
+            Matching categories in alphabetical order
+        """
+        rows = self.db.connection.execute(
+            f"SELECT id, name FROM {CATEGORIES} WHERE name COLLATE NOCASE BETWEEN ? AND ? "
+            "ORDER BY name COLLATE NOCASE, id LIMIT ?",
+            (prefix, prefix + PREFIX_END, limit)
+        )
+        return [CategoriesMapper.map_raw_data_to_category(dict(row)) for row in rows]
+
+    def get_one_by_id(self, category_id: int) -> Category:
+        """
+        Retrieves a single category by its ID.
+
+        Args:
+            category_id: The category identifier
+
+        Returns:
+            Category object if found, None otherwise
+        """
+        row = self.db.connection.execute(
+            f"SELECT id, name FROM {CATEGORIES} WHERE id = ?", (category_id,)
+        ).fetchone()
+
+        return CategoriesMapper.map_raw_data_to_category(dict(row)) if row else None
+
+    def add_one(self, category: Category) -> Category:
+        """
+        Adds a new Category to the database.
+
+        Args:
+            category: Category object to add
+
+        Returns:
+            The added Category with ID
+
+        Raises:
+            BadRequest: If Category already exists
+        """
+        with self.db.transaction() as connection:
+            category_exists = connection.execute(
+                f"SELECT 1 FROM {CATEGORIES} WHERE name = ?", (category.name,)
+            ).fetchone()
+            if category_exists:
+                raise BadRequest(f"Category '{category.name}' exist")
+
+            cursor = connection.execute(f"INSERT INTO {CATEGORIES} (name) VALUES (?)", (category.name,))
+            category.id = cursor.lastrowid
+
+        return category
+
+    def delete_one(self, category: Category) -> bool:
+        """
+        Delete a Category from the database.
+
+        Args:
+            category: Category object to delete
+
+        Raises:
+            BadRequest: If Category does not exist
+        """
+        with self.db.transaction() as connection:
+            cursor = connection.execute(f"DELETE FROM {CATEGORIES} WHERE name = ?", (category.name,))
+            if cursor.rowcount == 0:
+                raise BadRequest(f"Category '{category.name}' doesnt exist")
+
+        return True
@@ -0,0 +1,54 @@
+from typing import List
+from werkzeug.exceptions import BadRequest
+from src.configurations.constants import FAVORITES, PRODUCTS
+from src.mappers.favorite_mapper import FavoriteMapper
+from src.models.favorite import Favorite
+from src.interfaces.repositories.favorites_repository_interface import IFavoritesRepository
+from src.repositories.sqlite_session import SQLiteDatabaseConnection
+
+
+class SQLiteFavoritesRepository(IFavoritesRepository):
+
+    def __init__(self, database_connection: SQLiteDatabaseConnection):
+        self.db: SQLiteDatabaseConnection = database_connection
+
+    def get_version(self) -> str:
+        return self.db.version(FAVORITES)
+
+    def get_all(self) -> List[Favorite]:
+        rows = self.db.connection.execute(f"SELECT user_id, product_id FROM {FAVORITES}")
+        return [FavoriteMapper.map_raw_data_to_favorite(dict(row)) for row in rows]
+
+    def get_by_user(self, user_id: int) -> List[Favorite]:
+        rows = self.db.connection.execute(
+            f"SELECT user_id, product_id FROM {FAVORITES} WHERE user_id = ?", (user_id,)
+        )
+        return [FavoriteMapper.map_raw_data_to_favorite(dict(row)) for row in rows]
+
+    def add_one(self, favorite: Favorite) -> Favorite:
+        with self.db.transaction() as connection:
+            product_exists = connection.execute(
+                f"SELECT 1 FROM {PRODUCTS} WHERE id = ?", (favorite.product_id,)
+            ).fetchone()
+            if not product_exists:
+                raise BadRequest(f"Product with id {favorite.product_id} does not exist")
+
+            cursor = connection.execute(
+                f"INSERT OR IGNORE INTO {FAVORITES} (user_id, product_id) VALUES (?, ?)",
+                (favorite.user_id, favorite.product_id)
+            )
+            if cursor.rowcount == 0:
+                raise BadRequest("Favorite already exists for this user and product")
+
+        return favorite
+
+    def delete_one(self, favorite: Favorite) -> bool:
+        with self.db.transaction() as connection:
+            cursor = connection.execute(
+                f"DELETE FROM {FAVORITES} WHERE user_id = ? AND product_id = ?",
+                (favorite.user_id, favorite.product_id)
+            )
+            if cursor.rowcount == 0:
+                raise BadRequest("Favorite does not exist")
+
+        return True
@@ -0,0 +1,156 @@
+from typing import List
+from werkzeug.exceptions import BadRequest
+from src.configurations.constants import CATEGORIES, PRODUCTS
+from src.enums.product_sort import ProductSort
+from src.interfaces.repositories.products_repository_interface import IProductsRepository
+from src.models.product import Product
+from src.mappers.products_mapper import ProductsMapper
+from src.repositories.record_index import PREFIX_END
+from src.repositories.sqlite_session import PRODUCTS_SEARCH, SQLiteDatabaseConnection
+from src.utils.common import Common
+
+ORDER_BY = {
+    None: "id",
+    ProductSort.PRICE: "price, id",
+    ProductSort.PRICE_DESC: "price DESC, id DESC",
+    ProductSort.NAME: "name COLLATE NOCASE, id",
+}
+
+
+class SQLiteProductsRepository(IProductsRepository):
+
+    def __init__(self, database_connection: SQLiteDatabaseConnection):
+        """
+        Initializes the SQLiteProductsRepository.
+
+        Args:
+            database_connection: SQLite database connection instance
+        """
+        self.db: SQLiteDatabaseConnection = database_connection
+
+    def get_version(self) -> str:
+        """
+        Returns the version of the products collection.
+
+        Returns:
+            A token that changes whenever a product is added, changed or removed
+        """
+        return self.db.version(PRODUCTS)
+
+    def get_all(self, category_filter: str = None, min_price: float = None, max_price: float = None,
+                sort: ProductSort = None) -> List[Product]:
+        """
+        Retrieves all products and maps them to Product objects.
+
+        Args:
+            category_filter: Optional category to filter products
+            min_price: Optional lowest price included
+            max_price: Optional highest price included
+            sort: Optional ordering of the products
+
+        Returns:
+            List of mapped products
+        """
+        conditions, parameters = [], []
+        if category_filter:
+            conditions.append("category = ?")
+            parameters.append(category_filter)
+        if min_price is not None:
+            conditions.append("price >= ?")
+            parameters.append(min_price)
+        if max_price is not None:
+            conditions.append("price <= ?")
+            parameters.append(max_price)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.db.connection.execute(
+            f"SELECT id, name, category, price FROM {PRODUCTS}{where} ORDER BY {ORDER_BY[sort]}",
+            parameters
+        )
+
+        return [ProductsMapper.map_raw_data_to_product(dict(row)) for row in rows]
+
+    def search(self, query: str, limit: int) -> List[Product]:
+        """
+        Searches products through the full-text index of names and categories.
+
+        Args:
+            query: Search text
+            limit: Maximum number of products returned
+
+        Returns:
+            Matching products, best BM25 rank first, names weighing twice as much as categories
+        """
+        terms = set(Common.tokenize(query))
+        if not terms:
+            return []
+
+        rows = self.db.connection.execute(
+            f"SELECT p.id, p.name, p.category, p.price FROM {PRODUCTS_SEARCH} "
+            f"JOIN {PRODUCTS} p ON p.id = {PRODUCTS_SEARCH}.rowid "
+            f"WHERE {PRODUCTS_SEARCH} MATCH ? ORDER BY bm25({PRODUCTS_SEARCH}, 2.0, 1.0), p.id LIMIT ?",
+            (" OR ".join(f'"{term}"' for term in sorted(terms)), limit)
+        )
+        return [ProductsMapper.map_raw_data_to_product(dict(row)) for row in rows]
+
+    def suggest(self, prefix: str, limit: int) -> List[Product]:
+        """
+        Retrieves the products whose name starts with prefix, ignoring case.
+
+        Args:
+            prefix: Beginning of the product name
+            limit: Maximum number of products returned
+
+        Returns:
+            Matching products in alphabetical order
+        """
+        rows = self.db.connection.execute(
+            f"SELECT id, name, category, price FROM {PRODUCTS} WHERE name COLLATE NOCASE BETWEEN ? AND ? "
+            "ORDER BY name COLLATE NOCASE, id LIMIT ?",
+            (prefix, prefix + PREFIX_END, limit)
+        )
+        return [ProductsMapper.map_raw_data_to_product(dict(row)) for row in rows]
+
+    def get_one_by_id(self, product_id: int) -> Product:
+        """
+        Retrieves a single product by its ID.
+
+        Args:
+            product_id: The product identifier
+
+        Returns:
+            Product object if found, None otherwise
+        """
+        row = self.db.connection.execute(
+            f"SELECT id, name, category, price FROM {PRODUCTS} WHERE id = ?", (product_id,)
+        ).fetchone()
+
+        return ProductsMapper.map_raw_data_to_product(dict(row)) if row else None
+
+    def add_one(self, product: Product) -> Product:
+        """
+        Adds a new product to the database.
+
+        Args:
+            product: Product object to add
+
+        Returns:
+            The added product with ID
+
+        Raises:
+            BadRequest: If category does not exist
+        """
+        with self.db.transaction() as connection:
+            category_exists = connection.execute(
+                f"SELECT 1 FROM {CATEGORIES} WHERE name = ?", (product.category,)
+            ).fetchone()
+            if not category_exists:
+                raise BadRequest(f"Category '{product.category}' does not exist")
+
+            cursor = connection.execute(
+                f"INSERT INTO {PRODUCTS} (name, category, price) VALUES (?, ?, ?)",
+                (product.name, product.category, product.price)
+            )
+            product.id = cursor.lastrowid
+
+        return product
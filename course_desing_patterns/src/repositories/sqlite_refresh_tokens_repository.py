@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Optional
+from src.configurations.constants import REFRESH_TOKENS
+from src.interfaces.repositories.refresh_tokens_repository_interface import IRefreshTokensRepository
+from src.mappers.refresh_token_mapper import RefreshTokenMapper
+from src.models.refresh_token import RefreshToken
+from src.repositories.refresh_tokens_repository import EXPIRED_TOKENS_PURGE_BATCH
+from src.repositories.sqlite_session import SQLiteDatabaseConnection
+
+
+class SQLiteRefreshTokensRepository(IRefreshTokensRepository):
+
+    def __init__(self, database_connection: SQLiteDatabaseConnection):
+        """
+        Initializes the SQLiteRefreshTokensRepository.
+
+        Args:
+            database_connection: SQLite database connection instance
+        """
+        self.db: SQLiteDatabaseConnection = database_connection
+
+    def get_by_token_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        """
+        Retrieves a single refresh token by the hash of its value.
+
+        Args:
+            token_hash: Hash of the refresh token
+
+        Returns:
+            RefreshToken object if found, None otherwise
+        """
+        row = self.db.connection.execute(
+            f"SELECT id, token_hash, user_id, expires_at, created_at FROM {REFRESH_TOKENS} WHERE token_hash = ?",
+            (token_hash,)
+        ).fetchone()
+
+        return RefreshTokenMapper.map_raw_data_to_refresh_token(dict(row)) if row else None
+
+    def add_one(self, refresh_token: RefreshToken) -> RefreshToken:
+        """
+        Adds a new refresh token to the database.
+
+        Up to EXPIRED_TOKENS_PURGE_BATCH expired tokens are deleted in the same
+        transaction, so tokens that are never presented again do not pile up.
+
+        Args:
+            refresh_token: RefreshToken object to add
+
+        Returns:
+            The added refresh token with ID
+        """
+        with self.db.transaction() as connection:
+            connection.execute(
+                f"DELETE FROM {REFRESH_TOKENS} WHERE id IN "
+                f"(SELECT id FROM {REFRESH_TOKENS} WHERE expires_at <= ? ORDER BY expires_at LIMIT ?)",
+                (datetime.utcnow().isoformat(), EXPIRED_TOKENS_PURGE_BATCH)
+            )
+            cursor = connection.execute(
+                f"INSERT INTO {REFRESH_TOKENS} (token_hash, user_id, expires_at, created_at) "
+                "VALUES (:token_hash, :user_id, :expires_at, :created_at)",
+                RefreshTokenMapper.to_dict(refresh_token)
+            )
+
+        refresh_token.id = cursor.lastrowid
+        return refresh_token
+
+    def delete_one(self, refresh_token: RefreshToken) -> bool:
+        """
+        Revokes a refresh token by deleting it.
+
+        Args:
+            refresh_token: RefreshToken object to revoke
+
+        Returns:
+            True if the token was revoked, False if it no longer existed
+        """
+        with self.db.transaction() as connection:
+            cursor = connection.execute(
+                f"DELETE FROM {REFRESH_TOKENS} WHERE token_hash = ?", (refresh_token.token_hash,)
+            )
+
+        return cursor.rowcount > 0
+
+    def delete_by_user(self, user_id: int) -> int:
+        """
+        Revokes every refresh token of a user.
+
+        Args:
+            user_id: The user identifier
+
+        Returns:
+            Number of refresh tokens revoked
+        """
+        with self.db.transaction() as connection:
+            cursor = connection.execute(f"DELETE FROM {REFRESH_TOKENS} WHERE user_id = ?", (user_id,))
+
+        return cursor.rowcount
@@ -0,0 +1,271 @@
+import atexit
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from src.configurations.constants import CATEGORIES, FAVORITES, PRODUCTS, REFRESH_TOKENS, USERS
+from src.interfaces.repositories.session_interface import IDatabaseConnection
+from src.repositories.session import DatabaseConnection
+
+PRODUCTS_SEARCH = f"{PRODUCTS}_search"
+COLLECTION_VERSIONS = "collection_versions"
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {CATEGORIES} (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE INDEX IF NOT EXISTS idx_{CATEGORIES}_name ON {CATEGORIES} (name COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS {PRODUCTS} (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    price REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_{PRODUCTS}_category ON {PRODUCTS} (category);
+CREATE INDEX IF NOT EXISTS idx_{PRODUCTS}_price ON {PRODUCTS} (price);
+CREATE INDEX IF NOT EXISTS idx_{PRODUCTS}_name ON {PRODUCTS} (name COLLATE NOCASE);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS {PRODUCTS_SEARCH} USING fts5(
+    name, category, content='{PRODUCTS}', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS {PRODUCTS_SEARCH}_insert AFTER INSERT ON {PRODUCTS} BEGIN
+    INSERT INTO {PRODUCTS_SEARCH} (rowid, name, category) VALUES (new.id, new.name, new.category);
+END;
+CREATE TRIGGER IF NOT EXISTS {PRODUCTS_SEARCH}_delete AFTER DELETE ON {PRODUCTS} BEGIN
+    INSERT INTO {PRODUCTS_SEARCH} ({PRODUCTS_SEARCH}, rowid, name, category)
+    VALUES ('delete', old.id, old.name, old.category);
+END;
+CREATE TRIGGER IF NOT EXISTS {PRODUCTS_SEARCH}_update AFTER UPDATE ON {PRODUCTS} BEGIN
+    INSERT INTO {PRODUCTS_SEARCH} ({PRODUCTS_SEARCH}, rowid, name, category)
+    VALUES ('delete', old.id, old.name, old.category);
+    INSERT INTO {PRODUCTS_SEARCH} (rowid, name, category) VALUES (new.id, new.name, new.category);
+END;
+
+CREATE TABLE IF NOT EXISTS {FAVORITES} (
+    user_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    PRIMARY KEY (user_id, product_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_{FAVORITES}_product_id ON {FAVORITES} (product_id);
+
+CREATE TABLE IF NOT EXISTS {USERS} (
+    id INTEGER PRIMARY KEY,
+    email TEXT NOT NULL UNIQUE,
+    password TEXT NOT NULL,
+    name TEXT NOT NULL,
+    role TEXT NOT NULL,
+    created_at TEXT,
+    updated_at TEXT,
+    is_active INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS {REFRESH_TOKENS} (
+    id INTEGER PRIMARY KEY,
+    token_hash TEXT NOT NULL UNIQUE,
+    user_id INTEGER NOT NULL,
+    expires_at TEXT NOT NULL,
+    created_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_{REFRESH_TOKENS}_user_id ON {REFRESH_TOKENS} (user_id);
+CREATE INDEX IF NOT EXISTS idx_{REFRESH_TOKENS}_expires_at ON {REFRESH_TOKENS} (expires_at);
+
+CREATE TABLE IF NOT EXISTS {COLLECTION_VERSIONS} (
+    name TEXT PRIMARY KEY,
+    generation TEXT NOT NULL DEFAULT (lower(hex(randomblob(16)))),
+    version INTEGER NOT NULL DEFAULT 0
+);
+""" + "".join(f"""
+INSERT OR IGNORE INTO {COLLECTION_VERSIONS} (name) VALUES ('{table}');
+""" + "".join(f"""
+CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()} AFTER {event} ON {table} BEGIN
+    UPDATE {COLLECTION_VERSIONS} SET version = version + 1 WHERE name = '{table}';
+END;
+""" for event in ("INSERT", "UPDATE", "DELETE")) for table in (CATEGORIES, PRODUCTS, FAVORITES, USERS))
+SCHEMA_VERSION = 1
+
+SQLITE_POOL_SIZE = 8
+
+SEED_COLUMNS = {
+    CATEGORIES: ["id", "name"],
+    PRODUCTS: ["id", "name", "category", "price"],
+    FAVORITES: ["user_id", "product_id"],
+    USERS: ["id", "email", "password", "name", "role", "created_at", "updated_at", "is_active"],
+}
+
+
+class SQLiteDatabaseConnection(IDatabaseConnection):
+    """
+    SQLite database in WAL journal mode.
+
+    Each thread gets its own sqlite3 connection, so readers run concurrently
+    with the single writer. Statements are parameterized constant strings,
+    which sqlite3 prepares once and reuses from its per-connection cache.
+
+    A thread releases its connection when it is done with the database,
+    such as at the end of a request. Up to pool_size released connections
+    are kept open for the next threads, so with short-lived threads the
+    open connections follow the busy threads instead of every thread
+    that ever ran.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, db_file_path, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, db_file_path, seed_json_file_path: Optional[str] = None,
+                 pool_size: int = SQLITE_POOL_SIZE):
+        if getattr(self, "_initialized", False):
+            return
+        self.db_file_path = db_file_path
+        self.seed_json_file_path = seed_json_file_path
+        self.pool_size = pool_size
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._idle_connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._initialized = True
+
+    def connect(self):
+        connection = self.connection
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+
+        if self.seed_json_file_path and self._is_empty():
+            self._seed(self.seed_json_file_path)
+        self._migrate()
+        self.release()
+
+        atexit.register(self.close)
+
+    def close(self):
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+            self._idle_connections.clear()
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Returns the sqlite3 connection of the calling thread, taking an idle one or opening one on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            with self._connections_lock:
+                connection = self._idle_connections.pop() if self._idle_connections else None
+            if connection is None:
+                connection = self._open_connection()
+            self._local.connection = connection
+        return connection
+
+    def release(self) -> None:
+        """
+        Gives back the connection of the calling thread, which takes a
+        connection again the next time it uses the database.
+
+        The connection is kept for other threads while fewer than pool_size
+        are idle, and closed otherwise.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            return
+        self._local.connection = None
+        if connection.in_transaction:
+            connection.execute("ROLLBACK")
+
+        with self._connections_lock:
+            if len(self._idle_connections) < self.pool_size:
+                self._idle_connections.append(connection)
+                return
+            self._connections.remove(connection)
+        connection.close()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_file_path, isolation_level=None, check_same_thread=False,
+                                     timeout=5, cached_statements=256)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        with self._connections_lock:
+            self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Runs the enclosed statements in one write transaction.
+
+        The write lock is taken up front (BEGIN IMMEDIATE) so a transaction
+        that reads before writing cannot deadlock with another writer.
+        """
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def version(self, collection: str) -> str:
+        """
+        Returns the version of a table, bumped by triggers on every change
+        made through any connection.
+
+        Args:
+            collection: Table name
+
+        Returns:
+            A token that changes whenever the rows of the table change
+        """
+        row = self.connection.execute(
+            f"SELECT generation, version FROM {COLLECTION_VERSIONS} WHERE name = ?", (collection,)
+        ).fetchone()
+        return f"{row['generation']}.{row['version']}"
+
+    def _migrate(self) -> None:
+        """Fills the structures added to the schema after a database file was created."""
+        with self.transaction() as connection:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version < 1:
+                connection.execute(f"INSERT INTO {PRODUCTS_SEARCH} ({PRODUCTS_SEARCH}) VALUES ('rebuild')")
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _is_empty(self) -> bool:
+        return all(
+            self.connection.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is None
+            for table in SEED_COLUMNS
+        )
+
+    def _seed(self, json_file_path: str) -> None:
+        """
+        Imports the collections of the JSON database into the empty tables.
+
+        The JSON database is read the way its own backend reads it: from the
+        per-collection snapshots with their logs replayed, which a single-file
+        db.json is split into first. Once split, db.json no longer receives
+        changes, so it is never imported directly.
+        """
+        json_database = DatabaseConnection(json_file_path)
+        json_database.connect()
+        if json_database.data is None:
+            return
+
+        try:
+            with self.transaction() as connection:
+                for table, columns in SEED_COLUMNS.items():
+                    placeholders = ", ".join("?" for _ in columns)
+                    connection.executemany(
+                        f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                        ([record.get(column) for column in columns] for record in json_database.data.get(table, []))
+                    )
+        finally:
+            json_database.close()
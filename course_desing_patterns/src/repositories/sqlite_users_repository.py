@@ -0,0 +1,232 @@
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from datetime import datetime
+from werkzeug.exceptions import BadRequest
+from src.configurations.constants import USERS
+from src.interfaces.repositories.users_repository_interface import IUsersRepository
+from src.models.user import User
+from src.mappers.user_mapper import UserMapper
+from src.repositories.bloom_filter import BLOOM_FILTER_FP_RATE, BloomFilter
+from src.repositories.sqlite_session import SQLiteDatabaseConnection
+
+USER_COLUMNS = "id, email, password, name, role, created_at, updated_at, is_active"
+
+
+class SQLiteUsersRepository(IUsersRepository):
+
+    def __init__(self, database_connection: SQLiteDatabaseConnection,
+                 email_filter_fp_rate: float = BLOOM_FILTER_FP_RATE):
+        """
+        Initializes the SQLiteUsersRepository.
+
+        Args:
+            database_connection: SQLite database connection instance
+            email_filter_fp_rate: Target false-positive rate of the registered emails filter
+        """
+        self.db: SQLiteDatabaseConnection = database_connection
+        self._listeners: List[Callable[[int], None]] = []
+        self.email_filter_fp_rate = email_filter_fp_rate
+        self._email_filter: Optional[BloomFilter] = None
+        self._email_filter_lock = threading.Lock()
+
+    def get_all(self) -> List[User]:
+        """
+        Retrieves all users and maps them to User objects.
+
+        Returns:
+            List of mapped users
+        """
+        rows = self.db.connection.execute(f"SELECT {USER_COLUMNS} FROM {USERS} ORDER BY id")
+        return [UserMapper.map_raw_data_to_user(self._row_to_dict(row)) for row in rows]
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Retrieves a single user by its ID.
+
+        Args:
+            user_id: The user identifier
+
+        Returns:
+            User object if found, None otherwise
+        """
+        row = self.db.connection.execute(
+            f"SELECT {USER_COLUMNS} FROM {USERS} WHERE id = ?", (user_id,)
+        ).fetchone()
+
+        return UserMapper.map_raw_data_to_user(self._row_to_dict(row)) if row else None
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        """
+        Retrieves a single user by email.
+
+        Args:
+            email: The user email
+
+        Returns:
+            User object if found, None otherwise
+        """
+        row = self.db.connection.execute(
+            f"SELECT {USER_COLUMNS} FROM {USERS} WHERE email = ?", (email.lower(),)
+        ).fetchone()
+
+        return UserMapper.map_raw_data_to_user(self._row_to_dict(row)) if row else None
+
+    def add_one(self, user: User) -> User:
+        """
+        Adds a new user to the database.
+
+        Args:
+            user: User object to add
+
+        Returns:
+            The added user with ID
+
+        Raises:
+            BadRequest: If email already exists
+        """
+        if not user.created_at:
+            user.created_at = datetime.utcnow()
+
+        user_dict = UserMapper.to_dict(user)
+        try:
+            with self.db.transaction() as connection:
+                cursor = connection.execute(
+                    f"INSERT INTO {USERS} (email, password, name, role, created_at, updated_at, is_active) "
+                    "VALUES (:email, :password, :name, :role, :created_at, :updated_at, :is_active)",
+                    user_dict
+                )
+        except sqlite3.IntegrityError:
+            raise BadRequest(f"Email '{user.email}' is already registered")
+
+        user.id = cursor.lastrowid
+        self._add_to_email_filter(user.email)
+        return user
+
+    def update_one(self, user: User) -> User:
+        """
+        Updates an existing user in the database.
+
+        Args:
+            user: User object with updated data
+
+        Returns:
+            The updated user
+
+        Raises:
+            BadRequest: If user not found
+        """
+        user.updated_at = datetime.utcnow()
+
+        user_dict = UserMapper.to_dict(user)
+        with self.db.transaction() as connection:
+            cursor = connection.execute(
+                f"UPDATE {USERS} SET email = :email, password = :password, name = :name, role = :role, "
+                "created_at = :created_at, updated_at = :updated_at, is_active = :is_active WHERE id = :id",
+                user_dict
+            )
+            if cursor.rowcount == 0:
+                raise BadRequest(f"User with ID {user.id} not found")
+
+        self._notify(user.id)
+        return user
+
+    def delete_one(self, user_id: int) -> bool:
+        """
+        Deletes (deactivates) a user from the database.
+        Performs a soft delete by setting is_active to False.
+
+        Args:
+            user_id: The user identifier
+
+        Returns:
+            True if deletion successful
+
+        Raises:
+            BadRequest: If user not found
+        """
+        with self.db.transaction() as connection:
+            cursor = connection.execute(
+                f"UPDATE {USERS} SET is_active = 0, updated_at = ? WHERE id = ?",
+                (datetime.utcnow().isoformat(), user_id)
+            )
+            if cursor.rowcount == 0:
+                raise BadRequest(f"User with ID {user_id} not found")
+
+        self._notify(user_id)
+        return True
+
+
+    def is_email_registered(self, email: str) -> bool:
+        """
+        Checks whether an email is registered, answering from the registered
+        emails filter when it rules the email out and with an exact lookup
+        otherwise.
+
+        The filter can miss emails registered by other processes or while it
+        was being rebuilt, so add_one still checks for duplicates itself.
+
+        Args:
+            email: The user email
+
+        Returns:
+            True if a user has the email
+        """
+        email = email.lower()
+        email_filter = self._get_email_filter()
+        if not email_filter.might_contain(email):
+            return False
+
+        registered = self.get_by_email(email) is not None
+        if not registered:
+            email_filter.record_false_positive()
+        return registered
+
+    def email_filter_stats(self) -> Dict[str, Any]:
+        """
+        Returns the sizing of the registered emails filter with its expected
+        and measured false-positive rates, for tuning email_filter_fp_rate.
+        """
+        return self._get_email_filter().stats()
+
+    def _get_email_filter(self) -> BloomFilter:
+        """Returns the registered emails filter, building it over every user on first use."""
+        email_filter = self._email_filter
+        if email_filter is None:
+            with self._email_filter_lock:
+                if self._email_filter is None:
+                    self._email_filter = BloomFilter.build(self._iter_emails(), self.email_filter_fp_rate)
+                email_filter = self._email_filter
+        return email_filter
+
+    def _add_to_email_filter(self, email: str) -> None:
+        """Adds a registered email to the filter, dropping the filter to be rebuilt larger once full."""
+        email_filter = self._email_filter
+        if email_filter is None:
+            return
+        email_filter.add(email.lower())
+        if email_filter.is_full():
+            self._email_filter = None
+
+    def _iter_emails(self) -> Iterator[str]:
+        for row in self.db.connection.execute(f"SELECT email FROM {USERS}"):
+            yield row['email'].lower()
+
+    def subscribe(self, listener: Callable[[int], None]) -> None:
+        """
+        Registers a function called with the ID of every user updated or
+        deleted through this repository, once the change is committed.
+
+        Args:
+            listener: Function receiving the user ID
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, user_id: int) -> None:
+        for listener in self._listeners:
+            listener(user_id)
+
+    def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        raw_user = dict(row)
+        raw_user['is_active'] = bool(raw_user['is_active'])
+        return raw_user
@@ -1,5 +1,5 @@
-import json
-from typing import List, Optional
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from datetime import datetime
 from werkzeug.exceptions import BadRequest
 from src.configurations.constants import USERS
@@ -7,18 +7,33 @@ from src.interfaces.repositories.users_repository_interface import IUsersReposit
 from src.interfaces.repositories.session_interface import IDatabaseConnection
 from src.models.user import User
 from src.mappers.user_mapper import UserMapper
+from src.repositories.bloom_filter import BLOOM_FILTER_FP_RATE, BloomFilter
+from src.repositories.model_cache import ModelCache
 
 
 class UsersRepository(IUsersRepository):
 
-    def __init__(self, database_connection: IDatabaseConnection):
+    def __init__(self, database_connection: IDatabaseConnection,
+                 email_filter_fp_rate: float = BLOOM_FILTER_FP_RATE):
         """
         Initializes the UsersRepository.
         
         Args:
             database_connection: Database connection instance
+            email_filter_fp_rate: Target false-positive rate of the registered emails filter
         """
         self.db: IDatabaseConnection = database_connection
+        self.cache: ModelCache[User] = ModelCache(UserMapper.map_raw_data_to_user, lambda: self.db.epoch(USERS))
+        self._listeners: List[Callable[[int], None]] = []
+        self.email_filter_fp_rate = email_filter_fp_rate
+        self._email_filter: Optional[BloomFilter] = None
+        self._email_filter_lock = threading.Lock()
+        self.db.create_index(USERS, 'email', self._normalized_email)
+
+    @staticmethod
+    def _normalized_email(raw_user: dict) -> Optional[str]:
+        email = raw_user.get('email')
+        return email.lower() if email else None
     
     def get_all(self) -> List[User]:
         """
@@ -29,7 +44,7 @@ class UsersRepository(IUsersRepository):
         """
         if self.db.data:
             raw_users = self.db.data.get(USERS, [])
-            users = list(map(UserMapper.map_raw_data_to_user, raw_users))
+            users = self.cache.map_all(raw_users, complete=True)
             return users
         
         return []
@@ -45,10 +60,9 @@ class UsersRepository(IUsersRepository):
             User object if found, None otherwise
         """
         if self.db.data:
-            raw_users = self.db.data.get(USERS, [])
-            for raw_user in raw_users:
-                if raw_user.get('id') == user_id:
-                    return UserMapper.map_raw_data_to_user(raw_user)
+            raw_user = self.db.find_one(USERS, 'id', user_id)
+            if raw_user is not None:
+                return self.cache.get(raw_user)
         
         return None
 
@@ -63,10 +77,9 @@ class UsersRepository(IUsersRepository):
             User object if found, None otherwise
         """
         if self.db.data:
-            raw_users = self.db.data.get(USERS, [])
-            for raw_user in raw_users:
-                if raw_user.get('email') == email.lower():
-                    return UserMapper.map_raw_data_to_user(raw_user)
+            raw_user = self.db.find_one(USERS, 'email', email.lower())
+            if raw_user is not None:
+                return self.cache.get(raw_user)
         
         return None
 
@@ -86,26 +99,21 @@ class UsersRepository(IUsersRepository):
         if not self.db.data:
             return None
         
-        users = self.db.data.get(USERS, [])
-        
-        existing_emails = [u.get('email') for u in users]
-        if user.email.lower() in existing_emails:
-            raise BadRequest(f"Email '{user.email}' is already registered")
-        
-        new_id = max([u.get('id', 0) for u in users], default=0) + 1
-        user.id = new_id
-        
-        if not user.created_at:
-            user.created_at = datetime.utcnow()
-        
-        user_dict = UserMapper.to_dict(user)
-        
-        users.append(user_dict)
-        self.db.data[USERS] = users
-        
-        with open(self.db.json_file_path, 'w') as json_file:
-            json.dump(self.db.data, json_file, indent=4)
+        with self.db.transaction(USERS):
+            if self.db.find_one(USERS, 'email', user.email.lower()) is not None:
+                raise BadRequest(f"Email '{user.email}' is already registered")
+            
+            new_id = self.db.next_id(USERS)
+            user.id = new_id
+            
+            if not user.created_at:
+                user.created_at = datetime.utcnow()
+            
+            user_dict = UserMapper.to_dict(user)
+            
+            self.db.insert(USERS, user_dict, key={'id': user.id})
         
+        self._add_to_email_filter(user.email)
         return user
 
     def update_one(self, user: User) -> User:
@@ -124,27 +132,18 @@ class UsersRepository(IUsersRepository):
         if not self.db.data:
             return None
         
-        users = self.db.data.get(USERS, [])
-        
-        user_index = None
-        for i, raw_user in enumerate(users):
-            if raw_user.get('id') == user.id:
-                user_index = i
-                break
-        
-        if user_index is None:
-            raise BadRequest(f"User with ID {user.id} not found")
-        
-        user.updated_at = datetime.utcnow()
-        
-        user_dict = UserMapper.to_dict(user)
-        users[user_index] = user_dict
-        
-        self.db.data[USERS] = users
-        
-        with open(self.db.json_file_path, 'w') as json_file:
-            json.dump(self.db.data, json_file, indent=4)
+        with self.db.transaction(USERS):
+            raw_user = self.db.find_one(USERS, 'id', user.id)
+            if raw_user is None:
+                raise BadRequest(f"User with ID {user.id} not found")
+            
+            user.updated_at = datetime.utcnow()
+            
+            user_dict = UserMapper.to_dict(user)
+            self.db.update(USERS, user_dict, key={'id': user.id})
+            self.cache.discard(raw_user)
         
+        self._notify(user.id)
         return user
 
     def delete_one(self, user_id: int) -> bool:
@@ -164,22 +163,85 @@ class UsersRepository(IUsersRepository):
         if not self.db.data:
             return False
         
-        users = self.db.data.get(USERS, [])
-        
-        user_found = False
-        for user_dict in users:
-            if user_dict.get('id') == user_id:
-                user_dict['is_active'] = False
-                user_dict['updated_at'] = datetime.utcnow().isoformat()
-                user_found = True
-                break
-        
-        if not user_found:
-            raise BadRequest(f"User with ID {user_id} not found")
-        
-        self.db.data[USERS] = users
-        
-        with open(self.db.json_file_path, 'w') as json_file:
-            json.dump(self.db.data, json_file, indent=4)
+        with self.db.transaction(USERS):
+            user_dict = self.db.find_one(USERS, 'id', user_id)
+            if user_dict is None:
+                raise BadRequest(f"User with ID {user_id} not found")
+            
+            self.cache.discard(user_dict)
+            user_dict = {**user_dict, 'is_active': False, 'updated_at': datetime.utcnow().isoformat()}
+            self.db.update(USERS, user_dict, key={'id': user_id})
         
+        self._notify(user_id)
         return True
+
+    def is_email_registered(self, email: str) -> bool:
+        """
+        Checks whether an email is registered, answering from the registered
+        emails filter when it rules the email out and with an exact lookup
+        otherwise.
+
+        The filter can miss emails registered by other processes or while it
+        was being rebuilt, so add_one still checks for duplicates itself.
+
+        Args:
+            email: The user email
+
+        Returns:
+            True if a user has the email
+        """
+        email = email.lower()
+        email_filter = self._get_email_filter()
+        if not email_filter.might_contain(email):
+            return False
+
+        registered = self.get_by_email(email) is not None
+        if not registered:
+            email_filter.record_false_positive()
+        return registered
+
+    def email_filter_stats(self) -> Dict[str, Any]:
+        """
+        Returns the sizing of the registered emails filter with its expected
+        and measured false-positive rates, for tuning email_filter_fp_rate.
+        """
+        return self._get_email_filter().stats()
+
+    def _get_email_filter(self) -> BloomFilter:
+        """Returns the registered emails filter, building it over every user on first use."""
+        email_filter = self._email_filter
+        if email_filter is None:
+            with self._email_filter_lock:
+                if self._email_filter is None:
+                    self._email_filter = BloomFilter.build(self._iter_emails(), self.email_filter_fp_rate)
+                email_filter = self._email_filter
+        return email_filter
+
+    def _add_to_email_filter(self, email: str) -> None:
+        """Adds a registered email to the filter, dropping the filter to be rebuilt larger once full."""
+        email_filter = self._email_filter
+        if email_filter is None:
+            return
+        email_filter.add(email.lower())
+        if email_filter.is_full():
+            self._email_filter = None
+
+    def _iter_emails(self) -> Iterator[str]:
+        for raw_user in self.db.data.get(USERS, []) if self.db.data else []:
+            email = self._normalized_email(raw_user)
+            if email:
+                yield email
+
+    def subscribe(self, listener: Callable[[int], None]) -> None:
+        """
+        Registers a function called with the ID of every user updated or
+        deleted through this repository, once the change is committed.
+
+        Args:
+            listener: Function receiving the user ID
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, user_id: int) -> None:
+        for listener in self._listeners:
+            listener(user_id)
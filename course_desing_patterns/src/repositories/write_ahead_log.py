@@ -0,0 +1,299 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Tuple
+
+from src.enums.durability import Durability
+
+
+class WriteAheadLog:
+    """
+    Append-only log of mutations applied on top of a JSON snapshot.
+
+    Each mutation is stored as one compact JSON document per line, so a write
+    costs the size of the changed record instead of the size of the database.
+
+    Writes are scheduled according to the durability mode:
+        FSYNC: every append is written and fsynced before returning.
+        GROUP_COMMIT: appends are coalesced by a background flusher into one
+            write + fsync; callers wait until their batch is on disk.
+        ASYNC: appends are coalesced like GROUP_COMMIT but callers return
+            immediately.
+
+    Compaction rotates the live log into an archive segment; the archive is
+    replayed before the live log until the new snapshot is safely in place.
+
+    end_offset is the offset the live log reaches once the appends made
+    through this instance are written, pending ones included.
+    """
+
+    def __init__(self, log_file_path: str, durability: Durability = Durability.GROUP_COMMIT,
+                 commit_window_ms: float = 5, commit_max_records: int = 100):
+        """
+        Initializes the WriteAheadLog.
+
+        Args:
+            log_file_path: Path of the log file
+            durability: When an append is acknowledged
+            commit_window_ms: How long the flusher waits to coalesce appends
+            commit_max_records: Batch size that triggers a flush before the window ends
+        """
+        self.log_file_path = log_file_path
+        self.archive_file_path = f"{log_file_path}.1"
+        self.durability = durability
+        self.commit_window = commit_window_ms / 1000
+        self.commit_max_records = commit_max_records
+        self._log_file = None
+        self.end_offset = 0
+        self._pending: List[str] = []
+        self._appended = 0
+        self._written = 0
+        self._flushed = 0
+        self._closing = False
+        self._flusher = None
+        self._condition = threading.Condition()
+        self._io_lock = threading.RLock()
+
+    def open(self) -> None:
+        """Opens the log file for appending and starts the flusher."""
+        with self._io_lock, self._condition:
+            if self._log_file is None:
+                self._log_file = self._open_for_append()
+            self._closing = False
+            if self.durability != Durability.FSYNC and self._flusher is None:
+                self._flusher = threading.Thread(target=self._run_flusher, name="wal-flusher", daemon=True)
+                self._flusher.start()
+
+    def close(self) -> None:
+        """Flushes every pending append, stops the flusher and closes the log file."""
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            flusher.join()
+
+        self.flush()
+        with self._io_lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+
+    def append(self, entry: Dict[str, Any]) -> int:
+        """
+        Queues one mutation for the log without waiting for it to be written.
+
+        Args:
+            entry: Mutation to persist
+
+        Returns:
+            Ticket to pass to wait() to honour the durability mode
+        """
+        line = json.dumps(entry, separators=(',', ':')) + '\n'
+        with self._condition:
+            if self._log_file is None or self._closing:
+                raise RuntimeError("Write-ahead log is not open")
+            self._pending.append(line)
+            # json.dumps escapes non-ASCII characters, so one character is one byte.
+            self.end_offset += len(line)
+            self._appended += 1
+            self._condition.notify_all()
+            return self._appended
+
+    def wait(self, ticket: int) -> None:
+        """
+        Blocks until the append identified by ticket is durable enough for the durability mode.
+
+        Args:
+            ticket: Value returned by append()
+        """
+        if self.durability == Durability.FSYNC:
+            self.flush()
+        elif self.durability == Durability.GROUP_COMMIT:
+            with self._condition:
+                while self._flushed < ticket:
+                    self._condition.wait()
+
+    def write(self) -> None:
+        """
+        Hands the pending appends to the operating system in one write, without fsync.
+
+        Once written, appends are visible to other processes reading the log.
+        """
+        with self._io_lock:
+            with self._condition:
+                batch, self._pending = self._pending, []
+                target = self._appended
+
+            if batch and self._log_file is not None:
+                self._log_file.write(''.join(batch))
+                self._log_file.flush()
+
+            with self._condition:
+                self._written = max(self._written, target)
+                self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Writes the pending appends in one write + fsync."""
+        with self._io_lock:
+            self.write()
+            with self._condition:
+                target = self._written
+            if target > self._flushed and self._log_file is not None:
+                os.fsync(self._log_file.fileno())
+
+            with self._condition:
+                self._flushed = max(self._flushed, target)
+                self._condition.notify_all()
+
+    def reopen_if_rotated(self) -> None:
+        """Reopens the live log if another process rotated it since it was opened."""
+        with self._io_lock:
+            if self._log_file is None:
+                return
+            try:
+                rotated = os.stat(self.log_file_path).st_ino != os.fstat(self._log_file.fileno()).st_ino
+            except FileNotFoundError:
+                rotated = True
+            if rotated:
+                self.flush()
+                self._log_file.close()
+                self._log_file = self._open_for_append()
+
+    def read_from(self, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Reads the complete mutations appended to the live log after offset.
+
+        A line still being written by another process is left for the next read.
+
+        Args:
+            offset: Byte offset already applied
+
+        Returns:
+            The new mutations and the offset just after them
+        """
+        entries = []
+        try:
+            with open(self.log_file_path, 'rb') as log_file:
+                log_file.seek(offset)
+                for line in log_file:
+                    if not line.endswith(b'\n'):
+                        break
+                    offset += len(line)
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return entries, offset
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the logged mutations in the order they were appended,
+        starting with the archive segment left by an unfinished compaction.
+
+        Torn lines (crash in the middle of an append) are skipped.
+
+        Returns:
+            Iterator over the logged mutations
+        """
+        for path in (self.archive_file_path, self.log_file_path):
+            yield from self._replay_file(path)
+
+    def replay_archive(self) -> Iterator[Dict[str, Any]]:
+        """Yields the mutations of the archive segment left by an unfinished compaction."""
+        yield from self._replay_file(self.archive_file_path)
+
+    def size(self) -> int:
+        """Returns the number of bytes written to the live log."""
+        try:
+            return os.path.getsize(self.log_file_path)
+        except FileNotFoundError:
+            return 0
+
+    def rotate(self) -> None:
+        """
+        Renames the live log into the archive segment and starts an empty live log.
+
+        Callers flush() beforehand, so rotating costs a rename: only appends
+        written since are fsynced here, and appends still pending go to the
+        new live log. The archive of an unfinished compaction must be
+        discarded first, it is never overwritten.
+
+        Raises:
+            RuntimeError: If the archive segment exists
+        """
+        with self._io_lock:
+            if os.path.exists(self.archive_file_path):
+                raise RuntimeError("Archive segment of an unfinished compaction is still in place")
+
+            was_open = self._log_file is not None
+            if was_open:
+                with self._condition:
+                    written, flushed = self._written, self._flushed
+                if written > flushed:
+                    os.fsync(self._log_file.fileno())
+                    with self._condition:
+                        self._flushed = max(self._flushed, written)
+                        self._condition.notify_all()
+                self._log_file.close()
+                self._log_file = None
+
+            if os.path.exists(self.log_file_path):
+                os.replace(self.log_file_path, self.archive_file_path)
+
+            if was_open:
+                self._log_file = self._open_for_append()
+                with self._condition:
+                    self.end_offset += sum(len(line) for line in self._pending)
+            else:
+                self.end_offset = 0
+
+    def discard_archive(self) -> None:
+        """Deletes the archive segment once a snapshot covering it is in place."""
+        try:
+            os.remove(self.archive_file_path)
+        except FileNotFoundError:
+            pass
+
+    def _run_flusher(self) -> None:
+        """Coalesces appends that arrive within the commit window into one write + fsync."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._written > self._flushed or self._closing)
+                if self._closing:
+                    return
+                self._condition.wait_for(
+                    lambda: self._closing or len(self._pending) >= self.commit_max_records,
+                    timeout=self.commit_window
+                )
+            self.flush()
+
+    def _open_for_append(self):
+        """Opens the live log, terminating a torn last line so new appends start on their own line."""
+        log_file = open(self.log_file_path, 'a+', encoding='utf-8')
+        if log_file.tell() > 0:
+            log_file.seek(log_file.tell() - 1)
+            if log_file.read(1) != '\n':
+                log_file.write('\n')
+                log_file.flush()
+        self.end_offset = log_file.tell()
+        return log_file
+
+    def _replay_file(self, path: str) -> Iterator[Dict[str, Any]]:
+        if not os.path.exists(path):
+            return
+
+        with open(path, 'r', encoding='utf-8') as log_file:
+            for line in log_file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
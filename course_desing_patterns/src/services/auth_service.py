@@ -1,23 +1,41 @@
+import hashlib
 import os
-import bcrypt
+import secrets
 import jwt
 from datetime import datetime, timedelta
 from werkzeug.exceptions import BadRequest, Unauthorized, NotFound
-from src.utils.common import Common
 from src.interfaces.services.auth_service_interface import IAuthService
+from src.interfaces.services.password_service_interface import IPasswordService
 from src.interfaces.repositories.users_repository_interface import IUsersRepository
+from src.interfaces.repositories.refresh_tokens_repository_interface import IRefreshTokensRepository
 from src.dtos.request.register_request import RegisterRequestDTO
 from src.dtos.request.login_request import LoginRequestDTO
+from src.dtos.request.refresh_request import RefreshRequestDTO
+from src.models.refresh_token import RefreshToken
 from src.models.user import User
 from src.mappers.user_mapper import UserMapper
+from src.utils.token_cache import TOKEN_CACHE_MAX_ENTRIES, TOKEN_CACHE_TTL_SECONDS, TokenCache
+
+REFRESH_TOKEN_EXPIRATION_DAYS = 30
 
 
 class AuthService(IAuthService):
     
-    def __init__(self, users_repository: IUsersRepository ):
+    def __init__(self, users_repository: IUsersRepository, password_service: IPasswordService,
+                 refresh_tokens_repository: IRefreshTokensRepository):
         self.db = users_repository
+        self.password_service = password_service
+        self.refresh_tokens_db = refresh_tokens_repository
         self.secret_key = os.getenv("JWT_SECRET_KEY")
         self.token_expiration_hours = int(os.getenv("JWT_EXPIRATION_HOURS"))
+        self.refresh_token_expiration_days = int(
+            os.getenv("REFRESH_TOKEN_EXPIRATION_DAYS", REFRESH_TOKEN_EXPIRATION_DAYS)
+        )
+        self.token_cache = TokenCache(
+            ttl_seconds=float(os.getenv("AUTH_TOKEN_CACHE_TTL_SECONDS", TOKEN_CACHE_TTL_SECONDS)),
+            max_entries=int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", TOKEN_CACHE_MAX_ENTRIES))
+        )
+        self.db.subscribe(self._on_user_changed)
     
     def register(self, register_dto: RegisterRequestDTO) -> dict:
         """
@@ -32,11 +50,10 @@ class AuthService(IAuthService):
         if not register_dto:
             raise BadRequest("Registration data is required")
         
-        existing_user = self.db.get_by_email(register_dto.email)
-        if existing_user:
+        if self.db.is_email_registered(register_dto.email):
             raise BadRequest(f"Email '{register_dto.email}' is already registered")
         
-        hashed_password = Common.hash_password(register_dto.password)
+        hashed_password = self.password_service.hash_password(register_dto.password)
         
         user: User = UserMapper.from_register_dto(register_dto, hashed_password)
         
@@ -52,7 +69,7 @@ class AuthService(IAuthService):
             login_dto: DTO with login credentials (email, password)
             
         Returns:
-            dict: Token and user data (JSON serializable)
+            dict: Access token, refresh token and user data (JSON serializable)
         """
         if not login_dto:
             raise BadRequest("Login credentials are required")
@@ -61,7 +78,7 @@ class AuthService(IAuthService):
         if not user:
             raise Unauthorized("Invalid email or password")
         
-        if not self._verify_password(login_dto.password, user.password):
+        if not self.password_service.verify_password(login_dto.password, user.password):
             raise Unauthorized("Invalid email or password")
         
         if not user.is_active:
@@ -71,13 +88,69 @@ class AuthService(IAuthService):
         
         return {
             "token": token,
+            "refresh_token": self._issue_refresh_token(user),
+            "user": UserMapper.to_response(user)
+        }
+    
+    def refresh(self, refresh_dto: RefreshRequestDTO) -> dict:
+        """
+        Exchange a refresh token for a new access token, without checking the password.
+        
+        The refresh token is single use: it is revoked and replaced by a new
+        one, so a token can only be redeemed once even if it leaked.
+        
+        Args:
+            refresh_dto: DTO with the refresh token
+            
+        Returns:
+            dict: New access token, new refresh token and user data (JSON serializable)
+        """
+        if not refresh_dto:
+            raise BadRequest("Refresh token is required")
+        
+        refresh_token = self.refresh_tokens_db.get_by_token_hash(self._hash_refresh_token(refresh_dto.refresh_token))
+        if not refresh_token or not self.refresh_tokens_db.delete_one(refresh_token):
+            raise Unauthorized("Invalid refresh token")
+        
+        if refresh_token.is_expired():
+            raise Unauthorized("Refresh token has expired")
+        
+        user = self.db.get_by_id(refresh_token.user_id)
+        if not user:
+            raise Unauthorized("User not found")
+        
+        if not user.is_active:
+            raise Unauthorized("User account is deactivated")
+        
+        return {
+            "token": self._generate_token(user),
+            "refresh_token": self._issue_refresh_token(user),
             "user": UserMapper.to_response(user)
         }
     
+    def logout(self, refresh_dto: RefreshRequestDTO) -> None:
+        """
+        Revoke a refresh token, ending the session it renews.
+        
+        Args:
+            refresh_dto: DTO with the refresh token
+        """
+        if not refresh_dto:
+            raise BadRequest("Refresh token is required")
+        
+        refresh_token = self.refresh_tokens_db.get_by_token_hash(self._hash_refresh_token(refresh_dto.refresh_token))
+        if not refresh_token or not self.refresh_tokens_db.delete_one(refresh_token):
+            raise Unauthorized("Invalid refresh token")
+        
+        return None
+    
     def validate_token(self, token: str) -> dict:
         """
         Validate JWT token and return user data.
         
+        Validated tokens are cached until they expire, for a bounded time,
+        and dropped as soon as their user is updated or deactivated.
+        
         Args:
             token: JWT token string
             
@@ -87,6 +160,10 @@ class AuthService(IAuthService):
         if not token:
             raise BadRequest("Token is required")
         
+        cached_user = self.token_cache.get(token)
+        if cached_user is not None:
+            return cached_user
+        
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=['HS256'])
             user_id = payload.get('user_id')
@@ -94,6 +171,7 @@ class AuthService(IAuthService):
             if not user_id:
                 raise Unauthorized("Invalid token payload")
             
+            generation = self.token_cache.generation(user_id)
             user = self.db.get_by_id(user_id)
             if not user:
                 raise Unauthorized("User not found")
@@ -101,7 +179,9 @@ class AuthService(IAuthService):
             if not user.is_active:
                 raise Unauthorized("User account is deactivated")
             
-            return UserMapper.to_response(user)
+            user_response = UserMapper.to_response(user)
+            self.token_cache.put(token, payload.get('exp', float('inf')), user_id, user_response, generation)
+            return user_response
             
         except jwt.ExpiredSignatureError:
             raise Unauthorized("Token has expired")
@@ -109,10 +189,6 @@ class AuthService(IAuthService):
             raise Unauthorized("Invalid token")
     
     
-    def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify password against hashed password."""
-        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
-    
     def _generate_token(self, user: User) -> str:
         """Generate JWT token for user."""
         payload = {
@@ -124,3 +200,26 @@ class AuthService(IAuthService):
         }
         token = jwt.encode(payload, self.secret_key, algorithm='HS256')
         return token
+    
+    def _on_user_changed(self, user_id: int) -> None:
+        """Drop the cached validations of a changed user and revoke the sessions of a deactivated one."""
+        self.token_cache.invalidate_user(user_id)
+        user = self.db.get_by_id(user_id)
+        if not user or not user.is_active:
+            self.refresh_tokens_db.delete_by_user(user_id)
+    
+    def _issue_refresh_token(self, user: User) -> str:
+        """Generate an opaque refresh token for user and store its hash."""
+        token = secrets.token_urlsafe(32)
+        refresh_token = (RefreshToken()
+            .set_token_hash(self._hash_refresh_token(token))
+            .set_user_id(user.id)
+            .set_expires_at(datetime.utcnow() + timedelta(days=self.refresh_token_expiration_days))
+            .build())
+        self.refresh_tokens_db.add_one(refresh_token)
+        return token
+    
+    @staticmethod
+    def _hash_refresh_token(token: str) -> str:
+        """Hash a refresh token for storage; it is random enough that a fast hash suffices."""
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
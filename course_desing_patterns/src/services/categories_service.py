@@ -10,6 +10,15 @@ class CategoriesService(IcategoriesService):
     def __init__(self, Category_repository: ICategoriesRepository):
         self.db = Category_repository
     
+    def get_version(self)->str:
+        """
+        Method to get the version of the categories, which changes on every mutation.
+
+        Returns:
+            Version token, cheap to compute compared to the categories themselves
+        """
+        return self.db.get_version()
+    
     def get_all(self)->list:
         """
         Method to get all Category.
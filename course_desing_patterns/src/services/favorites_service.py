@@ -10,6 +10,9 @@ class FavoritesService(IFavoritesService):
     def __init__(self, favorites_repository: IFavoritesRepository):
         self.db = favorites_repository
 
+    def get_version(self) -> str:
+        return self.db.get_version()
+
     def get_all(self) -> list:
         favorites = self.db.get_all()
         return [
@@ -19,6 +22,15 @@ class FavoritesService(IFavoritesService):
             } for fav in favorites
         ]
 
+    def get_by_user(self, user_id: int) -> list:
+        favorites = self.db.get_by_user(user_id)
+        return [
+            {
+                "user_id": fav.user_id,
+                "product_id": fav.product_id
+            } for fav in favorites
+        ]
+
     def create_one(self, favorite_data: FavoriteRequestDTO) -> dict:
         if not favorite_data:
             raise BadRequest("Favorite data is required")
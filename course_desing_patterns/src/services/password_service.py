@@ -0,0 +1,118 @@
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import bcrypt
+from werkzeug.exceptions import ServiceUnavailable
+
+from src.interfaces.services.password_service_interface import IPasswordService
+
+PASSWORD_HASH_WORKERS = 2
+PASSWORD_HASH_MAX_PENDING = 32
+BCRYPT_ROUNDS = 12
+
+
+def _hash_password(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+class PasswordService(IPasswordService):
+    """
+    Runs bcrypt in a bounded pool of worker processes, so hashing neither
+    holds the GIL of the web process nor occupies its request threads longer
+    than the wait for the result.
+
+    At most max_pending operations are queued or running at once; beyond
+    that, callers fail fast with 503 Service Unavailable instead of piling up
+    behind each other. With workers set to 0, bcrypt runs in the calling
+    thread under the same limit.
+
+    The workers are forked by start(), which must run before the process
+    starts any thread, since only the forking thread survives in the child.
+    They are never forked again: if a worker dies, the pool is dropped and
+    bcrypt runs in the calling thread from then on. Where fork is
+    unavailable, bcrypt also runs in the calling thread: spawned workers
+    would import and run the whole application module again.
+    """
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING,
+                 rounds: int = BCRYPT_ROUNDS):
+        """
+        Initializes the PasswordService.
+
+        Args:
+            workers: Number of worker processes, or 0 to hash in the calling thread
+            max_pending: Maximum number of operations queued or running at once
+            rounds: bcrypt cost factor of new hashes; existing hashes keep their own
+        """
+        self.workers = workers if "fork" in multiprocessing.get_all_start_methods() else 0
+        self.rounds = rounds
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Forks the worker processes and waits until they are ready."""
+        if self.workers <= 0:
+            return
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("fork"))
+            executor = self._executor
+        executor.submit(int).result()
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+
+    def hash_password(self, password: str) -> str:
+        """
+        Hash password using bcrypt.
+
+        Raises:
+            ServiceUnavailable: If too many password operations are pending
+        """
+        return self._run(_hash_password, password, self.rounds)
+
+    def verify_password(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify password against hashed password.
+
+        Raises:
+            ServiceUnavailable: If too many password operations are pending
+        """
+        return self._run(_verify_password, password, hashed_password)
+
+    def _run(self, operation, *args):
+        if not self._slots.acquire(blocking=False):
+            raise ServiceUnavailable("Too many password operations in progress, try again later")
+
+        try:
+            executor = self._executor
+            if executor is not None:
+                try:
+                    return executor.submit(operation, *args).result()
+                except BrokenProcessPool as e:
+                    self._discard_executor(executor, e)
+            return operation(*args)
+        finally:
+            self._slots.release()
+
+    def _discard_executor(self, executor: ProcessPoolExecutor, error: BrokenProcessPool) -> None:
+        """Drops a pool whose worker died; forking a new one from a threaded process is unsafe."""
+        with self._executor_lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        print(f"Error: password workers failed, hashing in the calling threads from now on: {error}")
+        executor.shutdown(wait=False, cancel_futures=True)
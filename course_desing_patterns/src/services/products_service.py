@@ -1,27 +1,58 @@
 from werkzeug.exceptions import BadRequest, NotFound
 from src.dtos.request.create_product_request import ProductCreateDTO
+from src.enums.product_sort import ProductSort
+from src.interfaces.repositories.categories_repository_interface import ICategoriesRepository
 from src.interfaces.repositories.products_repository_interface import IProductsRepository
 from src.interfaces.services.products_service_interface import IProductsService
 from src.mappers.products_mapper import ProductsMapper
 from src.models.product import Product
 
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 50
+
 class ProductsService(IProductsService):
-    def __init__(self, products_repository: IProductsRepository):
+    def __init__(self, products_repository: IProductsRepository, categories_repository: ICategoriesRepository):
         self.db = products_repository
+        self.categories_db = categories_repository
+    
+    def get_version(self)->str:
+        """
+        Method to get the version of the products, which changes on every mutation.
+
+        Returns:
+            Version token, cheap to compute compared to the products themselves
+        """
+        return self.db.get_version()
     
-    def get_all(self, category_filter:str=None)->list:
+    def get_all(self, category_filter:str=None, min_price:float=None, max_price:float=None, sort:str=None)->list:
         """
         Method to get all products.
 
         Args:
             category_filter (str, optional): Category to filter products. Defaults to None.
+            min_price (float, optional): Lowest price included. Defaults to None.
+            max_price (float, optional): Highest price included. Defaults to None.
+            sort (str, optional): 'price', '-price' or 'name'. Defaults to None.
 
         Returns:
             List of products as dictionaries (JSON serializable)
+
+        Raises:
+            BadRequest: If the price range or the sort order is invalid
         """
-        products:list[Product] = self.db.get_all(category_filter)
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise BadRequest("min_price cannot be greater than max_price")
+        
+        try:
+            product_sort = ProductSort(sort) if sort else None
+        except ValueError:
+            raise BadRequest(f"Invalid sort '{sort}', expected one of: {', '.join(s.value for s in ProductSort)}")
+        
+        products:list[Product] = self.db.get_all(category_filter, min_price, max_price, product_sort)
         
-        if category_filter and not products:
+        if category_filter and not products and min_price is None and max_price is None:
             raise NotFound(f"No products found for category '{category_filter}'")
         
         return [
@@ -34,6 +65,75 @@ class ProductsService(IProductsService):
             for product in products
         ]
     
+    def search(self, query:str, limit:int=None)->list:
+        """
+        Method to search products by name and category.
+
+        Args:
+            query (str): Search text
+            limit (int, optional): Maximum number of results. Defaults to SEARCH_DEFAULT_LIMIT.
+
+        Returns:
+            List of matching products as dictionaries, best match first
+
+        Raises:
+            BadRequest: If the query is empty or the limit is out of range
+        """
+        if not query or not query.strip():
+            raise BadRequest("Search query 'q' is required")
+        
+        if limit is None:
+            limit = SEARCH_DEFAULT_LIMIT
+        if not 1 <= limit <= SEARCH_MAX_LIMIT:
+            raise BadRequest(f"limit must be between 1 and {SEARCH_MAX_LIMIT}")
+        
+        products:list[Product] = self.db.search(query, limit)
+        
+        return [
+            {
+                "id": product.id,
+                "name": product.name,
+                "category": product.category,
+                "price": product.price
+            }
+            for product in products
+        ]
+    
+    def suggest(self, prefix:str, limit:int=None)->list:
+        """
+        Method to suggest names for a search box as the user types.
+
+        Args:
+            prefix (str): Beginning of the name, case insensitive
+            limit (int, optional): Maximum number of suggestions. Defaults to SUGGEST_DEFAULT_LIMIT.
+
+        Returns:
+            List of suggestions ({"type", "id", "name"}), matching categories
+            first and then products, each in alphabetical order
+
+        Raises:
+            BadRequest: If the prefix is empty or the limit is out of range
+        """
+        if not prefix or not prefix.strip():
+            raise BadRequest("Suggestion 'prefix' is required")
+        
+        if limit is None:
+            limit = SUGGEST_DEFAULT_LIMIT
+        if not 1 <= limit <= SUGGEST_MAX_LIMIT:
+            raise BadRequest(f"limit must be between 1 and {SUGGEST_MAX_LIMIT}")
+        
+        prefix = prefix.strip()
+        suggestions = [
+            {"type": "category", "id": category.id, "name": category.name}
+            for category in self.categories_db.suggest(prefix, limit)
+        ]
+        suggestions += [
+            {"type": "product", "id": product.id, "name": product.name}
+            for product in self.db.suggest(prefix, limit - len(suggestions))
+        ] if len(suggestions) < limit else []
+        
+        return suggestions
+    
     def get_one_by_id(self, product_id:int)->dict:
         """
         Method to get one product by id
@@ -1,6 +1,7 @@
+import copy
 from werkzeug.exceptions import BadRequest, NotFound
-from src.utils.common import Common
 from src.interfaces.services.users_service_interface import IUsersService
+from src.interfaces.services.password_service_interface import IPasswordService
 from src.interfaces.repositories.users_repository_interface import IUsersRepository
 from src.dtos.request.update_user_request import UpdateUserRequestDTO
 from src.models.user import User
@@ -9,8 +10,9 @@ from src.mappers.user_mapper import UserMapper
 
 class UsersService(IUsersService):
     
-    def __init__(self, users_repository: IUsersRepository):
+    def __init__(self, users_repository: IUsersRepository, password_service: IPasswordService):
         self.db = users_repository
+        self.password_service = password_service
     
     def get_all(self) -> list:
         """
@@ -66,11 +68,14 @@ class UsersService(IUsersService):
         if not user:
             raise NotFound(f"User with ID {user_id} not found")
         
+        # The repository may hand out cached, shared instances
+        user = copy.copy(user)
+        
         if update_dto.name is not None:
             user.set_name(update_dto.name)
         
         if update_dto.password is not None:
-            hashed_password = Common.hash_password(update_dto.password)
+            hashed_password = self.password_service.hash_password(update_dto.password)
             user.set_password(hashed_password)
         
         user.build()
@@ -103,3 +108,13 @@ class UsersService(IUsersService):
         return True
     
     
+
+    def get_email_filter_stats(self) -> dict:
+        """
+        Get the sizing of the registered emails filter and its expected and
+        measured false-positive rates, to tune USERS_EMAIL_FILTER_FP_RATE.
+
+        Returns:
+            dict: Filter statistics (JSON serializable)
+        """
+        return self.db.email_filter_stats()
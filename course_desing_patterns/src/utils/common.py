@@ -1,9 +1,7 @@
-import bcrypt
+import re
 
 class Common:
     @staticmethod
-    def hash_password(string: str) -> str:
-        """Hash password using bcrypt."""
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(string.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
\ No newline at end of file
+    def tokenize(text: str) -> list:
+        """Split text into lowercase word tokens for searching."""
+        return re.findall(r"\w+", text.lower()) if text else []
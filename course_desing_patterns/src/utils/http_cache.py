@@ -0,0 +1,91 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from flask import Response, current_app, jsonify, request
+
+RESPONSE_CACHE_MAX_ENTRIES = 128
+
+
+def collection_etag(collection: str, version: str) -> str:
+    """Build the strong entity tag of a resource read from a collection at a version."""
+    return f"{collection}-{version}"
+
+
+def not_modified(etag: str) -> Optional[Response]:
+    """
+    Answer a conditional GET whose If-None-Match already holds the current tag.
+
+    Args:
+        etag: Current entity tag of the requested resource
+
+    Returns:
+        A 304 response carrying the tag, or None if the client copy is stale
+    """
+    if not request.if_none_match.contains_weak(etag):
+        return None
+
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    """Attach the entity tag the response body was read at."""
+    response.set_etag(etag)
+    return response
+
+
+class ResponseCache:
+    """
+    Encoded JSON bodies of list endpoints, keyed by request and tagged with
+    the collection version they were built at.
+
+    A body is only served while the collection is still at that version, so
+    a mutation invalidates every body of the collection without being told.
+    The least recently used body is evicted once max_entries is reached.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        """
+        Initializes the ResponseCache.
+
+        Args:
+            max_entries: Maximum number of bodies kept
+        """
+        self.max_entries = max_entries
+        self._bodies: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def json_response(self, key: Hashable, version: str, build: Callable[[], Any]) -> Response:
+        """
+        Serve the cached body of a request, building and encoding it on a miss.
+
+        Args:
+            key: What identifies the request, such as its filters
+            version: Collection version read before the data
+            build: Function returning the JSON serializable data
+
+        Returns:
+            A JSON response with the encoded body
+        """
+        body = self._get(key, version)
+        if body is None:
+            body = jsonify(build()).get_data()
+            self._put(key, version, body)
+        return current_app.response_class(body, mimetype=current_app.json.mimetype)
+
+    def _get(self, key: Hashable, version: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._bodies.get(key)
+            if entry is None or entry[0] != version:
+                return None
+            self._bodies.move_to_end(key)
+            return entry[1]
+
+    def _put(self, key: Hashable, version: str, body: bytes) -> None:
+        with self._lock:
+            self._bodies[key] = (version, body)
+            self._bodies.move_to_end(key)
+            while len(self._bodies) > self.max_entries:
+                self._bodies.popitem(last=False)
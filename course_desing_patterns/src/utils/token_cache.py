@@ -0,0 +1,92 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+TOKEN_CACHE_TTL_SECONDS = 60
+TOKEN_CACHE_MAX_ENTRIES = 10000
+
+
+class TokenCache:
+    """
+    Bounded cache of validated tokens and the user response they resolve to.
+
+    An entry lives until the earliest of its time to live and the token's
+    own expiration, and is dropped at once when its user changes. The least
+    recently used entry is evicted once max_entries is reached.
+
+    Lookups that raced with a change of the user must not cache what they
+    read: callers take the user's generation before reading it and pass it
+    to put, which ignores the entry if the user changed in between.
+    """
+
+    def __init__(self, ttl_seconds: float = TOKEN_CACHE_TTL_SECONDS,
+                 max_entries: int = TOKEN_CACHE_MAX_ENTRIES):
+        """
+        Initializes the TokenCache.
+
+        Args:
+            ttl_seconds: Longest time an entry is served without validating the token again
+            max_entries: Maximum number of tokens kept
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the user response cached for token, or None."""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                self._remove(token)
+                return None
+            self._entries.move_to_end(token)
+            return dict(entry[2])
+
+    def generation(self, user_id: int) -> int:
+        """Returns the number of times a user was invalidated."""
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def put(self, token: str, expires_at: float, user_id: int, response: Dict[str, Any],
+            generation: int) -> None:
+        """
+        Caches the user response of a validated token.
+
+        Args:
+            token: Validated token
+            expires_at: Expiration of the token, as a Unix timestamp
+            user_id: User the token belongs to
+            response: User response to serve for the token
+            generation: Generation of the user taken before reading it
+        """
+        with self._lock:
+            if self._generations.get(user_id, 0) != generation:
+                return
+            self._remove(token)
+            self._entries[token] = (min(expires_at, time.time() + self.ttl_seconds), user_id, dict(response))
+            self._tokens_by_user.setdefault(user_id, set()).add(token)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drops every token of a user that was changed or deactivated."""
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            for token in self._tokens_by_user.pop(user_id, set()):
+                self._entries.pop(token, None)
+
+    def _remove(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        tokens = self._tokens_by_user.get(entry[1])
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[entry[1]]
@@ -0,0 +1,54 @@
+import json
+import os
+import sys
+
+import pytest
+
+# Tests import the application as the 'src' package, like app.py does.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.configurations.constants import CATEGORIES, PRODUCTS
+from src.enums.durability import Durability
+from src.repositories.category_repository import CategoriesRepository
+from src.repositories.product_repository import ProductsRepository
+from src.repositories.session import DatabaseConnection
+from src.repositories.sqlite_category_repository import SQLiteCategoriesRepository
+from src.repositories.sqlite_product_repository import SQLiteProductsRepository
+from src.repositories.sqlite_session import SQLiteDatabaseConnection
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def make_catalog(request, tmp_path):
+    """
+    Returns a function seeding products and categories into a fresh database
+    of each backend and returning its products and categories repositories.
+    """
+    databases = []
+
+    def make_json_catalog(products, categories):
+        json_file_path = tmp_path / "db.json"
+        json_file_path.write_text(json.dumps({PRODUCTS: products, CATEGORIES: categories}))
+        DatabaseConnection._instance = None
+        database = DatabaseConnection(str(json_file_path), durability=Durability.ASYNC)
+        database.connect()
+        databases.append((DatabaseConnection, database))
+        return ProductsRepository(database), CategoriesRepository(database)
+
+    def make_sqlite_catalog(products, categories):
+        SQLiteDatabaseConnection._instance = None
+        database = SQLiteDatabaseConnection(str(tmp_path / "db.sqlite3"))
+        database.connect()
+        with database.transaction() as connection:
+            connection.executemany(f"INSERT INTO {CATEGORIES} (id, name) VALUES (:id, :name)", categories)
+            connection.executemany(
+                f"INSERT INTO {PRODUCTS} (id, name, category, price) VALUES (:id, :name, :category, :price)",
+                products
+            )
+        databases.append((SQLiteDatabaseConnection, database))
+        return SQLiteProductsRepository(database), SQLiteCategoriesRepository(database)
+
+    yield make_json_catalog if request.param == "json" else make_sqlite_catalog
+
+    for database_class, database in databases:
+        database.close()
+        database_class._instance = None
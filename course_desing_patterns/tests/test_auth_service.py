@@ -0,0 +1,108 @@
+import copy
+import json
+
+import bcrypt
+import pytest
+from werkzeug.exceptions import Unauthorized
+
+from src.dtos.request.login_request import LoginRequestDTO
+from src.enums.durability import Durability
+from src.repositories.refresh_tokens_repository import RefreshTokensRepository
+from src.repositories.session import DatabaseConnection
+from src.repositories.users_repository import UsersRepository
+from src.services.auth_service import AuthService
+from src.services.password_service import PasswordService
+
+PASSWORD = "Passw0rd!"
+
+
+class CountingUsersRepository(UsersRepository):
+    """UsersRepository counting the users it loads by id, with a hook run after each load."""
+
+    def __init__(self, database_connection):
+        super().__init__(database_connection)
+        self.loads = 0
+        self.after_load = None
+
+    def get_by_id(self, user_id):
+        user = super().get_by_id(user_id)
+        self.loads += 1
+        after_load, self.after_load = self.after_load, None
+        if after_load is not None:
+            after_load()
+        return user
+
+
+@pytest.fixture
+def users_repository(tmp_path):
+    hashed_password = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds=4)).decode("utf-8")
+    users = [{"id": user_id, "email": f"user{user_id}@example.com", "password": hashed_password,
+              "name": f"User {user_id}", "role": "customer", "is_active": True} for user_id in (1, 2)]
+    json_file_path = tmp_path / "db.json"
+    json_file_path.write_text(json.dumps({"users": users, "refresh_tokens": []}))
+    DatabaseConnection._instance = None
+    database = DatabaseConnection(str(json_file_path), durability=Durability.ASYNC)
+    database.connect()
+    yield CountingUsersRepository(database)
+    database.close()
+    DatabaseConnection._instance = None
+
+
+@pytest.fixture
+def auth_service(users_repository, monkeypatch):
+    monkeypatch.setenv("JWT_SECRET_KEY", "secret-key-of-the-tests-0123456789")
+    monkeypatch.setenv("JWT_EXPIRATION_HOURS", "1")
+    return AuthService(users_repository, PasswordService(workers=0, rounds=4),
+                       RefreshTokensRepository(users_repository.db))
+
+
+def login(auth_service, user_id):
+    return auth_service.login(LoginRequestDTO(email=f"user{user_id}@example.com", password=PASSWORD))["token"]
+
+
+def rename(users_repository, user_id, name):
+    user = copy.copy(users_repository.get_by_id(user_id))
+    user.name = name
+    users_repository.update_one(user)
+
+
+def test_a_cached_token_is_validated_without_loading_the_user(auth_service, users_repository):
+    token = login(auth_service, 1)
+
+    first = auth_service.validate_token(token)
+    loads = users_repository.loads
+    second = auth_service.validate_token(token)
+
+    assert second == first
+    assert users_repository.loads == loads
+
+
+def test_changing_a_user_drops_only_the_tokens_of_that_user(auth_service, users_repository):
+    token, other_token = login(auth_service, 1), login(auth_service, 2)
+    auth_service.validate_token(token)
+    auth_service.validate_token(other_token)
+
+    rename(users_repository, 1, "Renamed")
+    loads = users_repository.loads
+
+    assert auth_service.validate_token(token)["name"] == "Renamed"
+    assert auth_service.validate_token(other_token)["name"] == "User 2"
+    assert users_repository.loads == loads + 1
+
+
+def test_deleting_a_user_drops_its_cached_tokens(auth_service, users_repository):
+    token = login(auth_service, 1)
+    auth_service.validate_token(token)
+
+    users_repository.delete_one(1)
+
+    with pytest.raises(Unauthorized):
+        auth_service.validate_token(token)
+
+
+def test_a_validation_that_raced_with_a_change_is_not_cached(auth_service, users_repository):
+    token = login(auth_service, 1)
+    users_repository.after_load = lambda: rename(users_repository, 1, "Renamed")
+
+    assert auth_service.validate_token(token)["name"] == "User 1"
+    assert auth_service.validate_token(token)["name"] == "Renamed"
@@ -0,0 +1,44 @@
+import json
+import pickle
+
+import pytest
+
+from src.repositories import binary_snapshot
+
+PRODUCTS = [{"id": product_id, "name": f"product {product_id}", "price": 9.99, "tags": ["a"], "stock": None}
+            for product_id in range(1, 2501)]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_records_survive_a_round_trip(tmp_path, compress):
+    path = str(tmp_path / "db.bin")
+    binary_snapshot.write_snapshot(path, {"products": PRODUCTS, "favorites": []}, compress)
+
+    assert binary_snapshot.read_snapshot(path) == {"products": PRODUCTS, "favorites": []}
+
+
+def test_snapshots_with_json_blocks_are_still_read(tmp_path):
+    path = tmp_path / "db.bin"
+    block = json.dumps(PRODUCTS[:2], separators=(',', ':')).encode('utf-8')
+    payload = binary_snapshot.BLOCK_LENGTH.pack(len(block)) + block
+    path.write_bytes(
+        binary_snapshot.HEADER.pack(binary_snapshot.MAGIC, binary_snapshot.JSON_BLOCKS_VERSION, 0)
+        + binary_snapshot.SECTION_NAME_LENGTH.pack(len(b"products")) + b"products"
+        + binary_snapshot.SECTION_SIZES.pack(2, len(payload)) + payload
+    )
+
+    assert binary_snapshot.read_snapshot(str(path)) == {"products": PRODUCTS[:2]}
+
+
+def test_blocks_referencing_globals_are_rejected(tmp_path):
+    path = tmp_path / "db.bin"
+    block = pickle.dumps([{"id": 1, "run": print}], protocol=binary_snapshot.PICKLE_PROTOCOL)
+    payload = binary_snapshot.BLOCK_LENGTH.pack(len(block)) + block
+    path.write_bytes(
+        binary_snapshot.HEADER.pack(binary_snapshot.MAGIC, binary_snapshot.VERSION, 0)
+        + binary_snapshot.SECTION_NAME_LENGTH.pack(len(b"products")) + b"products"
+        + binary_snapshot.SECTION_SIZES.pack(1, len(payload)) + payload
+    )
+
+    with pytest.raises(ValueError):
+        binary_snapshot.read_snapshot(str(path))
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from src.enums.durability import Durability
+from src.mappers.user_mapper import UserMapper
+from src.repositories.bloom_filter import BLOOM_FILTER_MIN_CAPACITY, BloomFilter
+from src.repositories.session import DatabaseConnection
+from src.repositories.sqlite_session import SQLiteDatabaseConnection
+from src.repositories.sqlite_users_repository import SQLiteUsersRepository
+from src.repositories.users_repository import UsersRepository
+
+
+def make_user(number):
+    return UserMapper.map_raw_data_to_user({
+        "email": f"User{number}@Example.com", "password": "hashed-password", "name": f"User {number}",
+        "role": "customer",
+    })
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def make_users_repository(request, tmp_path):
+    databases = []
+
+    def make(email_filter_fp_rate):
+        if request.param == "json":
+            json_file_path = tmp_path / "db.json"
+            json_file_path.write_text(json.dumps({"users": []}))
+            DatabaseConnection._instance = None
+            database = DatabaseConnection(str(json_file_path), durability=Durability.ASYNC)
+            database.connect()
+            databases.append((DatabaseConnection, database))
+            return UsersRepository(database, email_filter_fp_rate)
+        SQLiteDatabaseConnection._instance = None
+        database = SQLiteDatabaseConnection(str(tmp_path / "db.sqlite3"))
+        database.connect()
+        databases.append((SQLiteDatabaseConnection, database))
+        return SQLiteUsersRepository(database, email_filter_fp_rate)
+
+    yield make
+
+    for database_class, database in databases:
+        database.close()
+        database_class._instance = None
+
+
+def test_added_values_are_never_ruled_out():
+    bloom_filter = BloomFilter(capacity=500, fp_rate=0.05)
+    values = [f"user{number}@example.com" for number in range(2000)]
+    for value in values:
+        bloom_filter.add(value)
+
+    assert all(bloom_filter.might_contain(value) for value in values)
+    assert bloom_filter.is_full()
+    assert bloom_filter.negatives == 0
+
+
+def test_build_leaves_room_for_as_many_values_again():
+    assert BloomFilter.build([], min_capacity=16).capacity == 16
+    assert BloomFilter.build([str(number) for number in range(100)], min_capacity=16).capacity == 200
+
+
+def test_stats_measure_the_false_positive_rate():
+    bloom_filter = BloomFilter(capacity=100, fp_rate=0.01)
+    for number in range(100):
+        bloom_filter.add(str(number))
+    for number in range(100, 300):
+        if bloom_filter.might_contain(str(number)):
+            bloom_filter.record_false_positive()
+
+    stats = bloom_filter.stats()
+
+    assert stats["count"] == 100
+    assert stats["negatives"] + stats["false_positives"] == 200
+    assert stats["measured_fp_rate"] == stats["false_positives"] / 200
+    assert 0 < stats["expected_fp_rate"] < 0.05
+
+
+def test_registered_emails_are_always_found(make_users_repository):
+    users_repository = make_users_repository(0.01)
+    for number in range(50):
+        users_repository.add_one(make_user(number))
+
+    assert all(users_repository.is_email_registered(f"user{number}@example.com") for number in range(50))
+    assert users_repository.email_filter_stats()["negatives"] == 0
+
+
+def test_a_full_filter_is_rebuilt_at_twice_the_users(make_users_repository):
+    users_repository = make_users_repository(0.01)
+    assert users_repository.email_filter_stats()["capacity"] == BLOOM_FILTER_MIN_CAPACITY
+
+    user_count = BLOOM_FILTER_MIN_CAPACITY + 1
+    for number in range(user_count):
+        users_repository.add_one(make_user(number))
+    stats = users_repository.email_filter_stats()
+
+    assert stats["count"] == user_count
+    assert stats["capacity"] == 2 * user_count
+    assert all(users_repository.is_email_registered(f"USER{number}@example.com") for number in range(user_count))
+
+
+def test_email_filter_stats_count_the_hits_the_exact_lookup_disproved(make_users_repository):
+    users_repository = make_users_repository(0.5)
+    for number in range(20):
+        users_repository.add_one(make_user(number))
+
+    registered = [users_repository.is_email_registered(f"other{number}@example.com") for number in range(200)]
+    stats = users_repository.email_filter_stats()
+
+    assert not any(registered)
+    assert stats["false_positives"] > 0
+    assert stats["false_positives"] + stats["negatives"] == 200
+    assert stats["measured_fp_rate"] == stats["false_positives"] / 200
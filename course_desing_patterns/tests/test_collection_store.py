@@ -0,0 +1,238 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from src.enums.durability import Durability
+from src.repositories.collection_store import CollectionStore
+
+
+def open_store(path, name="items", **kwargs) -> CollectionStore:
+    store = CollectionStore(name, str(path), **kwargs)
+    store.load()
+    return store
+
+
+def test_restart_replays_the_log(tmp_path):
+    path = tmp_path / "db.items.json"
+    store = open_store(path)
+    for item_id in range(1, 6):
+        store.insert({"id": item_id, "name": f"item {item_id}"}, key={"id": item_id})
+    store.update({"id": 2, "name": "renamed"}, key={"id": 2})
+    store.delete({"id": 3})
+    store.close()
+
+    restarted = open_store(path)
+
+    assert list(restarted.records) == [
+        {"id": 1, "name": "item 1"},
+        {"id": 2, "name": "renamed"},
+        {"id": 4, "name": "item 4"},
+        {"id": 5, "name": "item 5"},
+    ]
+    assert restarted.find_one("id", 3) is None
+    assert restarted.next_id() == 6
+    restarted.close()
+
+
+def test_restart_replays_composite_keys_over_the_snapshot(tmp_path):
+    path = tmp_path / "db.favorites.json"
+    path.write_text(json.dumps([{"user_id": 1, "product_id": 1}, {"user_id": 1, "product_id": 2}]))
+    store = open_store(path, name="favorites")
+    store.create_index("user_id", lambda favorite: favorite.get("user_id"))
+    store.delete({"user_id": 1, "product_id": 1})
+    store.insert({"user_id": 2, "product_id": 1}, key={"user_id": 2, "product_id": 1})
+    store.close()
+
+    restarted = open_store(path, name="favorites")
+    restarted.create_index("user_id", lambda favorite: favorite.get("user_id"))
+
+    assert list(restarted.records) == [{"user_id": 1, "product_id": 2}, {"user_id": 2, "product_id": 1}]
+    assert restarted.find("user_id", 1) == [{"user_id": 1, "product_id": 2}]
+    restarted.close()
+
+
+def test_a_mutation_the_log_refuses_is_not_applied(tmp_path):
+    path = tmp_path / "db.items.json"
+    store = open_store(path)
+    store.insert({"id": 1, "name": "item 1"}, key={"id": 1})
+    store.close()
+
+    with pytest.raises(RuntimeError):
+        store.insert({"id": 2}, key={"id": 2})
+    with pytest.raises(RuntimeError):
+        store.update({"id": 1, "name": "renamed"}, key={"id": 1})
+    with pytest.raises(RuntimeError):
+        store.delete({"id": 1})
+
+    assert list(store.records) == [{"id": 1, "name": "item 1"}]
+    assert store.find_one("id", 2) is None
+
+
+def test_boot_with_a_long_log_applies_every_entry(tmp_path):
+    path = tmp_path / "db.items.json"
+    path.write_text(json.dumps([{"id": item_id, "stock": 0} for item_id in range(1, 20001)]))
+    store = open_store(path, durability=Durability.ASYNC)
+    for item_id in range(1, 20001, 2):
+        store.delete({"id": item_id})
+    for item_id in range(2, 20001, 4):
+        store.update({"id": item_id, "stock": 1}, key={"id": item_id})
+    store.close()
+
+    restarted = open_store(path)
+    restarted.create_index("stock", lambda item: item.get("stock"))
+
+    assert len(restarted.records) == 10000
+    assert [item["id"] for item in restarted.records] == list(range(2, 20001, 2))
+    assert len(restarted.find("stock", 1)) == 5000
+    restarted.close()
+
+
+def test_restart_after_compaction_keeps_records_and_sequence(tmp_path):
+    path = tmp_path / "db.items.json"
+    store = open_store(path)
+    for _ in range(5):
+        item_id = store.next_id()
+        store.insert({"id": item_id}, key={"id": item_id})
+    store.delete({"id": 5})
+    store.compact()
+    store.update({"id": 1, "name": "after compaction"}, key={"id": 1})
+    store.close()
+
+    restarted = open_store(path)
+
+    assert json.loads(path.read_text()) == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+    assert list(restarted.records) == [{"id": 1, "name": "after compaction"}, {"id": 2}, {"id": 3}, {"id": 4}]
+    assert restarted.next_id() == 6
+    restarted.close()
+
+
+def test_restart_after_unfinished_compaction_replays_the_archive(tmp_path):
+    path = tmp_path / "db.items.json"
+    store = open_store(path)
+    store.insert({"id": 1}, key={"id": 1})
+    store.log.rotate()
+    store.insert({"id": 2}, key={"id": 2})
+    store.close()
+
+    restarted = open_store(path)
+
+    assert list(restarted.records) == [{"id": 1}, {"id": 2}]
+    assert restarted.needs_compaction(threshold_bytes=1 << 20)
+    restarted.compact()
+    assert not (tmp_path / "db.items.json.wal.1").exists()
+    restarted.close()
+
+    compacted = open_store(path)
+    assert list(compacted.records) == [{"id": 1}, {"id": 2}]
+    compacted.close()
+
+
+def test_compaction_does_not_fsync_while_writers_are_held(tmp_path, monkeypatch):
+    path = tmp_path / "db.items.json"
+    store = open_store(path, durability=Durability.ASYNC, commit_window_ms=60000, commit_max_records=1 << 20)
+    for item_id in range(1, 101):
+        store.insert({"id": item_id}, key={"id": item_id})
+    fsync = os.fsync
+    fsyncs_under_lock = []
+
+    def spy_fsync(fd):
+        fsyncs_under_lock.append(store._write_lock.locked())
+        fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", spy_fsync)
+    store.compact()
+
+    assert fsyncs_under_lock and not any(fsyncs_under_lock)
+    store.close()
+
+
+def test_appends_pending_at_rotation_go_to_the_new_log(tmp_path):
+    path = tmp_path / "db.items.json"
+    store = open_store(path, durability=Durability.ASYNC, commit_window_ms=60000, commit_max_records=1 << 20)
+    store.insert({"id": 1}, key={"id": 1})
+    store.log.flush()
+    store.insert({"id": 2}, key={"id": 2})
+    store.log.rotate()
+    store.close()
+
+    assert (tmp_path / "db.items.json.wal.1").read_text().count("\n") == 1
+    restarted = open_store(path)
+    assert list(restarted.records) == [{"id": 1}, {"id": 2}]
+    restarted.close()
+
+
+def test_rotation_never_overwrites_the_archive(tmp_path):
+    path = tmp_path / "db.items.json"
+    store = open_store(path)
+    store.insert({"id": 1}, key={"id": 1})
+    store.log.rotate()
+
+    with pytest.raises(RuntimeError):
+        store.log.rotate()
+    store.close()
+
+
+def insert_from_process(path: str, worker: int, count: int) -> None:
+    store = open_store(path, durability=Durability.ASYNC, multi_process=True)
+    for number in range(count):
+        with store.transaction():
+            item_id = store.next_id()
+            store.insert({"id": item_id, "worker": worker}, key={"id": item_id})
+        if number % 50 == 49:
+            store.compact()
+    store.close()
+
+
+def test_concurrent_inserts_from_two_processes_get_unique_ids(tmp_path):
+    path = str(tmp_path / "db.items.json")
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=insert_from_process, args=(path, worker, 200)) for worker in (1, 2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    store = open_store(path, multi_process=True)
+    ids = [item["id"] for item in store.records]
+
+    assert [worker.exitcode for worker in workers] == [0, 0]
+    assert sorted(ids) == list(range(1, 401))
+    assert {item["worker"] for item in store.records} == {1, 2}
+    store.close()
+
+
+def test_version_changes_with_each_mutation_and_survives_a_restart(tmp_path):
+    path = tmp_path / "db.items.json"
+    store = open_store(path)
+    versions = [store.version()]
+    store.insert({"id": 1}, key={"id": 1})
+    versions.append(store.version())
+    store.compact()
+    versions.append(store.version())
+    store.delete({"id": 1})
+    versions.append(store.version())
+    store.close()
+
+    restarted = open_store(path)
+
+    assert len(set(versions)) == len(versions)
+    assert restarted.version() == versions[-1]
+    restarted.close()
+
+
+def test_processes_sharing_the_files_agree_on_the_version(tmp_path):
+    path = tmp_path / "db.items.json"
+    first = open_store(path, multi_process=True)
+    second = open_store(path, multi_process=True)
+
+    first.insert({"id": 1}, key={"id": 1})
+    assert second.version() == first.version()
+    second.compact()
+    assert first.version() == second.version()
+    second.update({"id": 1, "name": "renamed"}, key={"id": 1})
+    assert first.version() == second.version()
+    assert list(first.records) == [{"id": 1, "name": "renamed"}]
+    first.close()
+    second.close()
@@ -0,0 +1,79 @@
+import pytest
+from flask import Flask
+
+from src.controllers import products_controller
+from src.controllers.products_controller import products_bp, set_products_service
+from src.utils.http_cache import RESPONSE_CACHE_MAX_ENTRIES, ResponseCache
+
+
+class StubProductsService:
+    """Products service whose version is bumped by hand, counting the listings it builds."""
+
+    def __init__(self):
+        self.version = 1
+        self.builds = 0
+
+    def get_version(self):
+        return str(self.version)
+
+    def get_all(self, category_filter=None, min_price=None, max_price=None, sort=None):
+        self.builds += 1
+        return [{"category": category_filter, "min_price": min_price, "max_price": max_price,
+                 "sort": sort, "version": self.version}]
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = StubProductsService()
+    previous = products_controller.products_service
+    set_products_service(service)
+    monkeypatch.setattr(products_controller, "products_response_cache", ResponseCache())
+    yield service
+    set_products_service(previous)
+
+
+@pytest.fixture
+def client(service):
+    app = Flask(__name__)
+    app.register_blueprint(products_bp, url_prefix="/products")
+    return app.test_client()
+
+
+def test_a_listing_is_built_once_per_version_and_filters(client, service):
+    first = client.get("/products/?category=women&sort=price")
+    second = client.get("/products/?category=women&sort=price")
+    other = client.get("/products/?category=women&sort=-price")
+
+    assert first.get_data() == second.get_data()
+    assert other.get_json()[0]["sort"] == "-price"
+    assert service.builds == 2
+
+
+def test_a_mutation_makes_the_cached_listing_miss(client, service):
+    client.get("/products/?category=women")
+    service.version += 1
+
+    response = client.get("/products/?category=women")
+
+    assert response.get_json()[0]["version"] == 2
+    assert service.builds == 2
+
+
+def test_the_current_etag_answers_not_modified(client, service):
+    etag = client.get("/products/").headers["ETag"]
+
+    assert client.get("/products/", headers={"If-None-Match": etag}).status_code == 304
+    service.version += 1
+    assert client.get("/products/", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_distinct_filters_beyond_the_bound_evict_the_least_recently_used(client, service):
+    for min_price in range(RESPONSE_CACHE_MAX_ENTRIES + 1):
+        client.get(f"/products/?min_price={min_price}")
+
+    assert len(products_controller.products_response_cache._bodies) == RESPONSE_CACHE_MAX_ENTRIES
+    builds = service.builds
+    client.get(f"/products/?min_price={RESPONSE_CACHE_MAX_ENTRIES}")
+    assert service.builds == builds
+    client.get("/products/?min_price=0")
+    assert service.builds == builds + 1
@@ -0,0 +1,39 @@
+import io
+import json
+
+import pytest
+
+from src.repositories.json_stream import JsonStreamReader
+
+RECORDS = [
+    {"id": 1, "name": "plain"},
+    {"id": 2, "name": "looks like an end }],{", "tags": ["a", "]"]},
+    {"id": 3, "nested": {"sizes": [{"s": 1}, {"m": [2, 3]}], "escaped": "quote \" }, [\"}], 'x'"}},
+    {"id": 4, "price": 12345.678901, "active": True, "parent": None},
+    [1, 2, [3]],
+    "scalar",
+    42,
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1024])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_array_elements_match_json_load(chunk_size, indent):
+    reader = JsonStreamReader(io.StringIO(json.dumps(RECORDS * 50, indent=indent)), chunk_size)
+
+    assert list(reader.iter_array()) == RECORDS * 50
+
+
+@pytest.mark.parametrize("chunk_size", [3, 64, 1024])
+def test_object_of_arrays_yields_each_array(chunk_size):
+    document = {"products": RECORDS * 20, "empty": [], "favorites": [{"user_id": 1, "product_id": 2}]}
+    reader = JsonStreamReader(io.StringIO(json.dumps(document, indent=4)), chunk_size)
+
+    assert {key: list(elements) for key, elements in reader.iter_object_arrays()} == document
+
+
+def test_truncated_array_is_rejected():
+    reader = JsonStreamReader(io.StringIO(json.dumps(RECORDS)[:-5]), 16)
+
+    with pytest.raises(ValueError):
+        list(reader.iter_array())
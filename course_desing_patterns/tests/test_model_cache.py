@@ -0,0 +1,54 @@
+from src.enums.durability import Durability
+from src.repositories.collection_store import CollectionStore
+from src.repositories.model_cache import ModelCache
+
+
+def open_store(path) -> CollectionStore:
+    store = CollectionStore("users", str(path), Durability.ASYNC, multi_process=True)
+    store.load()
+    return store
+
+
+def test_models_are_reused_until_their_record_is_replaced():
+    built = []
+    cache = ModelCache(lambda raw_record: built.append(raw_record) or dict(raw_record))
+    raw_record = {"id": 1}
+
+    assert cache.get(raw_record) is cache.get(raw_record)
+    cache.discard(raw_record)
+    cache.get(raw_record)
+
+    assert len(built) == 2
+
+
+def test_entries_are_dropped_when_the_epoch_changes():
+    epoch = [0]
+    cache = ModelCache(dict, lambda: epoch[0])
+    raw_records = [{"id": record_id} for record_id in range(10)]
+    cache.map_all(raw_records)
+
+    epoch[0] += 1
+    cache.get(raw_records[0])
+
+    assert len(cache) == 1
+
+
+def test_reloads_and_changes_of_other_processes_do_not_grow_the_cache(tmp_path):
+    path = tmp_path / "db.users.json"
+    reader, writer = open_store(path), open_store(path)
+    for user_id in range(1, 201):
+        writer.insert({"id": user_id, "name": "user"}, key={"id": user_id})
+    cache = ModelCache(dict, lambda: reader.epoch)
+
+    for round_number in range(5):
+        for user_id in range(1, 201):
+            writer.update({"id": user_id, "name": f"user {round_number}"}, key={"id": user_id})
+        if round_number % 2:
+            writer.compact()
+        models = [cache.get(reader.find_one("id", user_id)) for user_id in range(1, 201)]
+
+        assert len(cache) == 200
+        assert {model["name"] for model in models} == {f"user {round_number}"}
+
+    reader.close()
+    writer.close()
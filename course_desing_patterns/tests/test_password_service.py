@@ -0,0 +1,80 @@
+import multiprocessing
+import threading
+
+import bcrypt
+import pytest
+from werkzeug.exceptions import ServiceUnavailable
+
+from src.services import password_service
+from src.services.password_service import PasswordService
+
+ROUNDS = 4
+
+
+@pytest.fixture
+def pooled_service():
+    service = PasswordService(workers=1, max_pending=4, rounds=ROUNDS)
+    service.start()
+    yield service
+    service.close()
+
+
+def test_a_dead_worker_falls_back_to_hashing_in_the_calling_thread(pooled_service):
+    for process in list(pooled_service._executor._processes.values()):
+        process.kill()
+        process.join()
+
+    hashed_password = pooled_service.hash_password("secret")
+
+    assert bcrypt.checkpw(b"secret", hashed_password.encode("utf-8"))
+    assert pooled_service._executor is None
+    assert pooled_service.verify_password("secret", hashed_password)
+    assert pooled_service._executor is None
+
+
+def test_workers_set_to_0_hash_in_the_calling_thread(monkeypatch):
+    service = PasswordService(workers=0, rounds=ROUNDS)
+    service.start()
+    threads = []
+    verify_password = password_service._verify_password
+
+    def recording_verify_password(password, hashed_password):
+        threads.append(threading.get_ident())
+        return verify_password(password, hashed_password)
+
+    monkeypatch.setattr(password_service, "_verify_password", recording_verify_password)
+    hashed_password = service.hash_password("secret")
+
+    assert service._executor is None
+    assert not multiprocessing.active_children()
+    assert service.verify_password("secret", hashed_password)
+    assert not service.verify_password("other", hashed_password)
+    assert threads == [threading.get_ident()] * 2
+
+
+def test_operations_beyond_max_pending_fail_fast_with_503(monkeypatch):
+    service = PasswordService(workers=0, max_pending=2, rounds=ROUNDS)
+    started = threading.Semaphore(0)
+    release = threading.Event()
+    hash_password = password_service._hash_password
+
+    def blocking_hash_password(password, rounds):
+        started.release()
+        release.wait(timeout=5)
+        return hash_password(password, rounds)
+
+    monkeypatch.setattr(password_service, "_hash_password", blocking_hash_password)
+    pending = [threading.Thread(target=service.hash_password, args=("secret",)) for _ in range(2)]
+    for thread in pending:
+        thread.start()
+    for _ in pending:
+        assert started.acquire(timeout=5)
+
+    with pytest.raises(ServiceUnavailable) as error:
+        service.verify_password("secret", bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=ROUNDS)).decode("utf-8"))
+    assert error.value.code == 503
+
+    release.set()
+    for thread in pending:
+        thread.join()
+    assert bcrypt.checkpw(b"secret", service.hash_password("secret").encode("utf-8"))
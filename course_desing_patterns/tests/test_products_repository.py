@@ -0,0 +1,79 @@
+import pytest
+
+from src.configurations.constants import PRODUCTS
+from src.repositories.product_repository import ProductsRepository
+from src.repositories.sqlite_product_repository import SQLiteProductsRepository
+from src.repositories.sqlite_session import PRODUCTS_SEARCH, SCHEMA_VERSION, SQLiteDatabaseConnection
+
+CATEGORIES = [{"id": 1, "name": "tops"}, {"id": 2, "name": "red"}, {"id": 3, "name": "shoes"}]
+PRODUCTS_BY_RELEVANCE = [
+    {"id": 1, "name": "Cap", "category": "red", "price": 5},
+    {"id": 2, "name": "Shirt", "category": "red", "price": 10},
+    {"id": 3, "name": "Red", "category": "shoes", "price": 20},
+    {"id": 5, "name": "Red Shirt", "category": "tops", "price": 15},
+    {"id": 6, "name": "Hat", "category": "tops", "price": 8},
+]
+
+
+def search_ids(products_repository, query, limit=10):
+    return [product.id for product in products_repository.search(query, limit)]
+
+
+def test_search_ranks_name_matches_above_category_matches(make_catalog):
+    products_repository, _ = make_catalog(PRODUCTS_BY_RELEVANCE, CATEGORIES)
+
+    ids = search_ids(products_repository, "red shirt")
+
+    assert set(ids) == {1, 2, 3, 5}
+    assert ids.index(5) < ids.index(3) < ids.index(1)
+    assert ids.index(2) < ids.index(3)
+    assert search_ids(products_repository, "red shirt", limit=2) == ids[:2]
+
+
+def test_search_breaks_ties_by_id(make_catalog):
+    tied = [{"id": product_id, "name": "Green Cap", "category": "tops", "price": 5} for product_id in (9, 4, 7)]
+    products_repository, _ = make_catalog(tied, CATEGORIES)
+
+    assert search_ids(products_repository, "green") == [4, 7, 9]
+    assert search_ids(products_repository, "GREEN caps", limit=1) == [4]
+
+
+def test_json_search_scores_name_terms_twice_category_terms(make_catalog):
+    products_repository, _ = make_catalog(PRODUCTS_BY_RELEVANCE, CATEGORIES)
+    if not isinstance(products_repository, ProductsRepository):
+        pytest.skip("scores are only exact in the JSON backend, SQLite ranks by BM25")
+
+    # Red Shirt scores 4, Shirt (red) 3, Red 2 and Cap (red) 1.
+    assert search_ids(products_repository, "red shirt") == [5, 2, 3, 1]
+
+
+def test_search_finds_nothing_without_terms(make_catalog):
+    products_repository, _ = make_catalog(PRODUCTS_BY_RELEVANCE, CATEGORIES)
+
+    assert search_ids(products_repository, "  !? ") == []
+    assert search_ids(products_repository, "sandals") == []
+
+
+def test_sqlite_migration_rebuilds_the_search_index(tmp_path):
+    db_file_path = str(tmp_path / "db.sqlite3")
+    SQLiteDatabaseConnection._instance = None
+    database = SQLiteDatabaseConnection(db_file_path)
+    database.connect()
+    with database.transaction() as connection:
+        connection.executemany(
+            f"INSERT INTO {PRODUCTS} (id, name, category, price) VALUES (:id, :name, :category, :price)",
+            PRODUCTS_BY_RELEVANCE
+        )
+        # A database created before the search index: rows the index never saw.
+        connection.execute(f"INSERT INTO {PRODUCTS_SEARCH} ({PRODUCTS_SEARCH}) VALUES ('delete-all')")
+    database.connection.execute("PRAGMA user_version = 0")
+    database.close()
+    SQLiteDatabaseConnection._instance = None
+
+    database = SQLiteDatabaseConnection(db_file_path)
+    database.connect()
+
+    assert database.connection.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    assert set(search_ids(SQLiteProductsRepository(database), "red shirt")) == {1, 2, 3, 5}
+    database.close()
+    SQLiteDatabaseConnection._instance = None
@@ -0,0 +1,52 @@
+import pytest
+from werkzeug.exceptions import BadRequest
+
+from src.services.products_service import SUGGEST_DEFAULT_LIMIT, SUGGEST_MAX_LIMIT, ProductsService
+
+CATEGORIES = [{"id": 1, "name": "shirts"}, {"id": 2, "name": "Hats"}, {"id": 3, "name": "Shoes"}]
+PRODUCTS = [
+    {"id": 10, "name": "Shirt Red", "category": "shirts", "price": 10},
+    {"id": 11, "name": "shoe horn", "category": "Shoes", "price": 3},
+    {"id": 12, "name": "SHORTS", "category": "shirts", "price": 12},
+    {"id": 13, "name": "Hat", "category": "Hats", "price": 8},
+    {"id": 14, "name": "Sharp Knife", "category": "Hats", "price": 9},
+]
+
+
+@pytest.fixture
+def products_service(make_catalog):
+    return ProductsService(*make_catalog(PRODUCTS, CATEGORIES))
+
+
+def suggested(suggestions):
+    return [(suggestion["type"], suggestion["id"]) for suggestion in suggestions]
+
+
+def test_suggest_lists_categories_then_products_alphabetically_ignoring_case(products_service):
+    expected = [("category", 1), ("category", 3),
+                ("product", 14), ("product", 10), ("product", 11), ("product", 12)]
+
+    assert suggested(products_service.suggest("sh")) == expected
+    assert suggested(products_service.suggest("  SH ")) == expected
+    assert suggested(products_service.suggest("hat")) == [("category", 2), ("product", 13)]
+    assert products_service.suggest("boots") == []
+
+
+def test_suggest_limit_counts_categories_and_products_together(products_service):
+    assert suggested(products_service.suggest("sh", 3)) == [("category", 1), ("category", 3), ("product", 14)]
+    assert suggested(products_service.suggest("sh", 2)) == [("category", 1), ("category", 3)]
+    assert suggested(products_service.suggest("sh", 1)) == [("category", 1)]
+
+
+def test_suggest_defaults_and_bounds_the_limit(make_catalog):
+    products = [{"id": product_id, "name": f"Sock {product_id:02}", "category": "socks", "price": 1}
+                for product_id in range(1, SUGGEST_MAX_LIMIT + 2)]
+    products_service = ProductsService(*make_catalog(products, [{"id": 1, "name": "socks"}]))
+
+    assert len(products_service.suggest("so")) == SUGGEST_DEFAULT_LIMIT
+    assert len(products_service.suggest("so", SUGGEST_MAX_LIMIT)) == SUGGEST_MAX_LIMIT
+    for limit in (0, SUGGEST_MAX_LIMIT + 1):
+        with pytest.raises(BadRequest):
+            products_service.suggest("so", limit)
+    with pytest.raises(BadRequest):
+        products_service.suggest("  ")
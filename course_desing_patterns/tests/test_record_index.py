@@ -0,0 +1,65 @@
+import random
+
+from src.repositories.record_index import PREFIX_END, SortedRecordIndex
+
+
+def expected_range(records, low=None, high=None):
+    return [record for record in sorted(records, key=lambda record: record["price"])
+            if (low is None or record["price"] >= low) and (high is None or record["price"] <= high)]
+
+
+def test_sorted_index_matches_a_sorted_list_through_writes():
+    rng = random.Random(7)
+    records = [{"id": record_id, "price": rng.randint(0, 50)} for record_id in range(300)]
+    index = SortedRecordIndex(lambda record: record["price"], block_size=4)
+    index.rebuild(records)
+
+    for record_id in range(300, 1500):
+        if records and rng.random() < 0.45:
+            record = records.pop(rng.randrange(len(records)))
+            index.remove(record)
+        else:
+            record = {"id": record_id, "price": rng.randint(0, 50)}
+            records.append(record)
+            index.add(record)
+
+        low, high = sorted(rng.sample(range(-5, 56), 2))
+        assert index.range(low, high) == expected_range(records, low, high)
+
+    assert len(index) == len(records)
+    assert index.range() == expected_range(records)
+    assert index.range(10, None, limit=7) == expected_range(records, 10)[:7]
+    assert index.find(20) == expected_range(records, 20, 20)
+    assert (51 in index) is False
+
+
+def test_sorted_index_skips_records_without_a_value():
+    index = SortedRecordIndex(lambda record: record.get("price"))
+    index.rebuild([{"id": 1}, {"id": 2, "price": 3}])
+    index.add({"id": 3})
+
+    assert index.range() == [{"id": 2, "price": 3}]
+    assert len(index) == 1
+
+
+def test_range_limit_stops_within_and_across_blocks():
+    records = [{"id": record_id, "price": record_id // 3} for record_id in range(60)]
+    index = SortedRecordIndex(lambda record: record["price"], block_size=4)
+    index.rebuild(records)
+
+    for low, limit in [(None, 1), (0, 5), (4, 8), (7, 30), (19, 10), (25, 3)]:
+        assert index.range(low, None, limit) == expected_range(records, low)[:limit]
+    assert index.range(2, 5, limit=100) == expected_range(records, 2, 5)
+    assert index.range(2, 5, limit=4) == expected_range(records, 2, 5)[:4]
+
+
+def test_prefix_ranges_match_lowercased_names_in_alphabetical_order():
+    names = ["Shirt", "shoes", "SHORTS", "Sharp knife", "Hat", "sh", "Si", "Sg"]
+    records = [{"id": record_id, "name": name} for record_id, name in enumerate(names)]
+    index = SortedRecordIndex(lambda record: record["name"].lower())
+    index.rebuild(records)
+
+    matches = index.range("sh", "sh" + PREFIX_END)
+
+    assert [record["name"] for record in matches] == ["sh", "Sharp knife", "Shirt", "shoes", "SHORTS"]
+    assert index.range("sh", "sh" + PREFIX_END, limit=2) == matches[:2]
@@ -0,0 +1,69 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.enums.durability import Durability
+from src.models.refresh_token import RefreshToken
+from src.repositories.refresh_tokens_repository import RefreshTokensRepository
+from src.repositories.session import DatabaseConnection
+from src.repositories.sqlite_refresh_tokens_repository import SQLiteRefreshTokensRepository
+from src.repositories.sqlite_session import SQLiteDatabaseConnection
+
+
+@pytest.fixture
+def json_repository(tmp_path):
+    json_file_path = tmp_path / "db.json"
+    json_file_path.write_text(json.dumps({"refresh_tokens": []}))
+    DatabaseConnection._instance = None
+    database = DatabaseConnection(str(json_file_path), durability=Durability.ASYNC)
+    database.connect()
+    yield RefreshTokensRepository(database)
+    database.close()
+    DatabaseConnection._instance = None
+
+
+@pytest.fixture
+def sqlite_repository(tmp_path):
+    SQLiteDatabaseConnection._instance = None
+    database = SQLiteDatabaseConnection(str(tmp_path / "db.sqlite3"))
+    database.connect()
+    yield SQLiteRefreshTokensRepository(database)
+    database.close()
+    SQLiteDatabaseConnection._instance = None
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def repository(request):
+    return request.getfixturevalue(f"{request.param}_repository")
+
+
+def make_token(number, expires_at):
+    return (RefreshToken()
+        .set_token_hash(f"hash-{number}")
+        .set_user_id(number % 3 + 1)
+        .set_expires_at(expires_at)
+        .set_created_at(datetime.utcnow()))
+
+
+def test_adding_a_token_purges_expired_ones(repository):
+    now = datetime.utcnow()
+    expired_count = 20
+    for number in range(expired_count):
+        repository.add_one(make_token(number, now - timedelta(minutes=number + 1)))
+
+    repository.add_one(make_token(expired_count, now + timedelta(days=1)))
+
+    remaining = [number for number in range(expired_count)
+                 if repository.get_by_token_hash(f"hash-{number}") is not None]
+    assert remaining == []
+    assert repository.get_by_token_hash(f"hash-{expired_count}") is not None
+
+
+def test_valid_tokens_are_not_purged(repository):
+    expires_at = datetime.utcnow() + timedelta(days=1)
+    for number in range(10):
+        repository.add_one(make_token(number, expires_at))
+
+    assert all(repository.get_by_token_hash(f"hash-{number}") is not None for number in range(10))
+    assert repository.delete_by_user(1) == 4
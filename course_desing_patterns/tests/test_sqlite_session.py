@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+from src.repositories.sqlite_session import SQLiteDatabaseConnection
+
+
+@pytest.fixture
+def database(tmp_path):
+    SQLiteDatabaseConnection._instance = None
+    database = SQLiteDatabaseConnection(str(tmp_path / "db.sqlite3"), pool_size=2)
+    database.connect()
+    yield database
+    database.close()
+    SQLiteDatabaseConnection._instance = None
+
+
+def use_database_at_once(database, thread_count):
+    """Runs thread_count threads that all hold a connection at the same time, and returns the connections."""
+    barrier = threading.Barrier(thread_count, timeout=5)
+    connections = []
+
+    def use_database():
+        connection = database.connection
+        connection.execute("SELECT 1 FROM products").fetchall()
+        barrier.wait()
+        connections.append((connection, len(database._connections)))
+        barrier.wait()
+        database.release()
+
+    threads = [threading.Thread(target=use_database) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return connections
+
+
+def test_released_connections_are_reused_up_to_the_pool_size(database):
+    used = [use_database_at_once(database, database.pool_size) for _ in range(3)]
+
+    assert {id(connection) for round_used in used for connection, _ in round_used} \
+        == {id(connection) for connection, _ in used[0]}
+    assert max(open_count for round_used in used for _, open_count in round_used) == database.pool_size
+    assert len(database._connections) == database.pool_size
+
+
+def test_connections_beyond_the_pool_size_are_closed_on_release(database):
+    used = use_database_at_once(database, database.pool_size + 3)
+
+    assert max(open_count for _, open_count in used) == database.pool_size + 3
+    assert len(database._connections) == database.pool_size
+
+
+def test_release_rolls_back_an_unfinished_transaction(database):
+    connection = database.connection
+    connection.execute("BEGIN IMMEDIATE")
+    connection.execute("INSERT INTO categories (id, name) VALUES (1, 'women')")
+    database.release()
+
+    assert database.connection.execute("SELECT COUNT(*) FROM categories").fetchone()[0] == 0
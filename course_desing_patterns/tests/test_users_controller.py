@@ -0,0 +1,52 @@
+import pytest
+from flask import Flask
+from werkzeug.exceptions import Unauthorized
+
+from src.controllers import users_controller
+from src.controllers.users_controller import set_users_service, users_bp
+
+STATS = {"capacity": 1024, "count": 3}
+
+
+class StubUsersService:
+    def get_email_filter_stats(self):
+        return STATS
+
+
+class StubAuthService:
+    users = {"admin-token": {"id": 1, "role": "admin"}, "customer-token": {"id": 2, "role": "customer"}}
+
+    def validate_token(self, token):
+        if token not in self.users:
+            raise Unauthorized("Invalid token")
+        return self.users[token]
+
+
+@pytest.fixture
+def client():
+    previous = users_controller.users_service, users_controller.auth_service
+    set_users_service(StubUsersService(), StubAuthService())
+    app = Flask(__name__)
+    app.register_blueprint(users_bp, url_prefix="/users")
+    yield app.test_client()
+    set_users_service(*previous)
+
+
+@pytest.mark.parametrize("headers, status", [
+    ({}, 401),
+    ({"Authorization": "admin-token"}, 401),
+    ({"Authorization": "Bearer unknown-token"}, 401),
+    ({"Authorization": "Bearer customer-token"}, 403),
+])
+def test_email_filter_stats_require_an_admin_token(client, headers, status):
+    response = client.get("/users/email-filter-stats", headers=headers)
+
+    assert response.status_code == status
+    assert "capacity" not in response.get_json()
+
+
+def test_email_filter_stats_are_served_to_admins(client):
+    response = client.get("/users/email-filter-stats", headers={"Authorization": "Bearer admin-token"})
+
+    assert response.status_code == 200
+    assert response.get_json() == STATS